@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.forms import UserChangeForm, UserCreationForm
 from django.utils.translation import gettext_lazy as _
-from .models import User
+from .models import User, QRCodeJob
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -132,4 +132,12 @@ def make_inactive(modeladmin, request, queryset):
 
 
 # 액션을 UserAdmin에 추가
-UserAdmin.actions = [make_verified, make_unverified, make_active, make_inactive] 
\ No newline at end of file
+UserAdmin.actions = [make_verified, make_unverified, make_active, make_inactive] 
+
+@admin.register(QRCodeJob)
+class QRCodeJobAdmin(admin.ModelAdmin):
+    """QR 코드 생성 작업 관리자 페이지 설정"""
+    list_display = ('user', 'status', 'attempts', 'created_at', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('user__phone', 'user__nickname')
+    raw_id_fields = ('user',)
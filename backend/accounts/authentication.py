@@ -0,0 +1,73 @@
+"""
+JWT 인증 클래스
+
+기본 JWTAuthentication은 요청마다 사용자 행을 조회합니다.
+CachedJWTAuthentication은 조회한 사용자를 프로세스 내 TTL 캐시에 보관하고
+(사용자 저장/삭제 시 accounts.signals에서 무효화),
+token_claims_user = True로 표시된 뷰의 읽기 요청에서는 DB 조회 없이 토큰 클레임만으로 사용자를 구성합니다.
+"""
+import copy
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from accounts.cache import TTLCache
+
+# 인증 사용자 캐시 (사용자 ID -> User)
+user_cache = TTLCache(
+    maxsize=getattr(settings, 'JWT_USER_CACHE_SIZE', 4096),
+    ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 30),
+    name='jwt_user',
+)
+
+
+def invalidate_cached_user(user_id):
+    """캐시된 인증 사용자를 제거합니다."""
+    user_cache.delete(user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    사용자 조회 결과를 캐시하는 JWT 인증 클래스
+
+    - 캐시 적중 시 사용자 조회 쿼리 없이 인증합니다.
+    - 뷰에 token_claims_user = True가 설정되어 있고 읽기 요청(GET/HEAD/OPTIONS)이면
+      DB/캐시 대신 토큰 클레임 기반의 TokenUser를 사용합니다.
+    """
+
+    def authenticate(self, request):
+        self._request = request
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        request = getattr(self, '_request', None)
+        if request is not None and self._uses_token_claims(request):
+            if api_settings.USER_ID_CLAIM not in validated_token:
+                raise InvalidToken(_("Token contained no recognizable user identification"))
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, user)
+        elif api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # 요청마다 별도 인스턴스를 사용하여 뷰에서 속성을 바꿔도 캐시에 영향이 없도록 함
+        return copy.copy(user)
+
+    @staticmethod
+    def _uses_token_claims(request):
+        if request.method not in SAFE_METHODS:
+            return False
+        view = (getattr(request, 'parser_context', None) or {}).get('view')
+        return bool(getattr(view, 'token_claims_user', False))
@@ -0,0 +1,66 @@
+"""
+프로세스 내 캐시 유틸리티
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from asl_holdem.metrics import CACHE_ENTRIES, CACHE_REQUESTS
+
+
+class TTLCache:
+    """
+    스레드 안전 LRU 캐시 (항목별 유효 시간 포함)
+    프로세스(gunicorn 작업자)마다 따로 유지되므로 짧은 TTL로 사용합니다.
+    name을 지정하면 조회 적중/실패와 항목 수를 메트릭(asl_cache_*)에 기록합니다.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, name=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        value = self._get(key)
+        if self.name is not None:
+            CACHE_REQUESTS.inc(cache=self.name, result='miss' if value is None else 'hit')
+        return value
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        self._record_size()
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+        self._record_size()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+        self._record_size()
+
+    def _record_size(self):
+        if self.name is not None:
+            CACHE_ENTRIES.set(len(self._data), cache=self.name)
+
+    def __len__(self):
+        return len(self._data)
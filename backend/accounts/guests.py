@@ -0,0 +1,90 @@
+"""
+게스트 사용자 생성 유틸리티
+
+게스트 번호는 GuestSequence(카운터 행 하나)에서 발급하고,
+전화번호/이메일/기본 닉네임을 번호로부터 만들어 중복 확인 쿼리 없이 한 번의 INSERT로 생성합니다.
+번호 발급 시 잠근 카운터 행은 커밋까지 유지되므로, 지정한 닉네임의 중복 확인(쿼리 1회)과 INSERT는
+동시에 생성되는 게스트끼리 겹치지 않습니다.
+"""
+import re
+import secrets
+
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from accounts.models import GuestSequence, User
+
+# 게스트 임시 전화번호 접두어 (999-XXXX-XXXX)
+GUEST_PHONE_PREFIX = '999'
+
+# 기존 데이터와 전화번호가 겹칠 때 새 번호로 재시도하는 횟수
+MAX_ALLOCATION_ATTEMPTS = 5
+
+
+def guest_phone(number):
+    """게스트 번호로 임시 전화번호를 만듭니다."""
+    return f"{GUEST_PHONE_PREFIX}-{number // 10000 % 10000:04d}-{number % 10000:04d}"
+
+
+def unique_guest_nickname(nickname):
+    """
+    게스트 사용자 간에 겹치지 않는 닉네임을 반환합니다.
+    이미 사용 중이면 '닉네임_N' 중 비어 있는 가장 작은 N을 한 번의 쿼리로 찾습니다.
+    (닉네임 자체와 '닉네임_<숫자>' 형태만 조회)
+    """
+    suffix_pattern = rf'^{re.escape(nickname)}_[0-9]+$'
+    taken = set(
+        User.objects.filter(role='GUEST')
+        .filter(Q(nickname=nickname) | Q(nickname__regex=suffix_pattern))
+        .values_list('nickname', flat=True)
+    )
+    if nickname not in taken:
+        return nickname
+
+    start = len(nickname) + 1
+    used = {int(name[start:]) for name in taken if name != nickname}
+    counter = 1
+    while counter in used:
+        counter += 1
+    return f"{nickname}_{counter}"
+
+
+def create_guest(nickname='', memo=''):
+    """
+    게스트 사용자를 생성합니다.
+
+    Returns:
+        tuple: (생성된 User, 임시 비밀번호)
+    """
+    temp_password = f"guest{secrets.randbelow(10 ** 8):08d}"
+    # 비밀번호 해싱은 카운터 행 잠금 밖에서 한 번만 수행
+    password = make_password(temp_password)
+
+    with transaction.atomic():
+        for _ in range(MAX_ALLOCATION_ATTEMPTS):
+            number = GuestSequence.next_value()
+            phone = guest_phone(number)
+
+            # 비밀번호를 먼저 설정하여 INSERT 한 번으로 저장
+            guest_user = User(
+                username=phone,  # phone 번호를 username으로 사용하여 unique constraint 해결
+                phone=phone,
+                password=password,
+                nickname=unique_guest_nickname(nickname) if nickname else f"게스트_{number:05d}",
+                email=f"guest_{number}@guest.temp",
+                role='GUEST',
+                is_active=True,
+                is_verified=True,  # 게스트는 즉시 사용 가능
+                first_name=memo if memo else '게스트',  # 메모를 first_name에 임시 저장
+            )
+
+            try:
+                with transaction.atomic():
+                    guest_user.save()
+                return guest_user, temp_password
+            except IntegrityError:
+                # 이전 방식으로 만든 게스트 전화번호와 겹치는 경우 다음 번호로 재시도
+                continue
+
+    raise IntegrityError('게스트 전화번호를 발급하지 못했습니다.')
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from accounts.models import User
+from accounts.phone import normalize_phone
+
+
+class Command(BaseCommand):
+    help = '기존 사용자들의 정규화 전화번호(phone_digits)를 일괄 채웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='한 번에 조회하고 bulk_update 할 사용자 수 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = max(1, options['chunk_size'])
+        cursor = 0
+        updated_count = 0
+        
+        self.stdout.write(self.style.SUCCESS('정규화 전화번호 채우기 작업을 시작합니다...'))
+        
+        while True:
+            chunk = list(User.objects.filter(id__gt=cursor).order_by('id').only('id', 'phone', 'phone_digits')[:chunk_size])
+            if not chunk:
+                break
+            cursor = chunk[-1].id
+            
+            changed = []
+            for user in chunk:
+                digits = normalize_phone(user.phone)
+                if user.phone_digits != digits:
+                    user.phone_digits = digits
+                    changed.append(user)
+            
+            User.objects.bulk_update(changed, ['phone_digits'])
+            updated_count += len(changed)
+            self.stdout.write(f'마지막 ID: {cursor}, 누적 업데이트: {updated_count}명')
+        
+        self.stdout.write(self.style.SUCCESS(f'작업 완료! {updated_count}명의 사용자 업데이트됨'))
+        
+        # 형식만 다른 중복 전화번호 안내
+        duplicates = (
+            User.objects.exclude(phone_digits='')
+            .values('phone_digits')
+            .annotate(count=Count('id'))
+            .filter(count__gt=1)
+        )
+        for row in duplicates:
+            self.stdout.write(self.style.WARNING(f"중복 전화번호: {row['phone_digits']} ({row['count']}명)"))
@@ -0,0 +1,70 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import User
+from views.user_views import UserViewSet
+
+
+class Command(BaseCommand):
+    help = '게스트 사용자를 동시에 생성하여 처리량을 측정합니다. (생성한 게스트는 삭제됩니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=1000, help='생성할 게스트 수 (기본값: 1000)')
+        parser.add_argument('--threads', type=int, default=8, help='동시 요청 스레드 수 (기본값: 8)')
+        parser.add_argument('--nickname', default='', help='모든 요청에 사용할 닉네임 (중복 닉네임 처리 측정용)')
+        parser.add_argument(
+            '--fast-hasher',
+            action='store_true',
+            help='MD5 해셔를 사용하여 비밀번호 해싱 비용을 제외하고 측정합니다.',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        hashers = ['django.contrib.auth.hashers.MD5PasswordHasher'] if options['fast_hasher'] else None
+
+        if hashers:
+            with override_settings(PASSWORD_HASHERS=hashers):
+                created_ids, errors, elapsed = self._run(count, options['threads'], options['nickname'])
+        else:
+            created_ids, errors, elapsed = self._run(count, options['threads'], options['nickname'])
+
+        phones = User.objects.filter(id__in=created_ids).values_list('phone', flat=True)
+        duplicates = len(created_ids) - len(set(phones))
+
+        self.stdout.write(
+            f'생성 {len(created_ids)}명 / 실패 {len(errors)}건 / 중복 전화번호 {duplicates}건 - '
+            f'{elapsed:.2f}초 ({len(created_ids) / elapsed:,.1f}명/초)'
+        )
+        for error in errors[:5]:
+            self.stdout.write(self.style.ERROR(f'✗ {error}'))
+
+        User.objects.filter(id__in=created_ids).delete()
+        self.stdout.write(self.style.SUCCESS('생성한 게스트 사용자를 삭제했습니다.'))
+
+    def _run(self, count, threads, nickname):
+        factory = APIRequestFactory()
+        view = UserViewSet.as_view({'post': 'create_guest_user'})
+
+        def create(_):
+            try:
+                response = view(factory.post('/', {'nickname': nickname}, format='json'))
+                if response.status_code != 201:
+                    return None, response.data.get('error')
+                return response.data['guest_user']['id'], None
+            finally:
+                # 스레드별 DB 연결 정리
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            results = list(executor.map(create, range(count)))
+        elapsed = time.perf_counter() - started
+
+        created_ids = [user_id for user_id, error in results if user_id]
+        errors = [error for user_id, error in results if error]
+        return created_ids, errors, elapsed
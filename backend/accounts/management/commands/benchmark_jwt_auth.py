@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.authentication import CachedJWTAuthentication, user_cache
+from accounts.models import User
+
+
+class _Rollback(Exception):
+    """벤치마크 데이터 롤백용 예외"""
+
+
+def _make_view(authentication_class, claims=False):
+    class BenchmarkView(APIView):
+        authentication_classes = [authentication_class]
+        permission_classes = [IsAuthenticated]
+        token_claims_user = claims
+
+        def get(self, request):
+            return Response({'id': request.user.id})
+
+    return BenchmarkView.as_view()
+
+
+class Command(BaseCommand):
+    help = 'JWT 인증 방식별 요청당 쿼리 수와 처리 시간을 측정합니다. (데이터는 롤백됩니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='방식별 요청 수 (기본값: 2000)')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options['requests'])
+                raise _Rollback()
+        except _Rollback:
+            user_cache.clear()
+            self.stdout.write(self.style.SUCCESS('합성 데이터를 롤백했습니다.'))
+
+    def _run(self, count):
+        user = User.objects.create_user(username='benchmark_jwt', phone='000-0000-0001', password=None)
+        token = str(RefreshToken.for_user(user).access_token)
+        factory = APIRequestFactory()
+        user_cache.clear()
+
+        for label, view in (
+            ('JWTAuthentication (기존)', _make_view(JWTAuthentication)),
+            ('CachedJWTAuthentication', _make_view(CachedJWTAuthentication)),
+            ('CachedJWTAuthentication + 토큰 클레임', _make_view(CachedJWTAuthentication, claims=True)),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(count):
+                    response = view(factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+                    assert response.status_code == 200, response.status_code
+                elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'[{label}] 요청당 쿼리 {len(queries) / count:.3f}개, '
+                f'{elapsed * 1000 / count:.3f}ms/요청 ({count / elapsed:,.0f} 요청/초)'
+            )
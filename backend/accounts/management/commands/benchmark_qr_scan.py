@@ -0,0 +1,81 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import User
+from accounts.qr import get_scan_profile, parse_payload, profile_cache, qr_payload, uuid_matches
+
+
+class _Rollback(Exception):
+    """벤치마크 데이터 롤백용 예외"""
+
+
+class Command(BaseCommand):
+    help = 'QR 코드 스캔 검증 처리량(초당 스캔 수)을 측정합니다. (데이터는 롤백됩니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500, help='생성할 합성 사용자 수 (기본값: 500)')
+        parser.add_argument('--scans', type=int, default=20000, help='방식별 스캔 횟수 (기본값: 20000)')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        try:
+            with transaction.atomic():
+                users = self._create_users(options['users'])
+                self._run(users, options['scans'], rng)
+                raise _Rollback()
+        except _Rollback:
+            profile_cache.clear()
+            self.stdout.write(self.style.SUCCESS('합성 데이터를 롤백했습니다.'))
+
+    def _create_users(self, count):
+        User.objects.bulk_create([
+            User(username=f'benchmark_qr_{i}', phone=f'000-{i // 10000:04d}-{i % 10000:04d}', nickname=f'벤치마크{i}')
+            for i in range(count)
+        ], batch_size=1000)
+        users = list(User.objects.filter(username__startswith='benchmark_qr_').values_list('id', 'qr_code_uuid'))
+        self.stdout.write(f'합성 사용자 {len(users)}명 생성 완료')
+        return users
+
+    def _run(self, users, scans, rng):
+        picks = [rng.choice(users) for _ in range(scans)]
+        legacy_payloads = [f"user_id:{user_id},uuid:{qr_code_uuid}" for user_id, qr_code_uuid in picks]
+        compact_payloads = [qr_payload(user_id, qr_code_uuid) for user_id, qr_code_uuid in picks]
+
+        def legacy_scan(data):
+            # 기존 방식: 스캔마다 (id, qr_code_uuid)로 DB 조회
+            user_id, uuid_str = parse_payload(data)
+            return User.objects.get(id=user_id, qr_code_uuid=uuid_str)
+
+        def compact_scan(data):
+            # 압축 형식 + 사용자 정보 캐시
+            user_id, uuid_value = parse_payload(data)
+            profile = get_scan_profile(user_id)
+            if profile is None or not uuid_matches(profile[0], uuid_value):
+                raise ValueError('invalid')
+            return profile
+
+        profile_cache.clear()
+        for label, scan, payloads in (
+            ('기존 형식 + DB 조회', legacy_scan, legacy_payloads),
+            ('압축 형식 + 캐시', compact_scan, compact_payloads),
+        ):
+            started = time.perf_counter()
+            for data in payloads:
+                scan(data)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f'[{label}] {len(payloads) / elapsed:,.0f} 스캔/초 ({elapsed * 1000 / len(payloads):.3f}ms/스캔)')
+
+        # UUID가 한 글자만 달라도 거부되는지 확인
+        payload = compact_payloads[0]
+        forged = payload[:-1] + ('0' if payload[-1] != '0' else '1')
+        user_id, uuid_value = parse_payload(forged)
+        profile = get_scan_profile(user_id)
+        if profile is not None and uuid_matches(profile[0], uuid_value):
+            self.stdout.write(self.style.WARNING('위조된 페이로드가 검증을 통과했습니다.'))
+        else:
+            self.stdout.write('위조된 페이로드 거부 확인')
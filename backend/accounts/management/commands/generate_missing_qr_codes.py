@@ -1,6 +1,22 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
+from django.db.models import Q
+
 from accounts.models import User
-from django.db import transaction
+from accounts.qr import write_qr_file
+
+
+def _write_job(job):
+    """프로세스 풀 작업자에서 실행되는 QR 코드 파일 생성 작업"""
+    user_id, qr_code_uuid, old_name = job
+    try:
+        return user_id, write_qr_file(user_id, qr_code_uuid, default_storage, old_name), None
+    except Exception as e:
+        return user_id, None, str(e)
 
 
 class Command(BaseCommand):
@@ -17,76 +33,109 @@ class Command(BaseCommand):
             type=int,
             help='특정 사용자 ID만 처리합니다.',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='이미지 렌더링/파일 저장에 사용할 프로세스 수 (기본값: 1)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='한 번에 조회하고 bulk_update 할 사용자 수 (기본값: 500)',
+        )
+        parser.add_argument(
+            '--start-id',
+            type=int,
+            default=0,
+            help='이 ID보다 큰 사용자부터 처리합니다. (중단된 작업 재개용)',
+        )
 
     def handle(self, *args, **options):
         force = options['force']
         user_id = options.get('user_id')
+        workers = max(1, options['workers'])
+        chunk_size = max(1, options['chunk_size'])
         
-        self.stdout.write(self.style.SUCCESS('QR 코드 생성 작업을 시작합니다...'))
+        self.stdout.write(self.style.SUCCESS(f'QR 코드 생성 작업을 시작합니다... (workers={workers})'))
         
-        # 사용자 쿼리 설정
+        # 사용자 쿼리 설정 (--force가 없으면 --user-id를 지정해도 QR 코드가 없는 사용자만 처리)
+        users = User.objects.all()
         if user_id:
-            users = User.objects.filter(id=user_id)
+            users = users.filter(id=user_id)
             if not users.exists():
                 self.stdout.write(self.style.ERROR(f'사용자 ID {user_id}를 찾을 수 없습니다.'))
                 return
-        else:
-            if force:
-                users = User.objects.all()
-            else:
-                users = User.objects.filter(qr_code='')
+        if not force:
+            users = users.filter(Q(qr_code='') | Q(qr_code__isnull=True))
+            if user_id and not users.exists():
+                self.stdout.write(self.style.WARNING(
+                    f'사용자 ID {user_id}는 이미 QR 코드가 있습니다. 새로 생성하려면 --force를 사용하세요.'
+                ))
+                return
+        users = users.filter(id__gt=options['start_id'])
         
         total_users = users.count()
         self.stdout.write(f'처리할 사용자 수: {total_users}')
         
         success_count = 0
         error_count = 0
+        cursor = options['start_id']
+        started = time.monotonic()
         
-        for user in users:
-            try:
-                with transaction.atomic():
-                    # 기존 QR 코드가 있고 force가 아닌 경우 스킵
-                    if user.qr_code and not force:
-                        continue
-                    
-                    # 기존 QR 코드 제거 (force인 경우)
-                    if force and user.qr_code:
-                        user.qr_code.delete(save=False)
-                        user.qr_code = None
-                    
-                    # QR 코드 생성
-                    qr_code = user.generate_qr_code()
-                    
-                    if qr_code:
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f'✓ 사용자 {user.phone} (ID: {user.id}) QR 코드 생성 완료'
-                            )
-                        )
-                        success_count += 1
-                    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=django.setup) if workers > 1 else None
+        try:
+            while True:
+                # ID 커서 기반으로 다음 묶음 조회 (OFFSET 없이 재개 가능)
+                chunk = list(users.filter(id__gt=cursor).order_by('id').only('id', 'phone', 'qr_code', 'qr_code_uuid')[:chunk_size])
+                if not chunk:
+                    break
+                
+                # 기존 파일은 새 파일 저장 전에 삭제 (교체 시 고아 파일 방지)
+                jobs = [(user.id, user.qr_code_uuid, user.qr_code.name if user.qr_code else None) for user in chunk]
+                results = executor.map(_write_job, jobs) if executor else map(_write_job, jobs)
+                
+                users_by_id = {user.id: user for user in chunk}
+                updated = []
+                for result_user_id, name, error in results:
+                    user = users_by_id[result_user_id]
+                    if error:
                         self.stdout.write(
                             self.style.ERROR(
-                                f'✗ 사용자 {user.phone} (ID: {user.id}) QR 코드 생성 실패'
+                                f'✗ 사용자 {user.phone} (ID: {user.id}) 처리 중 오류: {error}'
                             )
                         )
                         error_count += 1
-                        
-            except Exception as e:
+                        continue
+                    user.qr_code = name
+                    updated.append(user)
+                
+                # 파일 경로는 묶음 단위로 한 번에 저장
+                User.objects.bulk_update(updated, ['qr_code'])
+                success_count += len(updated)
+                cursor = chunk[-1].id
+                
+                elapsed = time.monotonic() - started
+                done = success_count + error_count
                 self.stdout.write(
-                    self.style.ERROR(
-                        f'✗ 사용자 {user.phone} (ID: {user.id}) 처리 중 오류: {str(e)}'
-                    )
+                    f'진행: {done}/{total_users} ({done * 100 / max(total_users, 1):.1f}%) - '
+                    f'{done / max(elapsed, 1e-9):.1f}명/초, 마지막 ID: {cursor}'
                 )
-                error_count += 1
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(f'\n작업을 중단합니다. --start-id {cursor} 로 재개할 수 있습니다.'))
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
         
         self.stdout.write(self.style.SUCCESS(f'\n작업 완료!'))
         self.stdout.write(f'성공: {success_count}개')
         self.stdout.write(f'실패: {error_count}개')
+        self.stdout.write(f'소요 시간: {time.monotonic() - started:.1f}초')
         
         if error_count > 0:
             self.stdout.write(
                 self.style.WARNING(
                     '\n실패한 사용자들이 있습니다. 로그를 확인하여 문제를 해결해주세요.'
                 )
-            ) 
\ No newline at end of file
+            )
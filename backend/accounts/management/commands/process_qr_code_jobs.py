@@ -0,0 +1,65 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accounts.tasks import process_pending_jobs, requeue_stale_jobs
+
+
+class Command(BaseCommand):
+    help = '대기 중인 QR 코드 생성 작업을 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='작업이 없어도 종료하지 않고 계속 대기하며 처리합니다.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='대기 작업이 없을 때 다시 확인하기까지의 시간(초) (기본값: 2)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='한 번에 선점할 작업 수 (기본값: 100)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        if options['loop'] and not getattr(settings, 'QR_CODE_STORE_FILES', False):
+            # 파일 저장이 꺼져 있으면 새 작업이 등록되지 않으므로 남은 작업만 처리하고 종료
+            self.stdout.write(self.style.WARNING(
+                'QR_CODE_STORE_FILES가 꺼져 있어 --loop를 무시하고 남은 작업만 처리합니다.'
+            ))
+            options['loop'] = False
+        total_success = 0
+        total_error = 0
+
+        self.stdout.write(self.style.SUCCESS('QR 코드 생성 작업 처리를 시작합니다...'))
+
+        try:
+            while True:
+                requeued = requeue_stale_jobs()
+                if requeued:
+                    self.stdout.write(self.style.WARNING(f'멈춘 작업 {requeued}개를 다시 대기열에 등록했습니다.'))
+
+                success_count, error_count = process_pending_jobs(batch_size)
+                total_success += success_count
+                total_error += error_count
+                if success_count or error_count:
+                    self.stdout.write(f'처리 완료 - 성공: {success_count}개, 실패: {error_count}개')
+
+                if success_count + error_count >= batch_size:
+                    # 남은 작업이 있을 수 있으므로 바로 다음 묶음 처리
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('작업 처리를 중단합니다.'))
+
+        self.stdout.write(self.style.SUCCESS(f'총 성공: {total_success}개, 실패: {total_error}개'))
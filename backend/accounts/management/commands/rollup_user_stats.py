@@ -0,0 +1,43 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from accounts.stats import build_daily_rollup
+
+
+class Command(BaseCommand):
+    help = '사용자 일일 통계(UserDailyStats)를 집계합니다. (기본값: 어제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            help='집계할 날짜 (YYYY-MM-DD)',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='지정한 날짜(기본값: 어제)부터 과거로 집계할 일 수 (기본값: 1)',
+        )
+
+    def handle(self, *args, **options):
+        if options['date']:
+            try:
+                end_date = datetime.date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError('날짜는 YYYY-MM-DD 형식으로 입력해주세요.')
+        else:
+            end_date = timezone.localdate() - datetime.timedelta(days=1)
+
+        days = max(1, options['days'])
+        self.stdout.write(self.style.SUCCESS(f'사용자 일일 통계 집계를 시작합니다... ({days}일)'))
+
+        total_rows = 0
+        for offset in range(days):
+            day = end_date - datetime.timedelta(days=offset)
+            count = build_daily_rollup(day)
+            total_rows += count
+            self.stdout.write(f'{day}: {count}명')
+
+        self.stdout.write(self.style.SUCCESS(f'작업 완료! 총 {total_rows}행 저장됨'))
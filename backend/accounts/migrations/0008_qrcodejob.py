@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:13
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_alter_user_role'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QRCodeJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('PROCESSING', '처리중'), ('DONE', '완료'), ('FAILED', '실패')], default='PENDING', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='qr_code_job', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'QR 코드 생성 작업',
+                'verbose_name_plural': 'QR 코드 생성 작업들',
+                'db_table': 'qr_code_jobs',
+                'indexes': [models.Index(fields=['status', 'id'], name='qr_code_job_status_5f33c4_idx')],
+            },
+        ),
+    ]
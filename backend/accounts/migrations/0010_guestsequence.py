@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_user_phone_digits'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuestSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '게스트 번호 시퀀스',
+                'verbose_name_plural': '게스트 번호 시퀀스',
+                'db_table': 'guest_sequences',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_guestsequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='집계 날짜')),
+                ('tournaments_played', models.PositiveIntegerField(default=0, verbose_name='참가 토너먼트 수')),
+                ('tickets_granted', models.PositiveIntegerField(default=0, verbose_name='받은 좌석권 수')),
+                ('tickets_used', models.PositiveIntegerField(default=0, verbose_name='사용한 좌석권 수')),
+                ('amount_spent', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='금액 합계')),
+                ('last_participation', models.DateTimeField(blank=True, null=True, verbose_name='마지막 참가 시간')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '사용자 일일 통계',
+                'verbose_name_plural': '사용자 일일 통계들',
+                'db_table': 'user_daily_stats',
+                'indexes': [models.Index(fields=['date'], name='user_daily__date_7b3548_idx')],
+                'unique_together': {('user', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+from accounts.phone import normalize_phone
+
+CHUNK_SIZE = 1000
+
+
+def backfill_phone_digits(apps, schema_editor):
+    """기존 사용자의 phone_digits를 phone에서 채웁니다. (로그인/중복 확인이 phone_digits로 조회)"""
+    User = apps.get_model('accounts', 'User')
+    cursor = 0
+    while True:
+        chunk = list(User.objects.filter(id__gt=cursor).order_by('id').only('id', 'phone', 'phone_digits')[:CHUNK_SIZE])
+        if not chunk:
+            break
+        cursor = chunk[-1].id
+
+        changed = []
+        for user in chunk:
+            digits = normalize_phone(user.phone)
+            if user.phone_digits != digits:
+                user.phone_digits = digits
+                changed.append(user)
+        User.objects.bulk_update(changed, ['phone_digits'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_user_role_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_phone_digits, migrations.RunPython.noop),
+    ]
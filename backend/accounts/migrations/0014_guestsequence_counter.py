@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:15
+
+from django.db import migrations, models
+from django.db.models import Max
+
+COUNTER_ID = 1
+
+
+def collapse_to_counter(apps, schema_editor):
+    """발급 기록 행들을 마지막 번호를 담은 카운터 행 하나로 합칩니다."""
+    GuestSequence = apps.get_model('accounts', 'GuestSequence')
+    last_value = GuestSequence.objects.aggregate(last=Max('id'))['last'] or 0
+    GuestSequence.objects.all().delete()
+    GuestSequence.objects.create(id=COUNTER_ID, value=last_value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_backfill_phone_digits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guestsequence',
+            name='value',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(collapse_to_counter, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='guestsequence',
+            name='created_at',
+        ),
+    ]
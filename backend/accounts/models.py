@@ -1,11 +1,18 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
 from django.core.validators import RegexValidator
-import qrcode
 from io import BytesIO
 from django.core.files import File
+import logging
 import uuid
 
+from accounts.phone import normalize_phone
+from accounts.qr import qr_filename, qr_payload, render_qr
+
+logger = logging.getLogger(__name__)
+
 class User(AbstractUser):
     """
     사용자 모델 - Django의 기본 User 모델을 확장하여 추가 필드를 정의합니다.
@@ -32,6 +39,9 @@ class User(AbstractUser):
     # 사용자 전화번호 - 중복 방지를 위해 unique=True 설정
     phone = models.CharField(validators=[phone_regex], max_length=13,  unique=True, null=False, blank=False , default='010-0000-0000')
     
+    # 숫자만 남긴 정규화 전화번호 - 저장 시 phone에서 자동 계산되며 전화번호 조회/검색에 사용
+    phone_digits = models.CharField(max_length=20, blank=True, default='', db_index=True, editable=False)
+    
     # 사용자 포인트
     points = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     
@@ -84,6 +94,22 @@ class User(AbstractUser):
         db_table = 'users'               # 데이터베이스 테이블 이름
         verbose_name = '사용자'           # 관리자 페이지에서 표시될 단수 이름
         verbose_name_plural = '사용자들'   # 관리자 페이지에서 표시될 복수 이름
+        indexes = [
+            models.Index(fields=['role', 'id'], name='users_role_id_idx'),  # 역할별 사용자 목록 (ID 커서 순)
+        ]
+
+    # DB에서 불러온 시점의 역할 (역할 변경 감지용, accounts.signals 참고)
+    _loaded_role = None
+    
+    # 역할에 따라 함께 저장되는 권한 필드
+    ROLE_PERMISSION_FIELDS = ('is_staff', 'is_superuser', 'is_store_owner')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 불러올 때 역할 값을 기록해 두어 저장 시 추가 조회 없이 변경 여부를 판단합니다."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_role = instance.__dict__.get('role')
+        return instance
 
     def __str__(self):
         """사용자 객체를 문자열로 표현할 때 닉네임 또는 전화번호 반환"""
@@ -96,29 +122,11 @@ class User(AbstractUser):
         """
         if not self.qr_code:
             try:
-                # QR 코드에 포함할 데이터 생성
-                qr_data = f"user_id:{self.id},uuid:{self.qr_code_uuid}"
-                
-                # QR 코드 생성
-                qr = qrcode.QRCode(
-                    version=1,
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=10,
-                    border=4,
-                )
-                qr.add_data(qr_data)
-                qr.make(fit=True)
-                
-                # QR 코드 이미지 생성
-                img = qr.make_image(fill_color="black", back_color="white")
-                
-                # 이미지를 BytesIO로 변환
-                buffer = BytesIO()
-                img.save(buffer, format='PNG')
-                buffer.seek(0)  # 파일 포인터를 처음으로 되돌림
+                # QR 코드 이미지 생성 (렌더링 엔드포인트와 같은 결과)
+                buffer = BytesIO(render_qr(qr_payload(self.id, self.qr_code_uuid), 'png'))
                 
                 # 파일 이름 생성
-                filename = f'qr_code_{self.qr_code_uuid}.png'
+                filename = qr_filename(self.qr_code_uuid)
                 
                 # 이미지 파일 저장 (save=False로 무한 재귀 방지)
                 self.qr_code.save(filename, File(buffer), save=False)
@@ -127,7 +135,7 @@ class User(AbstractUser):
                 User.objects.filter(id=self.id).update(qr_code=self.qr_code)
                 
             except Exception as e:
-                print(f"QR 코드 생성 중 오류 발생: {str(e)}")
+                logger.exception("QR 코드 생성 중 오류 발생: %s", e)
                 # 오류 발생 시 None 반환
                 return None
                 
@@ -139,12 +147,162 @@ class User(AbstractUser):
         새로운 사용자가 생성될 때만 QR 코드를 생성합니다.
         """
         is_new = self._state.adding  # 새로운 객체인지 확인
+        
+        # 정규화 전화번호 동기화
+        self.phone_digits = normalize_phone(self.phone)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            extra_fields = []
+            if 'phone' in update_fields:
+                extra_fields.append('phone_digits')
+            if 'role' in update_fields:
+                # 역할 변경 시 pre_save 시그널에서 설정한 권한 필드도 함께 저장
+                extra_fields.extend(self.ROLE_PERMISSION_FIELDS)
+            kwargs['update_fields'] = list(dict.fromkeys(list(update_fields) + extra_fields))
+        
         super().save(*args, **kwargs)  # 기본 저장 동작 수행
+        self._loaded_role = self.role  # 저장된 역할을 새 기준값으로 기록
         
         # 새 사용자이고 QR 코드가 없는 경우에만 생성
-        if is_new and not self.qr_code:
+        # (QR_CODE_STORE_FILES가 꺼져 있으면 렌더링 엔드포인트만 사용하므로 파일을 만들지 않음)
+        if is_new and not self.qr_code and getattr(settings, 'QR_CODE_STORE_FILES', False):
             try:
-                self.generate_qr_code()  # QR 코드 생성
+                if getattr(settings, 'QR_CODE_ASYNC', True):
+                    # 이미지 생성은 백그라운드 작업자(process_qr_code_jobs)에게 위임
+                    QRCodeJob.enqueue(self)
+                else:
+                    self.generate_qr_code()  # QR 코드 즉시 생성
             except Exception as e:
-                print(f"새 사용자 QR 코드 생성 중 오류: {str(e)}")
-                # QR 코드 생성에 실패해도 사용자 생성은 계속 진행 
\ No newline at end of file
+                logger.exception("새 사용자 QR 코드 생성 중 오류: %s", e)
+                # QR 코드 생성에 실패해도 사용자 생성은 계속 진행
+
+
+class QRCodeJob(models.Model):
+    """
+    QR 코드 생성 작업 큐 모델
+    회원가입 요청에서 이미지 생성/파일 저장을 분리하기 위해
+    생성 작업을 DB에 기록하고 process_qr_code_jobs 명령이 처리합니다.
+    """
+    
+    # 작업 상태 선택 옵션
+    STATUS_CHOICES = (
+        ('PENDING', '대기'),        # 처리 대기 중
+        ('PROCESSING', '처리중'),   # 작업자가 처리 중
+        ('DONE', '완료'),           # QR 코드 생성 완료
+        ('FAILED', '실패'),         # 최대 재시도 횟수 초과
+    )
+    
+    # 최대 시도 횟수
+    MAX_ATTEMPTS = 3
+    
+    # QR 코드를 생성할 사용자
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='qr_code_job')
+    
+    # 작업 상태
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    
+    # 시도 횟수
+    attempts = models.PositiveIntegerField(default=0)
+    
+    # 마지막 오류 메시지
+    last_error = models.TextField(blank=True, default='')
+    
+    # 생성 시간
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    # 수정 시간
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'qr_code_jobs'
+        verbose_name = 'QR 코드 생성 작업'
+        verbose_name_plural = 'QR 코드 생성 작업들'
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.get_status_display()}"
+    
+    @classmethod
+    def enqueue(cls, user):
+        """사용자의 QR 코드 생성 작업을 대기열에 등록합니다."""
+        job, _ = cls.objects.update_or_create(
+            user=user,
+            defaults={'status': 'PENDING', 'attempts': 0, 'last_error': ''}
+        )
+        return job 
+
+class GuestSequence(models.Model):
+    """
+    게스트 사용자 번호 발급용 카운터 (행 하나)
+    번호를 발급할 때마다 카운터 행을 잠그고 값을 1 올리므로 테이블이 커지지 않으며,
+    동시에 여러 게스트를 생성해도 번호가 겹치지 않습니다.
+    """
+    
+    # 카운터 행 ID
+    COUNTER_ID = 1
+    
+    # 마지막으로 발급한 번호
+    value = models.BigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'guest_sequences'
+        verbose_name = '게스트 번호 시퀀스'
+        verbose_name_plural = '게스트 번호 시퀀스'
+    
+    @classmethod
+    def next_value(cls):
+        """
+        새 게스트 번호를 발급합니다.
+        UPDATE가 카운터 행을 잠그므로 트랜잭션이 끝날 때까지 다른 발급 요청은 기다렸다가 다음 값을 받습니다.
+        """
+        with transaction.atomic():
+            if not cls.objects.filter(pk=cls.COUNTER_ID).update(value=F('value') + 1):
+                # 카운터 행이 없는 경우 (마이그레이션 없이 만든 DB)
+                cls.objects.get_or_create(pk=cls.COUNTER_ID)
+                cls.objects.filter(pk=cls.COUNTER_ID).update(value=F('value') + 1)
+            return cls.objects.values_list('value', flat=True).get(pk=cls.COUNTER_ID)
+
+
+class UserDailyStats(models.Model):
+    """
+    사용자별 일일 활동 집계 테이블 (rollup_user_stats 명령으로 생성)
+    기간별 사용자 통계를 원본 참가/좌석권 테이블 대신 이 테이블에서 합산합니다.
+    """
+    
+    # 사용자
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='daily_stats')
+    
+    # 집계 날짜
+    date = models.DateField(verbose_name='집계 날짜')
+    
+    # 해당 날짜에 참가한 토너먼트 수 (취소 제외)
+    tournaments_played = models.PositiveIntegerField(default=0, verbose_name='참가 토너먼트 수')
+    
+    # 해당 날짜에 받은 좌석권 수
+    tickets_granted = models.PositiveIntegerField(default=0, verbose_name='받은 좌석권 수')
+    
+    # 해당 날짜에 사용한 좌석권 수
+    tickets_used = models.PositiveIntegerField(default=0, verbose_name='사용한 좌석권 수')
+    
+    # 해당 날짜에 받은 좌석권 금액 합계 (취소 제외)
+    amount_spent = models.DecimalField(max_digits=12, decimal_places=2, default=0, verbose_name='금액 합계')
+    
+    # 해당 날짜의 마지막 참가 시간
+    last_participation = models.DateTimeField(null=True, blank=True, verbose_name='마지막 참가 시간')
+    
+    # 집계 시간
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'user_daily_stats'
+        verbose_name = '사용자 일일 통계'
+        verbose_name_plural = '사용자 일일 통계들'
+        unique_together = ('user', 'date')
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.date}"
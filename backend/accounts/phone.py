@@ -0,0 +1,51 @@
+"""
+전화번호 정규화 유틸리티
+
+사용자 테이블의 phone 컬럼에는 '010-1234-5678'과 '01012345678' 형식이 섞여 있으므로,
+숫자만 남긴 정규화 값(User.phone_digits, 인덱스 컬럼)으로 조회합니다.
+"""
+import re
+
+_NON_DIGITS = re.compile(r'\D')
+
+
+def normalize_phone(phone):
+    """
+    전화번호에서 숫자만 남긴 정규화 값을 반환합니다.
+    국가번호(+82)로 시작하면 국내 형식(0으로 시작)으로 변환합니다.
+
+    예: '010-1234-5678', '010 1234 5678', '+82 10-1234-5678' -> '01012345678'
+    """
+    digits = _NON_DIGITS.sub('', phone or '')
+    if digits.startswith('82') and len(digits) in (11, 12):
+        digits = '0' + digits[2:]
+    return digits
+
+
+def is_mobile_phone(digits):
+    """정규화된 값이 010으로 시작하는 11자리 휴대폰 번호인지 확인합니다."""
+    return len(digits) == 11 and digits.startswith('010')
+
+
+def format_phone(phone):
+    """전화번호를 하이픈 포함 형식(010-1234-5678)으로 반환합니다."""
+    digits = normalize_phone(phone)
+    if len(digits) == 11:
+        return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
+    if len(digits) == 10:
+        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    return digits
+
+
+def find_user_by_phone(phone, queryset=None):
+    """
+    전화번호로 사용자를 조회합니다. (phone_digits 인덱스 단일 조회)
+    형식만 다른 중복 데이터가 있으면 먼저 가입한 사용자를 반환합니다.
+    """
+    from accounts.models import User
+
+    digits = normalize_phone(phone)
+    if not digits:
+        return None
+    queryset = User.objects.all() if queryset is None else queryset
+    return queryset.filter(phone_digits=digits).order_by('id').first()
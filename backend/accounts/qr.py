@@ -0,0 +1,184 @@
+"""
+사용자 QR 코드 렌더링/검증 유틸리티
+
+QR 코드 이미지는 사용자 ID와 qr_code_uuid만으로 항상 같은 결과가 나오므로
+파일로 저장하지 않고 요청 시점에 렌더링합니다.
+렌더링 결과는 프로세스 메모리의 LRU 캐시에 보관합니다.
+
+QR 코드에는 압축 페이로드(A2.<16진수 ID>.<UUID 32자리>)를 담습니다.
+렌더링 URL을 아는 사람은 누구나 같은 페이로드를 얻을 수 있으므로 서명은 두지 않고,
+스캔 시 저장된 qr_code_uuid 전체와 정확히 일치하는지 확인합니다.
+렌더링 요청도 같은 방식으로 저장된 qr_code_uuid와 일치할 때만 처리합니다.
+스캔 응답용 사용자 정보(qr_code_uuid 포함)는 짧은 TTL의 LRU 캐시에서 꺼내고, 캐시에 없을 때만 DB를 조회합니다.
+기존 형식(user_id:..,uuid:..)도 계속 읽을 수 있습니다.
+"""
+import hashlib
+import hmac
+from functools import lru_cache
+from io import BytesIO
+
+import qrcode
+import qrcode.image.svg
+from django.core.files.base import ContentFile
+
+from accounts.cache import TTLCache
+
+# 렌더링 옵션/페이로드 형식이 바뀌면 올려서 클라이언트/CDN 캐시를 무효화
+RENDER_VERSION = 3
+
+# 프로세스당 보관할 렌더링 결과 수
+RENDER_CACHE_SIZE = 2048
+
+# 포맷별 Content-Type
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+
+# 압축 페이로드 버전 접두어
+PAYLOAD_PREFIX = 'A2'
+
+# UUID 16진수 글자 수
+UUID_HEX_LENGTH = 32
+
+# 스캔 응답용 사용자 정보 캐시 크기 / 유효 시간(초)
+PROFILE_CACHE_SIZE = 4096
+PROFILE_CACHE_TTL = 60
+
+
+def _uuid_hex(qr_code_uuid):
+    return str(qr_code_uuid).replace('-', '').lower()
+
+
+def qr_payload(user_id, qr_code_uuid):
+    """QR 코드에 담을 압축 페이로드를 반환합니다."""
+    return f"{PAYLOAD_PREFIX}.{int(user_id):x}.{_uuid_hex(qr_code_uuid)}"
+
+
+def parse_payload(data):
+    """
+    QR 코드 데이터를 해석합니다. (형식만 확인하며 UUID 일치 여부는 uuid_matches로 확인)
+
+    Returns:
+        tuple: (사용자 ID, UUID)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    data = (data or '').strip()
+
+    if data.startswith(f'{PAYLOAD_PREFIX}.'):
+        parts = data.split('.')
+        if len(parts) != 3:
+            raise ValueError("Invalid QR code format")
+        _, user_id_hex, uuid_hex = parts
+        user_id = int(user_id_hex, 16)
+        if len(uuid_hex) != UUID_HEX_LENGTH:
+            raise ValueError("Invalid QR code format")
+        return user_id, uuid_hex
+
+    # 기존 형식: "user_id:13,uuid:abc123..."
+    user_id = None
+    uuid_str = None
+    for part in data.split(','):
+        if part.startswith('user_id:'):
+            user_id = int(part.split(':')[1])
+        elif part.startswith('uuid:'):
+            uuid_str = part.split(':')[1]
+    if not user_id or not uuid_str:
+        raise ValueError("Invalid QR code format")
+    return user_id, uuid_str
+
+
+def uuid_matches(qr_code_uuid, uuid_value):
+    """저장된 UUID 전체가 페이로드의 UUID와 정확히 일치하는지 확인합니다."""
+    return hmac.compare_digest(_uuid_hex(qr_code_uuid), _uuid_hex(uuid_value))
+
+
+profile_cache = TTLCache(maxsize=PROFILE_CACHE_SIZE, ttl=PROFILE_CACHE_TTL, name='qr_profile')
+
+
+def get_scan_profile(user_id):
+    """
+    스캔 응답에 사용할 (qr_code_uuid, 사용자 정보)를 반환합니다.
+    캐시에 없을 때만 DB를 조회하며, 사용자가 없으면 None을 반환합니다.
+    """
+    cached = profile_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    from accounts.models import User
+
+    user = User.objects.filter(id=user_id).only(
+        'id', 'phone', 'nickname', 'email', 'role', 'is_active', 'created_at', 'qr_code_uuid'
+    ).first()
+    if user is None:
+        return None
+
+    value = (user.qr_code_uuid, {
+        'id': user.id,
+        'phone': user.phone,
+        'nickname': user.nickname,
+        'email': user.email,
+        'role': user.role,
+        'is_active': user.is_active,
+        'created_at': user.created_at.isoformat(),
+    })
+    profile_cache.set(user_id, value)
+    return value
+
+
+def _build_qr(payload):
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+    return qr
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_qr(payload, fmt='png'):
+    """
+    QR 코드 이미지를 렌더링하여 bytes로 반환합니다.
+
+    Args:
+        payload (str): QR 코드에 담을 데이터
+        fmt (str): 'png' 또는 'svg'
+    """
+    if fmt not in CONTENT_TYPES:
+        raise ValueError(f"지원하지 않는 QR 코드 포맷입니다: {fmt}")
+
+    qr = _build_qr(payload)
+    buffer = BytesIO()
+    if fmt == 'svg':
+        qr.make_image(image_factory=qrcode.image.svg.SvgPathImage).save(buffer)
+    else:
+        qr.make_image(fill_color="black", back_color="white").save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def qr_etag(payload, fmt='png'):
+    """렌더링 결과를 식별하는 강한 ETag 값을 반환합니다. (이미지 렌더링 없이 계산)"""
+    digest = hashlib.sha256(f"{RENDER_VERSION}:{fmt}:{payload}".encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def qr_filename(qr_code_uuid):
+    """저장용 QR 코드 파일 이름을 반환합니다."""
+    return f'qr_code_{qr_code_uuid}.png'
+
+
+def write_qr_file(user_id, qr_code_uuid, storage, old_name=None):
+    """
+    QR 코드 PNG를 렌더링하여 스토리지에 저장하고 저장된 경로를 반환합니다.
+    DB는 갱신하지 않으므로 일괄 처리 시 호출 측에서 bulk_update 합니다.
+    """
+    if old_name:
+        storage.delete(old_name)
+    content = ContentFile(render_qr(qr_payload(user_id, qr_code_uuid), 'png'))
+    return storage.save(f'qr_codes/{qr_filename(qr_code_uuid)}', content)
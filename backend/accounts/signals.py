@@ -1,85 +1,67 @@
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 import logging
 
+from accounts.authentication import invalidate_cached_user
+from accounts.qr import profile_cache
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# 역할별 권한 필드 값 (is_staff, is_superuser, is_store_owner)
+ROLE_PERMISSIONS = {
+    'ADMIN': (True, True, False),
+    'STORE_OWNER': (True, False, True),
+}
+DEFAULT_PERMISSIONS = (False, False, False)  # USER, GUEST
+
+
+def apply_role_permissions(instance):
+    """역할에 맞는 권한 필드를 인스턴스에 설정합니다. (저장은 하지 않음)"""
+    instance.is_staff, instance.is_superuser, instance.is_store_owner = ROLE_PERMISSIONS.get(
+        instance.role, DEFAULT_PERMISSIONS
+    )
+
+
 @receiver(pre_save, sender=User)
 def sync_user_permissions_on_role_change(sender, instance, **kwargs):
     """
     사용자 역할이 변경될 때 권한을 자동으로 동기화합니다.
+    기존 역할은 from_db에서 기록한 값과 비교하므로 추가 조회가 없고,
+    권한 필드는 같은 저장(INSERT/UPDATE)에 함께 반영됩니다.
     """
-    # 새로 생성되는 경우는 제외
-    if instance.pk is None:
+    # 새로 생성되는 경우 역할에 맞는 권한으로 생성
+    if instance._state.adding:
+        apply_role_permissions(instance)
+        return
+    
+    # 역할을 불러오지 않은 인스턴스(only/defer)는 역할을 바꿀 수 없으므로 제외
+    if 'role' not in instance.__dict__ or instance._loaded_role is None:
         return
     
-    try:
-        # 기존 사용자 정보 가져오기
-        old_instance = User.objects.get(pk=instance.pk)
-        
-        # 역할이 변경되었는지 확인
-        if old_instance.role != instance.role:
-            logger.info(f"사용자 {instance.phone}의 역할이 {old_instance.role} → {instance.role}로 변경됨")
-            
-            # 역할에 따른 권한 설정
-            if instance.role == 'ADMIN':
-                instance.is_staff = True
-                instance.is_superuser = True
-                instance.is_store_owner = False
-                logger.info(f"관리자 권한 설정: {instance.phone}")
-                
-            elif instance.role == 'STORE_OWNER':
-                instance.is_staff = True
-                instance.is_superuser = False
-                instance.is_store_owner = True
-                logger.info(f"매장 관리자 권한 설정: {instance.phone}")
-                
-            else:  # USER, GUEST
-                instance.is_staff = False
-                instance.is_superuser = False
-                instance.is_store_owner = False
-                logger.info(f"일반 사용자 권한 설정: {instance.phone}")
-                
-    except User.DoesNotExist:
-        # 사용자가 존재하지 않는 경우 (새 생성 등)
-        pass
-    except Exception as e:
-        logger.error(f"사용자 권한 동기화 중 오류 발생: {e}")
+    # 역할이 변경되었는지 확인
+    if instance._loaded_role != instance.role:
+        logger.info("사용자 %s의 역할이 %s → %s로 변경됨", instance.phone, instance._loaded_role, instance.role)
+        apply_role_permissions(instance)
+        logger.info("%s 권한 설정: %s", instance.get_role_display(), instance.phone)
 
 @receiver(post_save, sender=User)
 def log_user_creation(sender, instance, created, **kwargs):
     """
     새 사용자가 생성될 때 로그를 남깁니다.
+    (권한 필드는 pre_save에서 이미 역할에 맞게 설정되어 저장됨)
     """
     if created:
-        logger.info(f"새 사용자 생성: {instance.phone} ({instance.get_role_display()})")
-        
-        # 새 사용자의 경우에도 역할에 맞는 권한 설정
-        if instance.role == 'ADMIN':
-            if not (instance.is_staff and instance.is_superuser):
-                User.objects.filter(pk=instance.pk).update(
-                    is_staff=True,
-                    is_superuser=True,
-                    is_store_owner=False
-                )
-                logger.info(f"새 관리자 권한 설정: {instance.phone}")
-                
-        elif instance.role == 'STORE_OWNER':
-            if not (instance.is_staff and instance.is_store_owner):
-                User.objects.filter(pk=instance.pk).update(
-                    is_staff=True,
-                    is_superuser=False,
-                    is_store_owner=True
-                )
-                logger.info(f"새 매장 관리자 권한 설정: {instance.phone}")
-                
-        else:  # USER, GUEST
-            if instance.is_staff or instance.is_superuser or instance.is_store_owner:
-                User.objects.filter(pk=instance.pk).update(
-                    is_staff=False,
-                    is_superuser=False,
-                    is_store_owner=False
-                )
-                logger.info(f"새 일반 사용자 권한 설정: {instance.phone}") 
\ No newline at end of file
+        logger.info("새 사용자 생성: %s (%s)", instance.phone, instance.get_role_display())
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_caches(sender, instance, **kwargs):
+    """
+    사용자 정보(역할 포함)가 바뀌면 인증 사용자 캐시와 QR 스캔용 사용자 정보 캐시에서 제거합니다.
+    (queryset.update()로 변경된 경우는 캐시 TTL 이후 반영)
+    """
+    invalidate_cached_user(instance.pk)
+    profile_cache.delete(instance.pk)
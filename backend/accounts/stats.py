@@ -0,0 +1,163 @@
+"""
+사용자 통계 집계
+
+통계는 요청한 페이지의 사용자 ID 목록에 대해서만 묶음(GROUP BY) 쿼리로 계산하므로
+전체 사용자 수와 관계없이 페이지당 쿼리 수와 처리 시간이 일정합니다.
+기간별 통계는 UserDailyStats 일일 집계 테이블(rollup_user_stats 명령)에서 합산할 수도 있습니다.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+
+from accounts.models import UserDailyStats
+from seats.models import SeatTicket
+from tournaments.models import TournamentPlayer
+
+
+def _empty_stats():
+    return {
+        'tournaments_count': 0,
+        'last_participation': None,
+        'tickets_held': 0,
+        'tickets_used': 0,
+        'tickets_total': 0,
+        'total_spent': Decimal('0'),
+    }
+
+
+def live_user_stats(user_ids, date_from=None, date_to=None):
+    """
+    참가/좌석권 원본 테이블에서 사용자별 통계를 계산합니다.
+
+    Args:
+        user_ids (list): 대상 사용자 ID 목록
+        date_from, date_to (date): 참가/좌석권 생성일 기준 기간 (선택)
+
+    Returns:
+        dict: {사용자 ID: 통계 dict}
+    """
+    stats = {user_id: _empty_stats() for user_id in user_ids}
+    if not user_ids:
+        return stats
+
+    players = TournamentPlayer.objects.filter(user_id__in=user_ids).exclude(status='CANCELLED')
+    tickets = SeatTicket.objects.filter(user_id__in=user_ids)
+    if date_from:
+        players = players.filter(created_at__date__gte=date_from)
+        tickets = tickets.filter(created_at__date__gte=date_from)
+    if date_to:
+        players = players.filter(created_at__date__lte=date_to)
+        tickets = tickets.filter(created_at__date__lte=date_to)
+
+    player_rows = players.values('user_id').annotate(
+        tournaments_count=Count('tournament_id', distinct=True),
+        last_participation=Max('created_at'),
+    ).order_by()
+    for row in player_rows:
+        stats[row['user_id']].update(
+            tournaments_count=row['tournaments_count'],
+            last_participation=row['last_participation'],
+        )
+
+    ticket_rows = tickets.values('user_id').annotate(
+        tickets_held=Count('id', filter=Q(status='ACTIVE')),
+        tickets_used=Count('id', filter=Q(status='USED')),
+        tickets_total=Count('id'),
+        total_spent=Sum('amount', filter=~Q(status='CANCELLED')),
+    ).order_by()
+    for row in ticket_rows:
+        stats[row['user_id']].update(
+            tickets_held=row['tickets_held'],
+            tickets_used=row['tickets_used'],
+            tickets_total=row['tickets_total'],
+            total_spent=row['total_spent'] or Decimal('0'),
+        )
+
+    return stats
+
+
+def rollup_user_stats(user_ids, date_from=None, date_to=None):
+    """
+    UserDailyStats 일일 집계 테이블에서 기간별 사용자 통계를 합산합니다.
+    (같은 토너먼트에 여러 날에 걸쳐 참가한 경우 참가 수는 날짜별로 합산됨)
+    """
+    stats = {
+        user_id: {
+            'tournaments_count': 0,
+            'last_participation': None,
+            'tickets_granted': 0,
+            'tickets_used': 0,
+            'total_spent': Decimal('0'),
+        }
+        for user_id in user_ids
+    }
+    if not user_ids:
+        return stats
+
+    rows = UserDailyStats.objects.filter(user_id__in=user_ids)
+    if date_from:
+        rows = rows.filter(date__gte=date_from)
+    if date_to:
+        rows = rows.filter(date__lte=date_to)
+
+    for row in rows.values('user_id').annotate(
+        tournaments_count=Sum('tournaments_played'),
+        last_participation=Max('last_participation'),
+        tickets_granted=Sum('tickets_granted'),
+        tickets_used=Sum('tickets_used'),
+        total_spent=Sum('amount_spent'),
+    ).order_by():
+        stats[row['user_id']].update(
+            tournaments_count=row['tournaments_count'] or 0,
+            last_participation=row['last_participation'],
+            tickets_granted=row['tickets_granted'] or 0,
+            tickets_used=row['tickets_used'] or 0,
+            total_spent=row['total_spent'] or Decimal('0'),
+        )
+
+    return stats
+
+
+def build_daily_rollup(day):
+    """
+    지정한 날짜의 사용자별 일일 통계를 다시 계산하여 저장합니다.
+
+    Returns:
+        int: 저장된 행 수
+    """
+    rows = {}
+
+    def row_for(user_id):
+        if user_id not in rows:
+            rows[user_id] = UserDailyStats(user_id=user_id, date=day)
+        return rows[user_id]
+
+    player_rows = TournamentPlayer.objects.filter(created_at__date=day).exclude(status='CANCELLED').values('user_id').annotate(
+        tournaments_played=Count('tournament_id', distinct=True),
+        last_participation=Max('created_at'),
+    ).order_by()
+    for row in player_rows:
+        daily = row_for(row['user_id'])
+        daily.tournaments_played = row['tournaments_played']
+        daily.last_participation = row['last_participation']
+
+    granted_rows = SeatTicket.objects.filter(created_at__date=day).values('user_id').annotate(
+        tickets_granted=Count('id'),
+        amount_spent=Sum('amount', filter=~Q(status='CANCELLED')),
+    ).order_by()
+    for row in granted_rows:
+        daily = row_for(row['user_id'])
+        daily.tickets_granted = row['tickets_granted']
+        daily.amount_spent = row['amount_spent'] or Decimal('0')
+
+    used_rows = SeatTicket.objects.filter(used_at__date=day, status='USED').values('user_id').annotate(
+        tickets_used=Count('id'),
+    ).order_by()
+    for row in used_rows:
+        row_for(row['user_id']).tickets_used = row['tickets_used']
+
+    with transaction.atomic():
+        UserDailyStats.objects.filter(date=day).delete()
+        UserDailyStats.objects.bulk_create(rows.values(), batch_size=1000)
+    return len(rows)
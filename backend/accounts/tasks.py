@@ -0,0 +1,86 @@
+"""
+QR 코드 생성 백그라운드 작업 처리
+
+QRCodeJob 테이블을 작업 큐로 사용합니다. 작업자는 대기(PENDING) 작업을
+select_for_update(skip_locked=True)로 선점하므로 여러 작업자를 동시에 실행해도
+같은 작업을 중복 처리하지 않습니다.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from accounts.models import QRCodeJob
+
+logger = logging.getLogger(__name__)
+
+# 처리중 상태로 이 시간 이상 머문 작업은 작업자가 중단된 것으로 간주
+STALE_AFTER = timedelta(minutes=10)
+
+
+def requeue_stale_jobs():
+    """작업자 중단 등으로 처리중 상태에 멈춘 작업을 다시 대기 상태로 되돌립니다."""
+    return QRCodeJob.objects.filter(
+        status='PROCESSING',
+        updated_at__lt=timezone.now() - STALE_AFTER,
+    ).update(status='PENDING', updated_at=timezone.now())
+
+
+def claim_jobs(batch_size):
+    """대기 중인 작업을 최대 batch_size개 선점하여 처리중 상태로 변경합니다."""
+    with transaction.atomic():
+        job_ids = list(
+            QRCodeJob.objects.select_for_update(skip_locked=True)
+            .filter(status='PENDING')
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if job_ids:
+            QRCodeJob.objects.filter(id__in=job_ids).update(
+                status='PROCESSING',
+                attempts=F('attempts') + 1,
+                updated_at=timezone.now(),
+            )
+    return list(QRCodeJob.objects.filter(id__in=job_ids).select_related('user').order_by('id'))
+
+
+def run_job(job):
+    """
+    선점한 작업 하나를 실행합니다.
+
+    Returns:
+        bool: QR 코드 생성 성공 여부
+    """
+    error = ''
+    try:
+        if job.user.generate_qr_code():
+            QRCodeJob.objects.filter(id=job.id).update(status='DONE', last_error='', updated_at=timezone.now())
+            return True
+        error = 'QR 코드 생성 결과가 없습니다.'
+    except Exception as e:
+        error = str(e)
+
+    # 최대 시도 횟수 전까지는 다시 대기열로
+    next_status = 'FAILED' if job.attempts >= QRCodeJob.MAX_ATTEMPTS else 'PENDING'
+    QRCodeJob.objects.filter(id=job.id).update(status=next_status, last_error=error, updated_at=timezone.now())
+    logger.warning("QR 코드 생성 작업 실패: 사용자 ID=%s, 시도=%s, 오류=%s", job.user_id, job.attempts, error)
+    return False
+
+
+def process_pending_jobs(batch_size=100):
+    """
+    대기 중인 QR 코드 생성 작업을 한 묶음 처리합니다.
+
+    Returns:
+        tuple: (성공 수, 실패 수)
+    """
+    success_count = 0
+    error_count = 0
+    for job in claim_jobs(batch_size):
+        if run_job(job):
+            success_count += 1
+        else:
+            error_count += 1
+    return success_count, error_count
@@ -0,0 +1,124 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.guests import create_guest, unique_guest_nickname
+from accounts.models import User
+from accounts.qr import profile_cache, render_qr
+
+
+class UniqueGuestNicknameTests(TestCase):
+    """지정한 닉네임이 사용 중일 때 비어 있는 가장 작은 번호를 한 번의 쿼리로 찾는지 확인"""
+
+    def create_guest_user(self, nickname, index):
+        return User.objects.create_user(
+            username=f'guest{index}', phone=f'999-0000-{index:04d}', password='password',
+            nickname=nickname, role='GUEST',
+        )
+
+    def test_free_nickname_is_returned_as_is(self):
+        self.assertEqual(unique_guest_nickname('워크인'), '워크인')
+
+    def test_smallest_free_suffix_with_single_query(self):
+        for index, nickname in enumerate(['워크인', '워크인_1', '워크인_3', '워크인_x', '워크인2_2']):
+            self.create_guest_user(nickname, index)
+
+        with CaptureQueriesContext(connection) as context:
+            nickname = unique_guest_nickname('워크인')
+
+        self.assertEqual(nickname, '워크인_2')
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_regex_characters_in_nickname(self):
+        self.create_guest_user('a.b', 0)
+        self.create_guest_user('axb_1', 1)
+
+        self.assertEqual(unique_guest_nickname('a.b'), 'a.b_1')
+
+
+class ConcurrentGuestCreationTests(TransactionTestCase):
+    """
+    여러 스레드에서 동시에 게스트를 만들어도 전화번호/닉네임이 겹치지 않는지 확인
+    (SQLite는 DB_TEST_NAME으로 파일 테스트 DB를 지정해야 실행)
+    """
+
+    THREADS = 8
+    GUESTS_PER_THREAD = 5
+
+    def setUp(self):
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest('메모리 SQLite 테스트 DB는 스레드 간에 공유되지 않습니다.')
+
+    def create_guests(self, nickname):
+        try:
+            return [create_guest(nickname)[0] for _ in range(self.GUESTS_PER_THREAD)]
+        finally:
+            connection.close()
+
+    def run_concurrently(self, nickname):
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            results = executor.map(self.create_guests, [nickname] * self.THREADS)
+            return [guest for guests in results for guest in guests]
+
+    def test_same_nickname(self):
+        guests = self.run_concurrently('워크인')
+        total = self.THREADS * self.GUESTS_PER_THREAD
+
+        self.assertEqual(len({guest.phone for guest in guests}), total)
+        self.assertEqual(len({guest.nickname for guest in guests}), total)
+        self.assertEqual(User.objects.filter(role='GUEST').values('nickname').distinct().count(), total)
+
+    def test_default_nickname(self):
+        guests = self.run_concurrently('')
+        total = self.THREADS * self.GUESTS_PER_THREAD
+
+        self.assertEqual(len({guest.phone for guest in guests}), total)
+        self.assertEqual(len({guest.nickname for guest in guests}), total)
+
+
+class QRCodeImageTests(TestCase):
+    """저장된 qr_code_uuid와 일치하는 URL만 렌더링하고, 나머지는 렌더링 없이 404를 반환하는지 확인"""
+
+    def setUp(self):
+        profile_cache.clear()
+        render_qr.cache_clear()
+        self.user = User.objects.create_user(username='user', phone='010-1111-2222', password='password', role='USER')
+
+    def url(self, user_id, qr_code_uuid, fmt='png'):
+        return f'/api/v1/user/qr/{user_id}/{qr_code_uuid}.{fmt}'
+
+    def test_matching_uuid_is_rendered(self):
+        response = self.client.get(self.url(self.user.id, self.user.qr_code_uuid))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        response = self.client.get(self.url(self.user.id, self.user.qr_code_uuid), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_pairs_return_404_without_rendering(self):
+        cached = render_qr.cache_info().currsize
+        for url in (
+            self.url(self.user.id, uuid.uuid4()),
+            self.url(self.user.id, uuid.uuid4(), 'svg'),
+            self.url(self.user.id + 1000, self.user.qr_code_uuid),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 404, url)
+            self.assertNotIn('Cache-Control', response)
+
+        self.assertEqual(render_qr.cache_info().currsize, cached)
+
+    def test_regenerated_uuid_invalidates_old_url(self):
+        old_url = self.url(self.user.id, self.user.qr_code_uuid)
+        self.assertEqual(self.client.get(old_url).status_code, 200)
+
+        self.user.qr_code_uuid = uuid.uuid4()
+        self.user.save()
+
+        self.assertEqual(self.client.get(old_url).status_code, 404)
+        self.assertEqual(self.client.get(self.url(self.user.id, self.user.qr_code_uuid)).status_code, 200)
@@ -0,0 +1,41 @@
+"""
+WebSocket 연결용 JWT 인증 미들웨어
+
+브라우저 WebSocket은 Authorization 헤더를 보낼 수 없으므로
+쿼리스트링의 access 토큰(?token=...)으로 사용자를 확인하여 scope['user']에 설정합니다.
+사용자 조회는 CachedJWTAuthentication과 같은 캐시를 사용합니다.
+"""
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+
+from accounts.authentication import CachedJWTAuthentication
+
+
+@database_sync_to_async
+def get_user_from_token(raw_token):
+    """access 토큰으로 사용자를 반환합니다. (유효하지 않으면 AnonymousUser)"""
+    if not raw_token:
+        return AnonymousUser()
+
+    authentication = CachedJWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return authentication.get_user(validated_token)
+    except (InvalidToken, AuthenticationFailed, TokenError):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """쿼리스트링의 JWT로 WebSocket 사용자를 인증하는 미들웨어"""
+
+    async def __call__(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        token = (query.get('token') or [None])[0]
+
+        scope = dict(scope)
+        scope['user'] = await get_user_from_token(token)
+        return await super().__call__(scope, receive, send)
@@ -0,0 +1,27 @@
+"""
+ASGI config for asl_holdem project.
+
+HTTP 요청은 Django가, WebSocket(ws/...)은 Channels 라우팅이 처리합니다.
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'asl_holdem.settings')
+
+# 앱 로딩(django.setup)이 끝난 뒤 컨슈머/미들웨어를 임포트해야 하므로 먼저 생성
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+
+from accounts.websocket import JWTAuthMiddleware  # noqa: E402
+from seats.routing import websocket_urlpatterns  # noqa: E402
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(
+        JWTAuthMiddleware(URLRouter(websocket_urlpatterns))
+    ),
+})
@@ -0,0 +1,16 @@
+"""
+ASGI 배포용 URL 설정 (ASYNC_READ_VIEWS=True일 때 ROOT_URLCONF로 사용)
+
+주요 조회 API를 async 뷰로 먼저 연결하고, 나머지는 asl_holdem.urls를 그대로 사용합니다.
+"""
+from django.urls import path
+
+from asl_holdem import urls
+from views import async_views
+
+urlpatterns = [
+    path('api/v1/banners/active/', async_views.active_banners, name='banner-active-async'),
+    path('api/v1/notices/', async_views.notice_list, name='notice-list-async'),
+    path('api/v1/tournaments/all_info/', async_views.tournament_all_info, name='tournament-all-info-async'),
+    path('api/v1/store/user-tickets/', async_views.user_ticket_status, name='get_user_ticket_status_async'),
+] + urls.urlpatterns
@@ -0,0 +1,33 @@
+"""
+벤치마크 명령(asl_holdem/management/commands/benchmark_*) 공통 측정 유틸리티
+
+측정값은 모두 밀리초(ms) 단위입니다.
+"""
+import statistics
+import time
+
+
+def measure_ms(func, repeat):
+    """func를 repeat번 실행하고 실행별 소요 시간(ms) 목록을 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(timings, p):
+    """측정값의 p(0~1) 백분위 값"""
+    ordered = sorted(timings)
+    return ordered[max(0, int(len(ordered) * p) - 1)]
+
+
+def summarize(timings, digits=2, percentiles=(0.95,)):
+    """'평균 / 중앙값 / p95' 형식의 요약 문자열을 반환합니다."""
+    parts = [
+        f'평균 {statistics.mean(timings):.{digits}f}ms',
+        f'중앙값 {statistics.median(timings):.{digits}f}ms',
+    ]
+    parts += [f'p{round(p * 100)} {percentile(timings, p):.{digits}f}ms' for p in percentiles]
+    return ' / '.join(parts)
@@ -0,0 +1,93 @@
+"""
+모델 버전 기반 캐시
+
+모델마다 버전 카운터를 캐시에 두고 각 앱의 저장/삭제 시그널(tournaments/stores/seats/notices.signals)에서 트랜잭션 커밋 후 증가시킵니다.
+cached_view는 의존하는 모델들의 현재 버전을 캐시 키에 포함하므로, 모델이 바뀌면 이전 캐시는
+더 이상 조회되지 않고 만료 시간(CACHES TIMEOUT)이 지나면 정리됩니다.
+
+- queryset.update()/bulk_create()는 시그널을 보내지 않으므로 호출한 쪽에서 bump_model_version()을 호출해야 합니다.
+- 버전 키가 만료/축출되면 현재 시각 기반의 새 값으로 다시 만들어 이전 버전과 겹치지 않게 합니다.
+"""
+import functools
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from rest_framework.response import Response
+
+from asl_holdem.metrics import CACHE_REQUESTS
+
+
+def _version_key(model):
+    return f'model-version:{model._meta.label_lower}'
+
+
+def _new_version():
+    return time.time_ns()
+
+
+def get_model_versions(*models):
+    """모델들의 현재 버전을 캐시 조회 한 번으로 가져옵니다. (없는 버전은 새로 생성)"""
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return tuple(versions[key] for key in keys)
+
+
+def bump_model_version(model):
+    """모델 버전을 증가시켜 해당 모델에 의존하는 캐시를 무효화합니다."""
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), timeout=None)
+
+
+def bump_model_version_on_commit(model):
+    """
+    트랜잭션 커밋 후 모델 버전을 증가시킵니다.
+    커밋 전에 증가시키면 다른 요청이 새 버전 키로 커밋 전 데이터를 캐시할 수 있습니다.
+    """
+    transaction.on_commit(lambda: bump_model_version(model))
+
+
+def cached_view(*models, timeout=DEFAULT_TIMEOUT, vary_on_user=False):
+    """
+    DRF 뷰 메서드의 응답 데이터를 models의 버전과 요청 파라미터를 키로 캐시하는 데코레이터
+
+    200 응답의 response.data만 캐시하며, 렌더링(콘텐츠 협상)은 매 요청마다 수행합니다.
+    응답이 사용자마다 다르면 vary_on_user=True로 사용자 ID를 키에 포함합니다.
+
+        @cached_view(Store, Banner, TournamentTicketDistribution)
+        def list(self, request): ...
+    """
+    def decorator(handler):
+        prefix = f'view:{handler.__module__}.{handler.__qualname__}'
+
+        @functools.wraps(handler)
+        def wrapped(view, request, *args, **kwargs):
+            raw = repr((
+                get_model_versions(*models),
+                request.get_host(),
+                sorted(request.GET.lists()),
+                sorted(kwargs.items()),
+                request.user.id if vary_on_user else None,
+            ))
+            key = f'{prefix}:{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}'
+
+            data = cache.get(key)
+            CACHE_REQUESTS.inc(cache='view', result='miss' if data is None else 'hit')
+            if data is not None:
+                return Response(data)
+
+            response = handler(view, request, *args, **kwargs)
+            if response.status_code == 200 and isinstance(response, Response):
+                cache.set(key, response.data, timeout=timeout)
+            return response
+        return wrapped
+    return decorator
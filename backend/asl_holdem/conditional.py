@@ -0,0 +1,120 @@
+"""
+목록 API 조건부 GET(ETag/Last-Modified) 지원
+
+응답에 포함될 행들을 집계 쿼리 한 번(행 수, 최종 수정 시각, ID 합계)으로 요약해 검증자를 만들고,
+클라이언트가 보낸 If-None-Match/If-Modified-Since와 일치하면 본 쿼리와 직렬화 없이 304를 반환합니다.
+
+- 추가/삭제는 행 수와 ID 합계로, 수정은 updated_at(auto_now)으로 감지합니다.
+  queryset.update()로 응답 필드를 바꾸는 코드는 updated_at도 함께 갱신해야 합니다.
+- 응답이 사용자마다 다를 수 있으므로 ETag에 사용자 ID와 응답 미디어 타입을 포함합니다.
+- Cache-Control: no-cache를 붙여 브라우저가 매번 검증 요청을 보내도록 합니다.
+"""
+import functools
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, Sum
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def aggregate_validators(queryset, updated_field='updated_at', **extra):
+    """쿼리셋의 행 수, 최종 수정 시각, ID 합계(+ 추가 집계)를 집계 쿼리 한 번으로 계산합니다."""
+    return queryset.order_by().aggregate(
+        count=Count('pk'),
+        id_sum=Sum('pk'),
+        last_modified=Max(updated_field),
+        **extra,
+    )
+
+
+def build_validators(request, aggregates):
+    """
+    집계 결과 목록으로 (ETag, Last-Modified timestamp)를 만듭니다.
+
+    Last-Modified는 집계 결과 중 가장 최근 수정 시각이며, 없으면 None입니다.
+    """
+    media_type = getattr(request, 'accepted_media_type', '')
+    key = repr((request.user.id, media_type, [sorted(item.items()) for item in aggregates]))
+    etag = quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+
+    modified = [item['last_modified'] for item in aggregates if item.get('last_modified')]
+    last_modified = int(max(modified).timestamp()) if modified else None
+    return etag, last_modified
+
+
+def conditional_response(request, aggregates, get_response):
+    """
+    검증자가 요청과 일치하면 304(또는 412)를, 아니면 get_response() 결과에 검증자 헤더를 붙여 반환합니다.
+    """
+    if not aggregates:
+        return get_response()
+
+    etag, last_modified = build_validators(request, aggregates)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = get_response()
+
+    if response.status_code in (200, 304):
+        response.headers['ETag'] = etag
+        if last_modified is not None:
+            response.headers['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ('Authorization',))
+    return response
+
+
+def conditional_get(get_aggregates):
+    """
+    뷰 메서드에 조건부 GET을 적용하는 데코레이터
+
+    get_aggregates(view, request)는 aggregate_validators() 결과 목록을 반환해야 합니다.
+
+        @conditional_get(lambda view, request: [aggregate_validators(Store.objects.all())])
+        def list(self, request): ...
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapped(view, request, *args, **kwargs):
+            return conditional_response(
+                request,
+                get_aggregates(view, request),
+                lambda: handler(view, request, *args, **kwargs),
+            )
+        return wrapped
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    GenericAPIView의 list/retrieve에 조건부 GET을 적용하는 믹스인
+
+    기본 검증자는 filter_queryset(get_queryset())(retrieve는 조회 대상 1건)의 집계이며,
+    응답에 다른 모델의 데이터가 포함되면 get_validator_aggregates()를 확장합니다.
+    """
+
+    def get_validator_aggregates(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if getattr(self, 'action', None) == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            except (TypeError, ValueError, ValidationError):
+                # 잘못된 조회 값은 검증자 없이 원래 뷰에서 404 처리
+                return []
+        return [aggregate_validators(queryset)]
+
+    def list(self, request, *args, **kwargs):
+        return conditional_response(
+            request,
+            self.get_validator_aggregates(),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_response(
+            request,
+            self.get_validator_aggregates(),
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
@@ -0,0 +1,69 @@
+"""
+읽기 전용 복제본(replica) DB 라우터
+
+- 안전한 읽기(GET/HEAD/OPTIONS 요청의 조회)는 replica로 보냅니다.
+- 쓰기와 transaction.atomic() 안의 조회는 항상 default(primary)를 사용합니다.
+- 쓰기 요청을 보낸 클라이언트는 REPLICA_PIN_SECONDS 동안 primary에서 읽습니다.
+  (복제 지연으로 방금 저장한 데이터가 보이지 않는 문제 방지, ReplicaPinMiddleware 참고)
+
+DATABASES에 'replica' 별칭이 없으면 모든 조회가 default로 갑니다.
+"""
+import contextvars
+import time
+
+from django.conf import settings
+from django.db import connections
+
+PRIMARY = 'default'
+REPLICA = 'replica'
+
+# primary 고정 만료 시각을 주고받는 쿠키/헤더 이름
+PIN_COOKIE_NAME = 'asl_db_pin'
+PIN_HEADER_NAME = 'X-DB-Pin'
+
+# 현재 요청(또는 작업)이 primary에서 읽어야 하는지 여부
+_use_primary = contextvars.ContextVar('use_primary', default=False)
+
+
+def pin_to_primary():
+    """현재 컨텍스트의 조회를 primary로 고정합니다. 복원용 토큰을 반환합니다."""
+    return _use_primary.set(True)
+
+
+def unpin(token):
+    """pin_to_primary()로 설정한 고정을 해제합니다."""
+    _use_primary.reset(token)
+
+
+def pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+def pinned_until(value):
+    """쿠키/헤더 값(만료 시각 epoch 초)이 아직 유효하면 True"""
+    try:
+        return float(value) > time.time()
+    except (TypeError, ValueError):
+        return False
+
+
+class PrimaryReplicaRouter:
+    """조회는 replica, 쓰기는 primary로 보내는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        if REPLICA not in settings.DATABASES or _use_primary.get():
+            return PRIMARY
+        # 트랜잭션 안에서는 방금 쓴 데이터를 읽을 수 있도록 primary 사용
+        if connections[PRIMARY].in_atomic_block:
+            return PRIMARY
+        return REPLICA
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary와 같은 데이터이므로 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
@@ -0,0 +1,173 @@
+"""
+요청별 실행 시간/DB 쿼리 계측
+
+RequestTimingMiddleware(asl_holdem.middleware)가 요청마다 QueryCollector를 활성화하면,
+모든 DB 연결에 설치된 execute_wrapper가 현재 요청의 수집기에 쿼리 수, DB 시간, 실행한 SQL을 기록합니다.
+수집기는 ContextVar로 전달하므로 async 뷰가 sync_to_async 스레드 풀에서 실행한 쿼리도 같은 요청에 집계됩니다.
+
+- SQL은 원문(파라미터 바인딩 전 템플릿)으로 세고, 반복 쿼리를 보고할 때만 형태(IN 목록 길이, 숫자/문자열 리터럴 제거)로 묶습니다.
+- 경로별 통계(route_stats)는 프로세스 메모리에만 집계되므로 gunicorn 워커마다 따로 쌓입니다.
+  워커 전체 합계는 같은 값을 기록하는 /metrics(asl_holdem.metrics)의 asl_http_* 메트릭으로 확인합니다.
+"""
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from asl_holdem import metrics
+
+_current_collector = ContextVar('query_collector', default=None)
+
+# SQL 형태 정규화
+_IN_LIST_RE = re.compile(r'\bIN \((?:%s, )*%s\)')
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_SPACE_RE = re.compile(r'\s+')
+
+
+def sql_shape(sql):
+    """IN 목록 길이와 리터럴 값만 다른 SQL을 같은 형태로 정규화합니다."""
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    sql = _LITERAL_RE.sub('?', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+class QueryCollector:
+    """한 요청에서 실행된 쿼리 수, DB 시간(초), SQL별 실행 횟수를 기록합니다."""
+
+    __slots__ = ('count', 'duration', 'statements')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    def repeated(self, limit=3):
+        """두 번 이상 실행된 SQL 형태를 실행 횟수 순으로 limit개 반환합니다. [(형태, 횟수), ...]"""
+        shapes = Counter()
+        for sql, count in self.statements.items():
+            shapes[sql_shape(sql)] += count
+        return [(shape, count) for shape, count in shapes.most_common(limit) if count > 1]
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    collector = _current_collector.get()
+    if collector is None:
+        return execute(sql, params, many, context)
+    return collector(execute, sql, params, many, context)
+
+
+def _install_wrapper(sender=None, connection=None, **kwargs):
+    # 재연결 시에도 시그널이 다시 오므로 한 번만 설치
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _execute_wrapper)
+
+
+# 이후 새로 연결되는 DB 연결(스레드별)과 이미 연결된 현재 스레드의 연결에 설치
+connection_created.connect(_install_wrapper, dispatch_uid='asl_holdem.instrumentation')
+for _connection in connections.all(initialized_only=True):
+    _install_wrapper(connection=_connection)
+
+
+def start_collecting():
+    """현재 컨텍스트에서 쿼리 수집을 시작하고 (수집기, 복원 토큰)을 반환합니다."""
+    collector = QueryCollector()
+    return collector, _current_collector.set(collector)
+
+
+def stop_collecting(token):
+    _current_collector.reset(token)
+
+
+class RouteStats:
+    """경로별 누적 통계"""
+
+    __slots__ = ('count', 'errors', 'total_ms', 'max_ms', 'db_ms', 'queries', 'max_queries')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.db_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+
+
+_route_stats = {}
+_route_stats_lock = threading.Lock()
+
+HTTP_REQUESTS = metrics.Counter(
+    'asl_http_requests_total', 'HTTP 요청 수', ('method', 'route', 'status'),
+)
+HTTP_REQUEST_DURATION = metrics.Histogram(
+    'asl_http_request_duration_seconds', 'HTTP 요청 처리 시간(초)', ('method', 'route'),
+)
+HTTP_REQUEST_QUERIES = metrics.Histogram(
+    'asl_http_request_db_queries', '요청당 DB 쿼리 수', ('method', 'route'),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+
+
+def route_pattern(request):
+    """요청이 매칭된 URL 패턴 (예: 'api/v1/tournaments/all_info/', 매칭 실패 시 '<unmatched>')"""
+    match = getattr(request, 'resolver_match', None)
+    # DRF 라우터 패턴의 끝 앵커($)는 제외
+    return match.route.removesuffix('$') if match is not None else '<unmatched>'
+
+
+def record_request(method, pattern, status_code, wall_ms, db_ms, queries):
+    """요청 1건을 경로별 통계와 메트릭에 기록합니다."""
+    HTTP_REQUESTS.inc(method=method, route=pattern, status=status_code)
+    HTTP_REQUEST_DURATION.observe(wall_ms / 1000, method=method, route=pattern)
+    HTTP_REQUEST_QUERIES.observe(queries, method=method, route=pattern)
+
+    route = f'{method} {pattern}'
+    with _route_stats_lock:
+        stats = _route_stats.get(route)
+        if stats is None:
+            stats = _route_stats[route] = RouteStats()
+        stats.count += 1
+        stats.errors += status_code >= 500
+        stats.total_ms += wall_ms
+        stats.max_ms = max(stats.max_ms, wall_ms)
+        stats.db_ms += db_ms
+        stats.queries += queries
+        stats.max_queries = max(stats.max_queries, queries)
+
+
+def route_stats():
+    """경로별 통계를 누적 시간이 큰 순서로 반환합니다."""
+    with _route_stats_lock:
+        rows = [
+            {
+                'route': route,
+                'count': stats.count,
+                'errors': stats.errors,
+                'avg_ms': round(stats.total_ms / stats.count, 1),
+                'max_ms': round(stats.max_ms, 1),
+                'avg_db_ms': round(stats.db_ms / stats.count, 1),
+                'avg_queries': round(stats.queries / stats.count, 1),
+                'max_queries': stats.max_queries,
+                'total_ms': round(stats.total_ms, 1),
+            }
+            for route, stats in _route_stats.items()
+        ]
+    return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+
+def reset_route_stats():
+    with _route_stats_lock:
+        _route_stats.clear()
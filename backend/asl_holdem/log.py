@@ -0,0 +1,112 @@
+"""
+로깅 핸들러/필터/포맷터
+
+- AsyncQueueHandler: 요청 스레드는 레코드를 큐에 넣기만 하고, 포맷팅과 출력은 QueueListener 스레드가 수행합니다.
+  큐가 가득 차면 요청을 막지 않고 레코드를 버립니다. (dropped에 개수 기록)
+- SamplingFilter: WARNING 미만 레코드를 지정한 비율만 통과시킵니다. WARNING 이상은 항상 통과합니다.
+- JSONFormatter: 레코드를 한 줄 JSON으로 출력합니다. (extra로 넘긴 필드 포함)
+
+gunicorn --preload처럼 설정 후 fork되는 경우 자식 프로세스에서 리스너 스레드를 새로 시작합니다.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+
+
+class AsyncQueueHandler(QueueHandler):
+    """레코드를 큐에 넣고 백그라운드 스레드에서 StreamHandler로 출력하는 핸들러"""
+
+    def __init__(self, queue_size=10000, stream=None):
+        self.queue_size = queue_size
+        self.target = logging.StreamHandler(stream)
+        self.dropped = 0
+        super().__init__(queue.Queue(queue_size))
+        self._start_listener()
+        atexit.register(self.close)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def _start_listener(self):
+        self.listener = QueueListener(self.queue, self.target, respect_handler_level=True)
+        self.listener.start()
+
+    def _restart_in_child(self):
+        # fork 시점에 부모의 리스너 스레드가 잡고 있던 큐 락이 복사될 수 있으므로 큐도 새로 만듭니다.
+        self.queue = queue.Queue(self.queue_size)
+        self._start_listener()
+
+    def setFormatter(self, fmt):
+        # 포맷팅은 리스너 스레드의 대상 핸들러에서 수행
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        """
+        호출 스레드에서는 메시지 인자 병합만 수행합니다.
+        (인자 객체가 출력 전에 바뀌어도 로그 시점의 값이 남도록) 예외 정보는 리스너에서 포맷팅합니다.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            # 큐에 남은 레코드를 모두 출력한 뒤 종료
+            listener.stop()
+        self.target.close()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    loggers(로거 이름 접두사) 하위 로거의 WARNING 미만 레코드를 rate 비율(0~1)만 통과시키는 필터
+
+    로거에 붙인 필터는 하위 로거(views.banner_views 등)의 레코드에 적용되지 않으므로 핸들러에 붙여 사용합니다.
+    """
+
+    def __init__(self, rate=1.0, loggers=()):
+        super().__init__()
+        self.rate = rate
+        self.prefixes = tuple(loggers)
+
+    def _is_sampled(self, name):
+        return any(name == prefix or name.startswith(prefix + '.') for prefix in self.prefixes)
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1 or not self._is_sampled(record.name):
+            return True
+        return random.random() < self.rate
+
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 넘긴 필드로 간주)
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+class JSONFormatter(logging.Formatter):
+    """레코드를 한 줄 JSON으로 출력하는 포맷터"""
+
+    def format(self, record):
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        data.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data['exc_info'] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from asl_holdem.benchmark import summarize
+
+# 측정 대상 조회 API
+READ_PATHS = [
+    '/api/v1/banners/active/',
+    '/api/v1/notices/',
+    '/api/v1/tournaments/all_info/',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        '주요 조회 API의 처리량/지연 시간을 동기 워커(WSGI)와 ASGI async 뷰로 비교합니다. '
+        '(현재 DB의 데이터를 읽기만 합니다)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=300, help='방식별 총 요청 수 (기본값: 300)')
+        parser.add_argument('--workers', type=int, default=3, help='동기 워커 수 (기본값: 3, gunicorn workers와 동일)')
+        parser.add_argument('--concurrency', type=int, default=30, help='동시 클라이언트 수 (기본값: 30)')
+        parser.add_argument('--db-latency-ms', type=float, default=20, help='쿼리마다 추가할 DB 지연(ms) (기본값: 20)')
+        parser.add_argument('--user-id', type=int, help='지정하면 해당 사용자로 좌석권 현황 API도 측정합니다.')
+
+    def handle(self, *args, **options):
+        paths = list(READ_PATHS)
+        headers = {}
+        if options['user_id']:
+            user = User.objects.get(pk=options['user_id'])
+            headers['Authorization'] = f'Bearer {RefreshToken.for_user(user).access_token}'
+            paths.append(f'/api/v1/store/user-tickets/?user_id={user.pk}')
+
+        count = options['requests']
+        targets = [paths[i % len(paths)] for i in range(count)]
+
+        delay = options['db_latency_ms'] / 1000
+
+        def slow_execute(execute, sql, params, many, context):
+            time.sleep(delay)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            # 원격 DB 왕복/느린 쿼리를 흉내내기 위해 쿼리마다 지연 추가 (스레드별 연결 모두 적용, 재접속 시 중복 방지)
+            if slow_execute not in connection.execute_wrappers:
+                connection.execute_wrappers.append(slow_execute)
+
+        connections.close_all()
+        if delay:
+            connection_created.connect(add_latency)
+        try:
+            with override_settings(ROOT_URLCONF='asl_holdem.urls'):
+                self._report(
+                    f'동기 워커 x{options["workers"]} (WSGI)',
+                    self._run_sync(targets, headers, options['workers'], options['concurrency']),
+                )
+            with override_settings(ROOT_URLCONF='asl_holdem.async_urls'):
+                self._report('ASGI async 뷰', self._run_async(targets, headers, options['concurrency']))
+        finally:
+            connection_created.disconnect(add_latency)
+            connections.close_all()
+
+    def _run_sync(self, targets, headers, workers, concurrency):
+        # 동시 클라이언트 요청을 워커 수만큼만 순서대로 처리 (gunicorn 동기 워커의 backlog 대기 포함)
+        worker_pool = ThreadPoolExecutor(max_workers=workers)
+
+        def handle(path):
+            return Client().get(path, headers=headers).status_code
+
+        def request(path):
+            started = time.perf_counter()
+            status_code = worker_pool.submit(handle, path).result()
+            return status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with worker_pool, ThreadPoolExecutor(max_workers=concurrency) as clients:
+            results = list(clients.map(request, targets))
+        return results, time.perf_counter() - started
+
+    def _run_async(self, targets, headers, concurrency):
+        async def main():
+            semaphore = asyncio.Semaphore(concurrency)
+            client = AsyncClient()
+
+            async def request(path):
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.get(path, headers=headers)
+                    return response.status_code, time.perf_counter() - started
+
+            started = time.perf_counter()
+            results = await asyncio.gather(*(request(path) for path in targets))
+            return results, time.perf_counter() - started
+
+        return asyncio.run(main())
+
+    def _report(self, label, measured):
+        results, elapsed = measured
+        timings = [duration * 1000 for _, duration in results]
+        errors = sum(1 for status_code, _ in results if status_code != 200)
+        self.stdout.write(
+            f'[{label}] {len(results) / elapsed:,.1f} 요청/초 / '
+            f'{summarize(timings, digits=1, percentiles=(0.95, 0.99))} / 오류 {errors}건'
+        )
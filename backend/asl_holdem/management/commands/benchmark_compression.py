@@ -0,0 +1,86 @@
+import statistics
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from asl_holdem.benchmark import measure_ms
+from asl_holdem.middleware import CompressionMiddleware, brotli
+
+# 측정 대상 API (목록/카탈로그 위주)
+PATHS = [
+    '/api/v1/tournaments/all_info/',
+    '/api/v1/tournaments/',
+    '/api/v1/notices/',
+    '/api/v1/stores/',
+    '/api/v1/banners/active/',
+]
+
+# 모바일 회선 (이름, 대역폭 kbps, RTT ms)
+LINKS = [
+    ('3G', 1600, 300),
+    ('LTE', 12000, 70),
+]
+
+# TCP 초기 혼잡 윈도우 (10 * MSS)
+INITIAL_WINDOW_BYTES = 14600
+
+
+def transfer_ms(size, kbps, rtt_ms):
+    """응답 크기와 회선 정보로 대략적인 전송 시간(ms)을 계산합니다. (슬로 스타트 왕복 + 대역폭)"""
+    round_trips = 1
+    window = INITIAL_WINDOW_BYTES
+    sent = window
+    while sent < size:
+        window *= 2
+        sent += window
+        round_trips += 1
+    return round_trips * rtt_ms + size * 8 / kbps
+
+
+class Command(BaseCommand):
+    help = '주요 조회 API 응답의 압축 전/후 크기, 압축 시간, 모바일 회선 전송 시간을 비교합니다. (현재 DB의 데이터를 읽기만 합니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='압축 시간 측정 반복 횟수 (기본값: 20)')
+        parser.add_argument('--user-id', type=int, help='지정하면 해당 사용자로 인증하여 요청합니다.')
+        parser.add_argument('--path', action='append', dest='paths', help='측정할 API 경로 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        headers = {'Accept-Encoding': 'identity'}
+        if options['user_id']:
+            user = User.objects.get(pk=options['user_id'])
+            headers['Authorization'] = f'Bearer {RefreshToken.for_user(user).access_token}'
+
+        middleware = CompressionMiddleware(lambda request: None)
+        encodings = ['gzip'] + (['br'] if brotli is not None else [])
+        if brotli is None:
+            self.stdout.write(self.style.WARNING('brotli가 설치되어 있지 않아 gzip만 측정합니다.'))
+
+        client = Client()
+        for path in options['paths'] or PATHS:
+            response = client.get(path, headers=headers)
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f'[{path}] 응답 코드 {response.status_code}, 건너뜀'))
+                continue
+
+            body = response.content
+            self.stdout.write(f'[{path}] 원본 {len(body):,}B')
+            self._print_transfer('원본', len(body))
+
+            for encoding in encodings:
+                timings = measure_ms(lambda: middleware.compress(body, encoding), options['repeat'])
+                compressed = middleware.compress(body, encoding)
+                self.stdout.write(
+                    f'  {encoding}: {len(compressed):,}B ({len(compressed) / len(body):.1%}) / '
+                    f'압축 중앙값 {statistics.median(timings):.2f}ms'
+                )
+                self._print_transfer(encoding, len(compressed))
+
+            if len(body) < middleware.min_size:
+                self.stdout.write(f'  COMPRESSION_MIN_SIZE({middleware.min_size}B) 미만이라 실제로는 압축하지 않습니다.')
+
+    def _print_transfer(self, label, size):
+        estimates = ' / '.join(f'{name} {transfer_ms(size, kbps, rtt):.0f}ms' for name, kbps, rtt in LINKS)
+        self.stdout.write(f'    {label} 전송 예상: {estimates}')
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from accounts.models import User
+from asl_holdem.benchmark import measure_ms, summarize
+
+
+class Command(BaseCommand):
+    help = 'DB 연결 방식(요청마다 연결/지속 연결/연결 풀)별 요청 처리 시간을 측정합니다. (로컬 PostgreSQL 권장)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='방식별 요청 수 (기본값: 500)')
+        parser.add_argument('--queries', type=int, default=3, help='요청당 실행할 쿼리 수 (기본값: 3)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING(
+                f'현재 DB는 {connection.vendor}입니다. 접속 비용을 비교하려면 PostgreSQL에서 실행하세요.'
+            ))
+
+        settings_dict = connection.settings_dict
+        original = {key: settings_dict.get(key) for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+        pooled = bool(settings_dict.get('OPTIONS', {}).get('pool'))
+
+        try:
+            if pooled:
+                # 풀 사용 시에는 연결 종료가 풀 반환이므로 현재 설정 그대로 측정
+                self._measure('연결 풀 (DB_POOL)', options, None, None)
+            else:
+                self.stdout.write('연결 풀이 설정되지 않아 풀 측정은 건너뜁니다. (DB_POOL=True, Django 5.1 이상 필요)')
+                self._measure('요청마다 연결 (CONN_MAX_AGE=0)', options, 0, False)
+                self._measure('지속 연결 (CONN_MAX_AGE=60)', options, 60, False)
+                self._measure('지속 연결 + 헬스 체크', options, 60, True)
+        finally:
+            connection.close()
+            settings_dict.update(original)
+
+    def _measure(self, label, options, max_age, health_checks):
+        connection.close()
+        if max_age is not None:
+            connection.settings_dict['CONN_MAX_AGE'] = max_age
+            connection.settings_dict['CONN_HEALTH_CHECKS'] = health_checks
+
+        def handle_request():
+            # 실제 요청과 같이 request_started/finished 시그널로 연결 정리(close_old_connections) 수행
+            request_started.send(sender=self.__class__)
+            for _ in range(options['queries']):
+                User.objects.filter(pk=0).exists()
+            request_finished.send(sender=self.__class__)
+
+        timings = measure_ms(handle_request, options['requests'])
+        self.stdout.write(f'[{label}] {summarize(timings, digits=3)}')
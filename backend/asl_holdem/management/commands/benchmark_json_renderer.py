@@ -0,0 +1,74 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+from zoneinfo import ZoneInfo
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from asl_holdem.benchmark import measure_ms, summarize
+from asl_holdem.parsers import FastJSONParser
+from asl_holdem.renderers import FastJSONRenderer, orjson
+
+SEOUL = ZoneInfo('Asia/Seoul')
+
+
+def build_rows(count):
+    """all_info/get_all_users 응답과 비슷한 합성 행 목록 (datetime, Decimal, UUID, 한글 포함)"""
+    base = datetime.datetime(2025, 1, 1, 10, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    rows = []
+    for i in range(count):
+        rows.append({
+            'id': i,
+            'name': f'ASL 토너먼트 {i}',
+            'start_time': base + datetime.timedelta(hours=i),
+            'end_time': (base + datetime.timedelta(hours=i + 5)).astimezone(SEOUL),
+            'created_at': base.replace(microsecond=0),
+            'buy_in': decimal.Decimal('150000.00') + i,
+            'ticket_quantity': 100,
+            'ticket_id': uuid.UUID(int=i),
+            'status': 'UPCOMING',
+            'description': '매주 진행되는 정기 토너먼트입니다.' if i % 2 else None,
+            'is_active': bool(i % 3),
+            'store_allocated_tickets': i % 50,
+            'allocation_percentage': round((i % 50) / 100 * 100, 1),
+            'stores': [{'id': i % 7, 'name': f'매장 {i % 7}'}],
+        })
+    return rows
+
+
+class Command(BaseCommand):
+    help = '대용량 응답(기본 10,000행)의 JSON 렌더링/파싱 시간을 DRF 기본 렌더러와 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='응답 행 수 (기본값: 10000)')
+        parser.add_argument('--repeat', type=int, default=20, help='방식별 반복 횟수 (기본값: 20)')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson이 설치되어 있지 않아 두 렌더러 모두 표준 json을 사용합니다.'))
+
+        rows = build_rows(options['rows'])
+        repeat = options['repeat']
+
+        rendered = {}
+        for label, renderer in (('JSONRenderer (기본)', JSONRenderer()), ('FastJSONRenderer', FastJSONRenderer())):
+            rendered[label] = renderer.render(rows)
+            self._report(f'렌더링 - {label}', repeat, lambda: renderer.render(rows), len(rendered[label]))
+
+        default_output, fast_output = rendered.values()
+        if json.loads(default_output) != json.loads(fast_output):
+            self.stdout.write(self.style.ERROR('두 렌더러의 결과가 다릅니다.'))
+        else:
+            identical = '바이트 단위 동일' if default_output == fast_output else '값 동일 (숫자 표기만 다름)'
+            self.stdout.write(self.style.SUCCESS(f'렌더링 결과 일치: {identical}'))
+
+        for label, parser in (('JSONParser (기본)', JSONParser()), ('FastJSONParser', FastJSONParser())):
+            self._report(f'파싱 - {label}', repeat, lambda: parser.parse(io.BytesIO(default_output)), len(default_output))
+
+    def _report(self, label, repeat, func, size):
+        timings = measure_ms(func, repeat)
+        self.stdout.write(f'[{label}] {summarize(timings)} / {size / 1024:,.0f}KB')
@@ -0,0 +1,483 @@
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 형식)
+
+모듈 수준에서 메트릭을 정의하고 코드에서 값을 기록하면 /metrics 엔드포인트가 텍스트 형식(0.0.4)으로 내보냅니다.
+외부 라이브러리나 서비스 없이 동작합니다.
+
+    REQUESTS = Counter('asl_http_requests_total', 'HTTP 요청 수', ('method', 'status'))
+    REQUESTS.inc(method='GET', status=200)
+
+- Counter: 누적 값 / Gauge: 현재 값 / Histogram: 고정 버킷 분포
+- WindowCounter: 최근 window초 동안의 발생 횟수 (slot초 단위로 집계, Gauge로 출력)
+- 응답 시점에 계산하는 값은 register_collector()로 등록합니다.
+
+멀티 프로세스 모드 (METRICS_MULTIPROCESS_DIR 설정 시)
+gunicorn 워커마다 레지스트리가 따로 있으므로 각 프로세스가 요청 처리 후(METRICS_FLUSH_INTERVAL초 간격)와 종료 시
+자신의 값을 디렉터리의 프로세스별 파일에 기록하고, /metrics는 모든 파일을 합쳐서 응답합니다.
+- Counter/Histogram/WindowCounter는 모든 파일의 합이며, 종료된 프로세스의 값은 archive 파일로 합쳐 보존합니다.
+- Gauge는 실행 중인 프로세스 값의 합입니다.
+- 다른 워커의 값은 최대 METRICS_FLUSH_INTERVAL초 늦게 반영됩니다.
+파일 이름에는 프로세스 그룹(METRICS_PROCESS_GROUP, 예: gunicorn/daphne)이 들어가므로(<그룹>-<pid>-<시각>.json,
+archive-<그룹>.json) 각 서비스는 시작 전에 자신의 그룹 파일만 지워서 이전 실행의 누적값을 초기화합니다.
+"""
+import atexit
+import bisect
+import contextlib
+import glob
+import json
+import math
+import os
+import re
+import threading
+import time
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경에서는 종료된 프로세스 파일 정리를 건너뜀
+    fcntl = None
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 응답 시간(초) 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Registry:
+    """메트릭과 응답 시점 수집 함수(collector) 목록"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'이미 등록된 메트릭입니다: {metric.name}')
+            self._metrics[metric.name] = metric
+
+    def register_collector(self, collector):
+        """
+        collector(merged)는 응답 직전에 호출되어 추가할 {이름: 패밀리}를 반환합니다. (metric_family 사용)
+        merged는 모든 프로세스 값을 합친 merge() 결과입니다. 데코레이터로 사용할 수 있습니다.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def snapshot(self):
+        """현재 프로세스의 값을 {이름: 패밀리} 형태(JSON 직렬화 가능)로 반환합니다."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.family() for metric in metrics}
+
+    def collectors(self):
+        with self._lock:
+            return list(self._collectors)
+
+
+REGISTRY = Registry()
+
+
+def metric_family(name, kind, documentation, labelnames=(), samples=(), **extra):
+    """메트릭 패밀리 딕셔너리를 만듭니다. samples는 [(레이블 값 목록, 값), ...]입니다."""
+    return {
+        'name': name,
+        'kind': kind,
+        'help': documentation,
+        'labelnames': list(labelnames),
+        'samples': [[list(labels), value] for labels, value in samples],
+        **extra,
+    }
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} 레이블이 일치하지 않습니다: {sorted(labels)} != {sorted(self.labelnames)}')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _copy(self, value):
+        return value
+
+    def family(self):
+        with self._lock:
+            samples = [(key, self._copy(value)) for key, value in self._values.items()]
+        return metric_family(self.name, self.kind, self.documentation, self.labelnames, samples)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(Metric):
+    """증가만 하는 누적 값"""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """현재 값 (멀티 프로세스 모드에서는 실행 중인 프로세스 값의 합)"""
+
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """
+    고정 버킷 분포
+
+    레이블 값마다 [버킷별 개수..., +Inf 개수, 합계]를 저장하며, 출력할 때 누적 개수로 변환합니다.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=REGISTRY):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def _copy(self, value):
+        return list(value)
+
+    def family(self):
+        return {**super().family(), 'buckets': list(self.buckets)}
+
+
+class WindowCounter(Metric):
+    """
+    최근 window초 동안의 발생 횟수 (예: 분당 좌석권 지급 수)
+
+    slot초 단위 시각(epoch 기준)별 개수를 저장하므로 여러 프로세스 값을 그대로 합칠 수 있고,
+    요청이 없는 워커의 오래된 값은 시간이 지나면 자연히 창 밖으로 빠집니다.
+    """
+
+    kind = 'window'
+
+    def __init__(self, name, documentation, labelnames=(), window=60, slot=10, registry=REGISTRY):
+        self.window = window
+        self.slot = slot
+        super().__init__(name, documentation, labelnames, registry)
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        current = int(time.time() // self.slot)
+        oldest = current - self.window // self.slot
+        with self._lock:
+            slots = self._values.setdefault(key, {})
+            slots[current] = slots.get(current, 0) + amount
+            for stale in [index for index in slots if index <= oldest]:
+                del slots[stale]
+
+    def _copy(self, value):
+        # JSON 키는 문자열
+        return {str(index): count for index, count in value.items()}
+
+    def family(self):
+        return {**super().family(), 'window': self.window, 'slot': self.slot}
+
+
+def _oldest_slot(item, now):
+    return int(now // item['slot']) - item['window'] // item['slot']
+
+
+def _window_value(item, slots, now):
+    oldest = _oldest_slot(item, now)
+    return sum(count for index, count in slots.items() if int(index) > oldest)
+
+
+def merge(target, families, archive=False):
+    """
+    families를 target에 합칩니다. target의 samples는 {레이블 튜플: 값} 딕셔너리입니다.
+    archive=True이면 종료된 프로세스 값 보존용으로 Gauge를 제외하고 WindowCounter의 지난 값을 버립니다.
+    """
+    now = time.time()
+    for name, source in families.items():
+        kind = source['kind']
+        if archive and kind == 'gauge':
+            continue
+        merged = target.get(name)
+        if merged is None:
+            merged = target[name] = {**source, 'samples': {}}
+        samples = merged['samples']
+        for labels, value in source['samples']:
+            key = tuple(labels)
+            current = samples.get(key)
+            if kind == 'histogram':
+                samples[key] = list(value) if current is None else [a + b for a, b in zip(current, value)]
+            elif kind == 'window':
+                slots = dict(current or {})
+                for index, count in value.items():
+                    slots[index] = slots.get(index, 0) + count
+                if archive:
+                    oldest = _oldest_slot(source, now)
+                    slots = {index: count for index, count in slots.items() if int(index) > oldest}
+                samples[key] = slots
+            else:
+                samples[key] = (current or 0) + value
+    return target
+
+
+def _to_families(merged):
+    return {
+        name: {**item, 'samples': [[list(key), value] for key, value in item['samples'].items()]}
+        for name, item in merged.items()
+    }
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiProcessStore:
+    """프로세스별 메트릭 파일 디렉터리"""
+
+    ARCHIVE_PREFIX = 'archive-'
+
+    # 프로세스 파일 이름: <그룹>-<pid>-<시작 시각>.json
+    PROCESS_FILE_RE = re.compile(r'^(?P<group>[A-Za-z0-9_]+)-(?P<pid>\d+)-\d+\.json$')
+
+    def __init__(self, directory, group='app'):
+        self.directory = directory
+        self.group = re.sub(r'\W', '_', group) or 'app'
+        self._pid = None
+        self._path = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def path(self):
+        # fork된 자식(gunicorn --preload)은 새 파일 사용, pid 재사용에 대비해 시작 시각 포함
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._path = os.path.join(self.directory, f'{self.group}-{self._pid}-{time.time_ns()}.json')
+        return self._path
+
+    def archive_path(self, group):
+        """그룹별 종료된 프로세스 누적값 파일"""
+        return os.path.join(self.directory, f'{self.ARCHIVE_PREFIX}{group}.json')
+
+    def write(self, families, path=None):
+        path = path or self.path
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as fp:
+            json.dump(families, fp, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def read(path):
+        try:
+            with open(path, encoding='utf-8') as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with open(os.path.join(self.directory, '.lock'), 'a') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def _process_files(self):
+        """[(경로, 그룹, pid), ...] (이름 형식이 다른 파일은 제외)"""
+        files = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            match = self.PROCESS_FILE_RE.match(os.path.basename(path))
+            if match:
+                files.append((path, match['group'], int(match['pid'])))
+        return files
+
+    def _archive_files(self):
+        return glob.glob(os.path.join(self.directory, f'{self.ARCHIVE_PREFIX}*.json'))
+
+    def _archive_dead(self):
+        dead = {}
+        for path, group, pid in self._process_files():
+            if not _is_alive(pid):
+                dead.setdefault(group, []).append(path)
+        for group, paths in dead.items():
+            archive_path = self.archive_path(group)
+            merged = merge({}, self.read(archive_path), archive=True)
+            for path in paths:
+                merge(merged, self.read(path), archive=True)
+            self.write(_to_families(merged), archive_path)
+            for path in paths:
+                os.remove(path)
+
+    def collect(self):
+        """모든 프로세스 파일을 합칩니다."""
+        if fcntl is None:
+            return self._merge_files()
+        with self._locked():
+            self._archive_dead()
+            return self._merge_files()
+
+    def _merge_files(self):
+        merged = {}
+        for path in self._archive_files():
+            merge(merged, self.read(path))
+        for path, _, _ in self._process_files():
+            merge(merged, self.read(path))
+        return merged
+
+
+_store = None
+_store_lock = threading.Lock()
+_last_flush = 0.0
+
+
+def get_store():
+    """멀티 프로세스 모드 저장소 (METRICS_MULTIPROCESS_DIR 미설정 시 None)"""
+    global _store
+    directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', '')
+    if not directory:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = MultiProcessStore(directory, getattr(settings, 'METRICS_PROCESS_GROUP', 'app'))
+    return _store
+
+
+def flush(force=False):
+    """멀티 프로세스 모드에서 현재 프로세스의 값을 파일에 기록합니다. (METRICS_FLUSH_INTERVAL초 간격)"""
+    global _last_flush
+    store = get_store()
+    if store is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < getattr(settings, 'METRICS_FLUSH_INTERVAL', 5):
+        return
+    _last_flush = now
+    store.write(REGISTRY.snapshot())
+
+
+def _flush_at_exit():
+    try:
+        flush(force=True)
+    except Exception:
+        pass
+
+
+atexit.register(_flush_at_exit)
+
+
+def collect(registry=REGISTRY):
+    """모든 프로세스 값을 합치고 collector 결과를 더한 메트릭 패밀리를 반환합니다."""
+    store = get_store()
+    if store is None:
+        merged = merge({}, registry.snapshot())
+    else:
+        flush(force=True)
+        merged = store.collect()
+    for collector in registry.collectors():
+        merge(merged, collector(merged))
+    return merged
+
+
+def _escape(value, quote=True):
+    value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_value(value):
+    if isinstance(value, float) and math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def _sample_line(name, labels, value):
+    if labels:
+        pairs = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        return f'{name}{{{pairs}}} {_format_value(value)}'
+    return f'{name} {_format_value(value)}'
+
+
+def render(merged):
+    """collect() 결과를 Prometheus 텍스트 형식으로 변환합니다."""
+    now = time.time()
+    lines = []
+    for name in sorted(merged):
+        item = merged[name]
+        kind = item['kind']
+        lines.append(f'# HELP {name} {_escape(item["help"], quote=False)}')
+        lines.append(f'# TYPE {name} {"gauge" if kind == "window" else kind}')
+        for key, value in sorted(item['samples'].items()):
+            labels = dict(zip(item['labelnames'], key))
+            if kind == 'histogram':
+                cumulative = 0
+                for bound, count in zip([*item['buckets'], math.inf], value[:-1]):
+                    cumulative += count
+                    lines.append(_sample_line(f'{name}_bucket', {**labels, 'le': _format_value(bound)}, cumulative))
+                lines.append(_sample_line(f'{name}_sum', labels, value[-1]))
+                lines.append(_sample_line(f'{name}_count', labels, cumulative))
+            elif kind == 'window':
+                lines.append(_sample_line(name, labels, _window_value(item, value, now)))
+            else:
+                lines.append(_sample_line(name, labels, value))
+    return '\n'.join(lines) + '\n'
+
+
+# 캐시 조회 결과 (asl_holdem.cache.cached_view, accounts.cache.TTLCache)
+CACHE_REQUESTS = Counter('asl_cache_requests_total', '캐시 조회 수', ('cache', 'result'))
+CACHE_ENTRIES = Gauge('asl_cache_entries', '프로세스 내 캐시 항목 수', ('cache',))
+
+
+@REGISTRY.register_collector
+def cache_hit_ratio(merged):
+    """캐시별 누적 적중률 (hit / (hit + miss))"""
+    totals = {}
+    for (cache, result), count in merged.get(CACHE_REQUESTS.name, {'samples': {}})['samples'].items():
+        hits, total = totals.get(cache, (0, 0))
+        totals[cache] = (hits + (count if result == 'hit' else 0), total + count)
+    samples = [((cache,), hits / total) for cache, (hits, total) in totals.items() if total]
+    return {
+        'asl_cache_hit_ratio': metric_family('asl_cache_hit_ratio', 'gauge', '캐시 누적 적중률', ('cache',), samples),
+    }
@@ -0,0 +1,336 @@
+import hmac
+import logging
+import time
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+from asl_holdem.db_router import (
+    PIN_COOKIE_NAME,
+    PIN_HEADER_NAME,
+    pin_seconds,
+    pin_to_primary,
+    pinned_until,
+    unpin,
+)
+from asl_holdem import metrics
+from asl_holdem.instrumentation import record_request, route_pattern, start_collecting, stop_collecting
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# 압축 대상 Content-Type (이미지/동영상/zip 등 이미 압축된 미디어는 제외)
+COMPRESSIBLE_CONTENT_TYPES = (
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+)
+
+
+class ReplicaPinMiddleware:
+    """
+    쓰기 요청과 최근에 쓰기를 한 클라이언트의 요청을 primary DB로 고정하는 미들웨어
+
+    쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 만료 시각을 쿠키와 X-DB-Pin 응답 헤더로 내려주고,
+    클라이언트가 만료 전에 쿠키나 같은 헤더를 다시 보내면 해당 요청의 조회도 primary에서 수행합니다.
+    WSGI/ASGI 모두 지원합니다. (ASGI에서 동기 전환 없이 실행)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = self._pin(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                unpin(token)
+        return self._set_pin(request, response)
+
+    async def __acall__(self, request):
+        token = self._pin(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                unpin(token)
+        return self._set_pin(request, response)
+
+    @staticmethod
+    def _pin(request):
+        pinned = (
+            request.method not in SAFE_METHODS
+            or pinned_until(request.COOKIES.get(PIN_COOKIE_NAME))
+            or pinned_until(request.headers.get(PIN_HEADER_NAME))
+        )
+        return pin_to_primary() if pinned else None
+
+    @staticmethod
+    def _set_pin(request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            seconds = pin_seconds()
+            expires_at = f'{time.time() + seconds:.3f}'
+            response.set_cookie(PIN_COOKIE_NAME, expires_at, max_age=seconds, httponly=True, samesite='Lax')
+            response[PIN_HEADER_NAME] = expires_at
+        return response
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더를 {인코딩: q값} 딕셔너리로 변환합니다."""
+    weights = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+    return weights
+
+
+def negotiate_encoding(header, available):
+    """
+    클라이언트가 허용하는 인코딩 중 q값이 가장 높은 것을 반환합니다.
+    q값이 같으면 available 순서(서버 선호)를 따르며, 허용하는 인코딩이 없으면 None을 반환합니다.
+    """
+    weights = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = weights.get(coding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(content_type):
+    """텍스트 계열 응답인지 확인합니다. (+json, +xml 접미사 포함)"""
+    media_type = content_type.partition(';')[0].strip().lower()
+    return (
+        media_type.startswith('text/')
+        or media_type in COMPRESSIBLE_CONTENT_TYPES
+        or media_type.endswith(('+json', '+xml'))
+    )
+
+
+class _GzipStream:
+    """청크마다 flush하는 gzip 스트림 압축기"""
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk):
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    """청크마다 flush하는 brotli 스트림 압축기"""
+
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 응답 본문을 brotli 또는 gzip으로 압축하는 미들웨어
+
+    - brotli가 설치되어 있으면 br을 우선하고, 클라이언트 q값이 더 높으면 gzip을 사용합니다.
+    - COMPRESSION_MIN_SIZE보다 작은 응답, 텍스트 계열이 아닌 응답(이미지 등), 이미 인코딩된 응답은 건너뜁니다.
+    - 스트리밍 응답(동기/비동기)은 청크 단위로 압축해 바로 내보냅니다.
+    - gzip 응답에는 django GZipMiddleware와 같은 BREACH 완화(임의 길이 파일명)를 적용합니다.
+    WSGI/ASGI 모두 지원합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    max_random_bytes = 100
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+        self.encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or not is_compressible(response.get('Content-Type', '')):
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), self.encodings)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._acompress_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = self._compress_stream(response.streaming_content, encoding)
+            # 압축 후 크기는 스트리밍이 끝나야 알 수 있음
+            del response.headers['Content-Length']
+        else:
+            compressed = self.compress(response.content, encoding)
+            # 압축 결과가 더 작을 때만 사용
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # 본문이 바뀌었으므로 strong ETag는 weak로 변경 (RFC 9110 8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def compress(self, content, encoding):
+        if encoding == 'br':
+            return brotli.compress(content, quality=self.brotli_quality)
+        return compress_string(content, max_random_bytes=self.max_random_bytes)
+
+    def _stream(self, encoding):
+        if encoding == 'br':
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream()
+
+    def _compress_stream(self, chunks, encoding):
+        stream = self._stream(encoding)
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+    async def _acompress_stream(self, chunks, encoding):
+        stream = self._stream(encoding)
+        async for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+
+class RequestTimingMiddleware:
+    """
+    요청별 실행 시간, DB 시간, 쿼리 수를 계측하는 미들웨어
+
+    - 본사 관리자 또는 X-Server-Timing-Token 헤더가 SERVER_TIMING_TOKEN과 일치하는 요청의 응답에
+      Server-Timing 헤더를 추가합니다. (브라우저 개발자 도구에서 확인, DEBUG와 무관)
+    - SLOW_REQUEST_MS 또는 SLOW_REQUEST_QUERIES 이상인 요청은 가장 많이 반복된 SQL 형태와 함께 경고 로그로 남깁니다. (N+1 탐지)
+    - 경로(URL 패턴)별 통계를 프로세스 메모리에 집계하고 메트릭(/metrics)에 기록합니다. (asl_holdem.instrumentation)
+    스트리밍 응답은 본문 전송 전까지의 시간만 계측합니다. WSGI/ASGI 모두 지원합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, 'SLOW_REQUEST_MS', 500)
+        self.slow_queries = getattr(settings, 'SLOW_REQUEST_QUERIES', 30)
+        self.timing_token = getattr(settings, 'SERVER_TIMING_TOKEN', '')
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        collector, token = start_collecting()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_collecting(token)
+        return self.process_response(request, response, collector, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        collector, token = start_collecting()
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_collecting(token)
+        return self.process_response(request, response, collector, started)
+
+    def process_response(self, request, response, collector, started):
+        wall_ms = (time.perf_counter() - started) * 1000
+        db_ms = collector.duration * 1000
+        pattern = route_pattern(request)
+        route = f'{request.method} {pattern}'
+        record_request(request.method, pattern, response.status_code, wall_ms, db_ms, collector.count)
+        metrics.flush()
+
+        if wall_ms >= self.slow_ms or collector.count >= self.slow_queries:
+            repeated = ''.join(f'\n  {count}회: {shape}' for shape, count in collector.repeated())
+            logger.warning(
+                '느린 요청 %s (%s): %.1fms, DB %.1fms, 쿼리 %d개%s',
+                route, response.status_code, wall_ms, db_ms, collector.count, repeated,
+                extra={'route': route, 'duration_ms': round(wall_ms, 1), 'db_ms': round(db_ms, 1), 'queries': collector.count},
+            )
+
+        if self._show_timing(request):
+            response['Server-Timing'] = (
+                f'app;dur={wall_ms - db_ms:.1f}, '
+                f'db;dur={db_ms:.1f};desc="{collector.count} queries", '
+                f'total;dur={wall_ms:.1f}'
+            )
+        return response
+
+    def _show_timing(self, request):
+        given = request.headers.get('X-Server-Timing-Token')
+        if self.timing_token and given:
+            return hmac.compare_digest(given.encode(), self.timing_token.encode())
+        # DRF 인증(JWT) 결과도 request.user에 반영됨
+        # (매장 관리자도 is_staff이므로 본사 관리자는 슈퍼유저/ADMIN 역할로 구분)
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return False
+        return bool(user.is_superuser or getattr(user, 'role', None) == 'ADMIN')
@@ -0,0 +1,31 @@
+"""
+DRF JSON 파서
+
+orjson이 설치되어 있으면 orjson으로 요청 본문을 파싱하고, 없으면 DRF 기본 JSONParser를 사용합니다.
+"""
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from asl_holdem.renderers import orjson
+
+
+class FastJSONParser(JSONParser):
+    """orjson 기반 JSON 파서 (NaN/Infinity 등 표준이 아닌 값은 기본 파서와 같이 거부)"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,57 @@
+"""
+DRF JSON 렌더러
+
+orjson이 설치되어 있으면 orjson으로 직렬화하고, 없으면 DRF 기본 JSONRenderer(표준 json)를 사용합니다.
+datetime/date/time과 UUID는 orjson이 기본 렌더러와 같은 형식(isoformat, UTC는 Z 표기)으로 직렬화하고,
+orjson이 처리하지 않는 타입(Decimal, 지연 번역 문자열, QuerySet 등)은 DRF 기본 인코더와 같은 규칙으로 변환하므로
+응답 형식은 기본 렌더러와 동일합니다. (초 단위 UTC 오프셋만 분 단위로 표기되는 차이가 있음 - 1910년 이전 지방시)
+"""
+import decimal
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+# DRF 기본 인코더의 타입 변환 규칙을 그대로 사용
+_drf_encoder = encoders.JSONEncoder()
+
+
+def orjson_default(obj):
+    """orjson이 직렬화하지 못하는 객체를 DRF 기본 인코더 규칙으로 변환합니다."""
+    # 가장 흔한 Decimal(금액 필드)은 타입 검사 없이 바로 변환
+    if type(obj) is decimal.Decimal:
+        return float(obj)
+    return _drf_encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러 (orjson이 없거나 들여쓰기가 요청되면 기본 렌더러 사용)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # ?format=json; indent=4 등 들여쓰기 요청은 기본 렌더러로 처리 (orjson은 2칸 들여쓰기만 지원)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # UTC datetime은 DRF와 같이 Z로 표기하고, 정수 등 문자열이 아닌 키도 허용
+        ret = orjson.dumps(
+            data,
+            default=orjson_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+
+        # 기본 렌더러와 같이 U+2028/U+2029는 이스케이프 (JavaScript 문자열 호환)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
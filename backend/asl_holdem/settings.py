@@ -2,6 +2,7 @@ import os
 import sys
 from pathlib import Path
 from datetime import timedelta
+import django
 import environ
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,8 @@ ALLOWED_HOSTS = ['*']
 # ]
 # Application definition
 INSTALLED_APPS = [
+    # runserver를 ASGI(daphne)로 실행하여 로컬에서도 WebSocket(ws/...) 사용 (staticfiles보다 앞에 위치)
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -56,6 +59,7 @@ INSTALLED_APPS = [
     'corsheaders',
     'django_filters',
     'drf_yasg',    # Local apps
+    'asl_holdem',  # 프로젝트 공통 관리 명령 (벤치마크 등)
     'accounts.apps.AccountsConfig',
     'tournaments',
     'stores',
@@ -65,7 +69,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'asl_holdem.middleware.RequestTimingMiddleware',  # 요청별 실행 시간/쿼리 수 계측 (Server-Timing, 느린 요청 로그)
     'django.middleware.security.SecurityMiddleware',
+    'asl_holdem.middleware.CompressionMiddleware',  # Accept-Encoding에 따른 brotli/gzip 응답 압축
+    'asl_holdem.middleware.ReplicaPinMiddleware',  # 쓰기 직후 조회를 primary DB로 고정
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -75,7 +82,31 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'asl_holdem.urls'
+# 응답 압축 최소 크기(바이트) - 이보다 작은 응답은 압축 이득보다 CPU 비용이 큼
+COMPRESSION_MIN_SIZE = env.int('COMPRESSION_MIN_SIZE', default=1024)
+# brotli 압축 품질 (0~11, 동적 응답에는 4~5가 속도 대비 효율이 좋음)
+COMPRESSION_BROTLI_QUALITY = env.int('COMPRESSION_BROTLI_QUALITY', default=5)
+
+# 느린 요청 로그 기준 - 실행 시간(ms) 또는 쿼리 수가 이 값 이상이면 반복 SQL과 함께 경고 로그 기록
+SLOW_REQUEST_MS = env.int('SLOW_REQUEST_MS', default=500)
+SLOW_REQUEST_QUERIES = env.int('SLOW_REQUEST_QUERIES', default=30)
+# Server-Timing 헤더 - 본사 관리자 외에 X-Server-Timing-Token: <토큰> 요청에도 추가 (미설정 시 본사 관리자만)
+SERVER_TIMING_TOKEN = env('SERVER_TIMING_TOKEN', default='')
+
+# 메트릭(/metrics) - 여러 워커(gunicorn/daphne)의 값을 합칠 때 사용할 공유 디렉터리 (비우면 프로세스 내 값만 응답)
+METRICS_MULTIPROCESS_DIR = env('METRICS_MULTIPROCESS_DIR', default='')
+# 메트릭 파일 이름에 붙일 프로세스 그룹 (서비스별로 다르게 지정하면 시작 시 자신의 파일만 정리 가능, 예: gunicorn/daphne)
+METRICS_PROCESS_GROUP = env('METRICS_PROCESS_GROUP', default='app')
+# 워커가 메트릭 파일을 갱신하는 최소 간격(초)
+METRICS_FLUSH_INTERVAL = env.int('METRICS_FLUSH_INTERVAL', default=5)
+# 설정하면 Authorization: Bearer <토큰> 요청만 허용 (미설정 시 DEBUG에서 프록시를 거치지 않은 로컬 요청만 허용)
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+
+# ASGI 배포에서 주요 조회 API를 async 뷰로 처리 (asl_holdem.async_urls, WSGI 배포에서는 False 유지)
+ASYNC_READ_VIEWS = env.bool('ASYNC_READ_VIEWS', default=False)
+ROOT_URLCONF = 'asl_holdem.async_urls' if ASYNC_READ_VIEWS else 'asl_holdem.urls'
+# async 조회 뷰를 실행할 스레드 수 (스레드마다 DB 연결 1개)
+ASYNC_READ_THREADS = env.int('ASYNC_READ_THREADS', default=16)
 
 TEMPLATES = [
     {
@@ -94,6 +125,48 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'asl_holdem.wsgi.application'
+ASGI_APPLICATION = 'asl_holdem.asgi.application'
+
+# 실시간 변경 이벤트용 채널 레이어 (seats.realtime)
+# REDIS_URL이 없으면 프로세스 내 메모리 레이어를 사용합니다. (로컬/테스트 전용 - 여러 프로세스 간에는 전달되지 않음)
+REDIS_URL = env('REDIS_URL', default='')
+if REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [REDIS_URL]},
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
+
+# Cache
+# CACHE_BACKEND: locmem(기본, 프로세스별) / file(같은 서버의 워커들이 공유) / redis / 그 외에는 캐시 백엔드 경로
+# 모델 버전 카운터(asl_holdem.cache)가 워커 간에 공유되어야 하므로 gunicorn 다중 워커 배포에서는 file 또는 redis를 사용합니다.
+CACHE_BACKEND_ALIASES = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+CACHE_DEFAULT_LOCATIONS = {
+    'locmem': 'asl-holdem',
+    'file': str(BASE_DIR / 'cache'),
+    'redis': REDIS_URL or 'redis://127.0.0.1:6379/1',
+}
+CACHE_BACKEND = env('CACHE_BACKEND', default='locmem')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND_ALIASES.get(CACHE_BACKEND, CACHE_BACKEND),
+        'LOCATION': env('CACHE_LOCATION', default=CACHE_DEFAULT_LOCATIONS.get(CACHE_BACKEND, '')),
+        # cached_view 기본 만료 시간(초) - 모델 변경 시에는 버전 증가로 즉시 무효화
+        'TIMEOUT': env.int('CACHE_TIMEOUT', default=300),
+        'KEY_PREFIX': 'asl',
+    }
+}
 
 # Database
 DATABASES = {
@@ -104,9 +177,49 @@ DATABASES = {
         'PASSWORD': env('DB_PASSWORD'),
         'HOST': env('DB_HOST'),
         'PORT': env('DB_PORT'),
+        # 지속 연결: 요청마다 새로 접속하지 않고 지정한 시간(초) 동안 연결을 재사용 (0이면 요청마다 종료)
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        # 재사용 전 연결 상태를 확인하여 끊어진 연결로 인한 오류 방지
+        'CONN_HEALTH_CHECKS': env.bool('DB_CONN_HEALTH_CHECKS', default=True),
+        # 테스트 DB 이름 (SQLite에서 여러 스레드를 사용하는 테스트를 실행하려면 파일 경로 지정, 미지정 시 메모리 DB)
+        'TEST': {'NAME': env('DB_TEST_NAME', default=None)},
     }
 }
 
+# psycopg3 연결 풀 (DB_POOL=True, PostgreSQL + Django 5.1 이상에서만 사용, psycopg[pool] 필요)
+# 풀을 사용하면 연결 재사용은 풀이 담당하므로 CONN_MAX_AGE는 0으로 설정합니다.
+if (
+    env.bool('DB_POOL', default=False)
+    and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql'
+    and django.VERSION >= (5, 1)
+):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+            'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+            'timeout': env.int('DB_POOL_TIMEOUT', default=10),
+        },
+    }
+
+# 읽기 전용 복제본 (DB_REPLICA_HOST 또는 DB_REPLICA_NAME 지정 시 사용, 나머지 접속 정보는 default와 동일)
+if env('DB_REPLICA_HOST', default='') or env('DB_REPLICA_NAME', default=''):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': env('DB_REPLICA_NAME', default=DATABASES['default']['NAME']),
+        'USER': env('DB_REPLICA_USER', default=DATABASES['default']['USER']),
+        'PASSWORD': env('DB_REPLICA_PASSWORD', default=DATABASES['default']['PASSWORD']),
+        'HOST': env('DB_REPLICA_HOST', default=DATABASES['default']['HOST']),
+        'PORT': env('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        # 테스트에서는 별도 DB를 만들지 않고 default를 그대로 사용
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['asl_holdem.db_router.PrimaryReplicaRouter']
+
+# 쓰기 후 primary에서 읽도록 고정하는 시간(초) - 복제 지연보다 길게 설정
+REPLICA_PIN_SECONDS = env.int('REPLICA_PIN_SECONDS', default=5)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -142,11 +255,21 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # orjson 기반 JSON 렌더러/파서 (orjson 미설치 시 DRF 기본 동작)
+    'DEFAULT_RENDERER_CLASSES': (
+        'asl_holdem.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'asl_holdem.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
     'DEFAULT_FILTER_BACKENDS': (
@@ -180,48 +303,104 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# 인증 사용자 캐시 (프로세스별, 사용자 저장 시 무효화)
+JWT_USER_CACHE_TTL = env.int('JWT_USER_CACHE_TTL', default=30)
+JWT_USER_CACHE_SIZE = env.int('JWT_USER_CACHE_SIZE', default=4096)
+
+# 요청 사용자의 매장 조회 캐시 (stores.resolver)
+OWNER_STORE_CACHE_TTL = env.int('OWNER_STORE_CACHE_TTL', default=60)
+OWNER_STORE_CACHE_SIZE = env.int('OWNER_STORE_CACHE_SIZE', default=4096)
+
 # Custom user model
 AUTH_USER_MODEL = 'accounts.User'
 
+# QR 코드 비동기 생성 여부 (QR_CODE_STORE_FILES가 켜져 있을 때만 적용)
+# True이면 회원가입 시 QR 코드 생성 작업만 등록하고 process_qr_code_jobs 명령이 이미지를 생성합니다.
+QR_CODE_ASYNC = env.bool('QR_CODE_ASYNC', default=True)
+
+# QR 코드 이미지 파일 저장 여부
+# False이면 /api/v1/user/qr/<id>/<uuid>.png 엔드포인트에서 요청 시 렌더링만 하고 qr_codes/에 파일을 쓰지 않습니다.
+QR_CODE_STORE_FILES = env.bool('QR_CODE_STORE_FILES', default=False)
+
 # 로깅 설정
+# 로그 레벨 (DEBUG 로그는 운영 기본값 INFO에서 메시지 포맷팅 없이 버려집니다)
+LOG_LEVEL = env('LOG_LEVEL', default='INFO')
+# 로그 출력 형식 (verbose: 한 줄 텍스트 / json: 구조화 로그)
+LOG_FORMAT = env('LOG_FORMAT', default='verbose')
+# views/api 로거의 INFO 이하 로그 샘플링 비율 (0~1, WARNING 이상은 항상 기록)
+LOG_SAMPLE_RATE = env.float('LOG_SAMPLE_RATE', default=1.0)
+# 로그 큐 크기 (가득 차면 요청을 막지 않고 레코드를 버림)
+LOG_QUEUE_SIZE = env.int('LOG_QUEUE_SIZE', default=10000)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
+            'format': '{levelname} {asctime} {name} {message}',
             'style': '{',
         },
         'simple': {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'asl_holdem.log.JSONFormatter',
+        },
+    },
+    'filters': {
+        'sampling': {
+            '()': 'asl_holdem.log.SamplingFilter',
+            'rate': LOG_SAMPLE_RATE,
+            'loggers': ['views', 'api'],
+        },
     },
     'handlers': {
         'console': {
-            'level': 'DEBUG',
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
+            'class': 'asl_holdem.log.AsyncQueueHandler',
+            'formatter': LOG_FORMAT,
+            'filters': ['sampling'],
+            'queue_size': LOG_QUEUE_SIZE,
         },
     },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
     'loggers': {
         'django': {
             'handlers': ['console'],
             'level': 'INFO',
-            'propagate': True,
+            'propagate': False,
         },
-        'django.request': {
+        'views': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
-        'views': {
+        'api': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+            'propagate': False,
+        },
+        'accounts': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+            'propagate': False,
+        },
+        'stores': {
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
+            'propagate': False,
+        },
+        'seats': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
-} 
+}
+
 
 # 🚀 클라우드 최적화된 CORS 설정
 import os
@@ -250,6 +429,12 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'x-db-pin',  # 쓰기 직후 primary DB 조회 고정 (asl_holdem.db_router)
+]
+
+# 프론트엔드에서 읽을 수 있는 응답 헤더
+CORS_EXPOSE_HEADERS = [
+    'x-db-pin',
 ]
 
 # 필요한 메서드만 허용
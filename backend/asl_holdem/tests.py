@@ -0,0 +1,419 @@
+import os
+import tempfile
+import time
+import warnings
+from datetime import timedelta
+from unittest import skipUnless
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from asl_holdem.cache import cached_view, get_model_versions
+from asl_holdem.db_router import (
+    PIN_COOKIE_NAME, PIN_HEADER_NAME, PRIMARY, REPLICA, PrimaryReplicaRouter, pin_to_primary, unpin,
+)
+from asl_holdem.metrics import Counter, Gauge, Histogram, MultiProcessStore, WindowCounter
+from asl_holdem.middleware import ReplicaPinMiddleware
+from notices.models import Notice
+from seats.models import TournamentTicketDistribution
+from stores.models import Banner, Store
+from tournaments.models import Tournament
+
+User = get_user_model()
+
+CACHED_MODELS = (Tournament, Store, Banner, Notice, TournamentTicketDistribution)
+
+
+class CountingView(APIView):
+    """cached_view 적중 여부를 확인하기 위해 실제 처리 횟수를 세는 뷰"""
+    permission_classes = [AllowAny]
+    calls = 0
+
+    @cached_view(*CACHED_MODELS)
+    def get(self, request):
+        type(self).calls += 1
+        return Response({'notices': Notice.objects.count(), 'stores': Store.objects.count()})
+
+
+class ModelVersionInvalidationTests(TestCase):
+    """모델 저장/삭제 시 커밋 후 버전이 올라가고 cached_view가 새로 처리되는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+        CountingView.calls = 0
+        self.view = CountingView.as_view()
+        self.factory = APIRequestFactory()
+
+        self.owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        self.admin = User.objects.create_user(username='admin', phone='010-9999-0000', password='password', role='ADMIN')
+
+    def get(self):
+        return self.view(self.factory.get('/cached/')).data
+
+    def assert_bumps(self, model, change):
+        """change 실행(커밋) 후 model의 버전만 바뀌고 캐시된 응답 대신 새로 처리되는지 확인"""
+        self.get()
+        calls = CountingView.calls
+        before = get_model_versions(*CACHED_MODELS)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            instance = change()
+
+        after = get_model_versions(*CACHED_MODELS)
+        for cached_model, old, new in zip(CACHED_MODELS, before, after):
+            if cached_model is model:
+                self.assertNotEqual(old, new, model.__name__)
+            else:
+                self.assertEqual(old, new, cached_model.__name__)
+
+        self.get()
+        self.assertEqual(CountingView.calls, calls + 1)
+        return instance
+
+    def create_store(self):
+        return Store.objects.create(name='테스트 매장', owner=self.owner, address='서울', description='')
+
+    def create_tournament(self):
+        return Tournament.objects.create(name='테스트 토너먼트', start_time=timezone.now())
+
+    def test_cached_view_hits_until_change(self):
+        self.get()
+        self.get()
+        self.assertEqual(CountingView.calls, 1)
+
+    def test_notice_change_is_not_served_stale(self):
+        self.assertEqual(self.get()['notices'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notice.objects.create(title='공지', content='내용', author=self.admin)
+
+        self.assertEqual(self.get()['notices'], 1)
+
+    def test_version_not_bumped_before_commit(self):
+        before = get_model_versions(Notice)
+        with self.captureOnCommitCallbacks(execute=False):
+            Notice.objects.create(title='공지', content='내용', author=self.admin)
+        self.assertEqual(get_model_versions(Notice), before)
+
+    def test_tournament(self):
+        tournament = self.assert_bumps(Tournament, self.create_tournament)
+        self.assert_bumps(Tournament, lambda: tournament.save())
+        self.assert_bumps(Tournament, lambda: tournament.delete())
+
+    def test_store(self):
+        store = self.assert_bumps(Store, self.create_store)
+        self.assert_bumps(Store, lambda: store.save())
+
+    def test_banner(self):
+        store = self.create_store()
+        now = timezone.now()
+        banner = self.assert_bumps(Banner, lambda: Banner.objects.create(
+            store=store, image='', title='배너', start_date=now, end_date=now + timedelta(days=7),
+        ))
+        self.assert_bumps(Banner, lambda: banner.delete())
+
+    def test_notice(self):
+        notice = self.assert_bumps(Notice, lambda: Notice.objects.create(title='공지', content='내용', author=self.admin))
+        self.assert_bumps(Notice, lambda: notice.save())
+        self.assert_bumps(Notice, lambda: notice.delete())
+
+    def test_tournament_ticket_distribution(self):
+        store = self.create_store()
+        tournament = self.create_tournament()
+        distribution = self.assert_bumps(TournamentTicketDistribution, lambda: TournamentTicketDistribution.objects.create(
+            tournament=tournament, store=store, allocated_quantity=10, remaining_quantity=10,
+        ))
+        self.assert_bumps(TournamentTicketDistribution, lambda: distribution.delete())
+
+
+@override_settings(METRICS_MULTIPROCESS_DIR='')
+class MetricsAccessTests(SimpleTestCase):
+    """/metrics 토큰/DEBUG/프록시 헤더 접근 제한 확인"""
+
+    def get(self, **headers):
+        return self.client.get('/metrics', **headers)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token_required(self):
+        self.assertEqual(self.get().status_code, 403)
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_non_ascii_token_is_forbidden(self):
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer é').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='secret', DEBUG=True)
+    def test_token_required_even_in_debug(self):
+        self.assertEqual(self.get().status_code, 403)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_no_token_in_production_is_forbidden(self):
+        self.assertEqual(self.get().status_code, 403)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=True)
+    def test_no_token_in_debug_allows_local_requests_only(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('# TYPE asl_cache_requests_total counter', response.content.decode())
+
+        self.assertEqual(self.get(REMOTE_ADDR='10.0.0.1').status_code, 403)
+        self.assertEqual(self.get(HTTP_X_FORWARDED_FOR='203.0.113.1').status_code, 403)
+        self.assertEqual(self.get(HTTP_X_REAL_IP='203.0.113.1').status_code, 403)
+
+
+class MultiProcessStoreTests(SimpleTestCase):
+    """프로세스별 메트릭 파일 합산과 종료된 프로세스 값의 archive 보존 확인"""
+
+    # 존재하지 않는 프로세스 ID (리눅스 pid_max 최댓값보다 큼)
+    DEAD_PID = 2 ** 22 + 1
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.store = MultiProcessStore(self.directory, 'gunicorn')
+
+        self.requests = Counter('test_requests_total', '요청 수', ('method',), registry=None)
+        self.workers = Gauge('test_workers', '워커 수', registry=None)
+        self.latency = Histogram('test_latency_seconds', '응답 시간', buckets=(0.1, 1.0), registry=None)
+        self.recent = WindowCounter('test_recent', '최근 발생 수', window=60, slot=10, registry=None)
+
+    def snapshot(self, requests=0, workers=0, latency=(), recent=0):
+        for metric in (self.requests, self.workers, self.latency, self.recent):
+            metric.clear()
+        if requests:
+            self.requests.inc(requests, method='GET')
+        self.workers.set(workers)
+        for value in latency:
+            self.latency.observe(value)
+        if recent:
+            self.recent.inc(recent)
+        return {metric.name: metric.family() for metric in (self.requests, self.workers, self.latency, self.recent)}
+
+    def write(self, group, pid, families):
+        path = os.path.join(self.directory, f'{group}-{pid}-{time.time_ns()}.json')
+        self.store.write(families, path)
+        return path
+
+    def value(self, merged, name, key=()):
+        return merged[name]['samples'].get(key)
+
+    def test_sums_live_process_files(self):
+        self.write('gunicorn', os.getpid(), self.snapshot(requests=2, workers=1, latency=[0.05, 0.5]))
+        self.write('daphne', os.getpid(), self.snapshot(requests=3, workers=1, latency=[2.0], recent=4))
+
+        merged = self.store.collect()
+
+        self.assertEqual(self.value(merged, 'test_requests_total', ('GET',)), 5)
+        self.assertEqual(self.value(merged, 'test_workers'), 2)
+        self.assertEqual(self.value(merged, 'test_latency_seconds'), [1, 1, 1, 2.55])
+        self.assertEqual(sum(self.value(merged, 'test_recent').values()), 4)
+
+    def test_ignores_unrelated_files(self):
+        self.store.write(self.snapshot(requests=7), os.path.join(self.directory, 'other.json'))
+        self.store.write(self.snapshot(requests=7), os.path.join(self.directory, 'gunicorn-1.json'))
+
+        self.assertEqual(self.store.collect(), {})
+
+    def test_dead_process_is_archived_per_group(self):
+        live = self.write('gunicorn', os.getpid(), self.snapshot(requests=1, workers=1))
+        dead_gunicorn = self.write('gunicorn', self.DEAD_PID, self.snapshot(requests=2, workers=1, latency=[0.5]))
+        dead_daphne = self.write('daphne', self.DEAD_PID, self.snapshot(requests=4, workers=1))
+
+        merged = self.store.collect()
+
+        # 종료된 프로세스의 Counter/Histogram은 보존하고 Gauge는 제외
+        self.assertEqual(self.value(merged, 'test_requests_total', ('GET',)), 7)
+        self.assertEqual(self.value(merged, 'test_workers'), 1)
+        self.assertEqual(self.value(merged, 'test_latency_seconds'), [0, 1, 0, 0.5])
+
+        self.assertTrue(os.path.exists(live))
+        self.assertFalse(os.path.exists(dead_gunicorn))
+        self.assertFalse(os.path.exists(dead_daphne))
+        self.assertEqual(
+            self.store.read(self.store.archive_path('gunicorn'))['test_requests_total']['samples'], [[['GET'], 2]],
+        )
+        self.assertEqual(
+            self.store.read(self.store.archive_path('daphne'))['test_requests_total']['samples'], [[['GET'], 4]],
+        )
+
+    def test_archive_accumulates(self):
+        self.write('gunicorn', self.DEAD_PID, self.snapshot(requests=2))
+        self.store.collect()
+        self.write('gunicorn', self.DEAD_PID, self.snapshot(requests=3))
+
+        merged = self.store.collect()
+
+        self.assertEqual(self.value(merged, 'test_requests_total', ('GET',)), 5)
+        self.assertEqual(
+            [os.path.basename(path) for path in self.store._archive_files()], ['archive-gunicorn.json'],
+        )
+
+    def test_archive_drops_expired_window_slots(self):
+        families = self.snapshot(recent=3)
+        families['test_recent']['samples'][0][1]['1'] = 5  # 창 밖의 오래된 slot
+        self.write('gunicorn', self.DEAD_PID, families)
+
+        merged = self.store.collect()
+
+        self.assertEqual(sum(self.value(merged, 'test_recent').values()), 3)
+
+
+def with_replica_alias(test):
+    """DATABASES에 replica 별칭을 추가합니다. (라우터는 별칭 존재 여부만 확인하므로 실제 연결은 만들지 않음)"""
+    databases = {**settings.DATABASES, REPLICA: {**settings.DATABASES[PRIMARY], 'TEST': {'MIRROR': PRIMARY}}}
+    with warnings.catch_warnings():
+        # DATABASES 변경 시 Django가 내는 경고 무시
+        warnings.simplefilter('ignore', UserWarning)
+        test.enterContext(override_settings(DATABASES=databases))
+
+
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    """조회는 replica, 쓰기/트랜잭션 안의 조회/고정된 요청은 primary로 보내는지 확인"""
+
+    databases = {PRIMARY}
+
+    def setUp(self):
+        with_replica_alias(self)
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.router.db_for_read(User), REPLICA)
+
+    def test_writes_go_to_primary(self):
+        self.assertEqual(self.router.db_for_write(User), PRIMARY)
+
+    def test_reads_in_atomic_go_to_primary(self):
+        with transaction.atomic():
+            self.assertEqual(self.router.db_for_read(User), PRIMARY)
+        self.assertEqual(self.router.db_for_read(User), REPLICA)
+
+    def test_pinned_reads_go_to_primary(self):
+        token = pin_to_primary()
+        try:
+            self.assertEqual(self.router.db_for_read(User), PRIMARY)
+        finally:
+            unpin(token)
+        self.assertEqual(self.router.db_for_read(User), REPLICA)
+
+    def test_migrate_only_on_primary(self):
+        self.assertTrue(self.router.allow_migrate(PRIMARY, 'accounts'))
+        self.assertFalse(self.router.allow_migrate(REPLICA, 'accounts'))
+
+
+class PrimaryOnlyRouterTests(SimpleTestCase):
+    """replica 별칭이 없으면 모든 조회가 primary로 가는지 확인"""
+
+    @skipUnless(REPLICA not in settings.DATABASES, 'replica가 설정된 환경')
+    def test_without_replica_alias(self):
+        self.assertEqual(PrimaryReplicaRouter().db_for_read(User), PRIMARY)
+
+
+def read_database_view(request):
+    """요청 처리 중 조회가 향할 DB 별칭을 응답하는 뷰 (status 파라미터로 응답 코드 지정)"""
+    return HttpResponse(PrimaryReplicaRouter().db_for_read(User), status=int(request.GET.get('status', 200)))
+
+
+@override_settings(REPLICA_PIN_SECONDS=5)
+class ReplicaPinMiddlewareTests(SimpleTestCase):
+    """쓰기 요청 후 쿠키/헤더로 primary 고정이 전달되고, 만료되면 replica로 돌아가는지 확인"""
+
+    def setUp(self):
+        with_replica_alias(self)
+        self.factory = RequestFactory()
+        self.middleware = ReplicaPinMiddleware(read_database_view)
+
+    def call(self, method='get', path='/', cookie=None, **headers):
+        request = getattr(self.factory, method)(path, **headers)
+        if cookie is not None:
+            request.COOKIES[PIN_COOKIE_NAME] = cookie
+        return self.middleware(request)
+
+    def test_safe_request_reads_replica(self):
+        response = self.call()
+
+        self.assertEqual(response.content.decode(), REPLICA)
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+        self.assertFalse(response.has_header(PIN_HEADER_NAME))
+
+    def test_write_request_reads_primary_and_sets_pin(self):
+        response = self.call('post')
+
+        self.assertEqual(response.content.decode(), PRIMARY)
+        cookie = response.cookies[PIN_COOKIE_NAME]
+        self.assertEqual(cookie['max-age'], 5)
+        self.assertEqual(cookie.value, response[PIN_HEADER_NAME])
+        self.assertGreater(float(cookie.value), time.time())
+
+    def test_failed_write_does_not_pin(self):
+        response = self.call('post', '/?status=400')
+
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+        self.assertFalse(response.has_header(PIN_HEADER_NAME))
+
+    def test_pin_cookie_is_honoured(self):
+        pin = self.call('post').cookies[PIN_COOKIE_NAME].value
+
+        self.assertEqual(self.call(cookie=pin).content.decode(), PRIMARY)
+
+    def test_pin_header_is_honoured(self):
+        pin = self.call('post')[PIN_HEADER_NAME]
+
+        self.assertEqual(self.call(HTTP_X_DB_PIN=pin).content.decode(), PRIMARY)
+
+    def test_expired_or_invalid_pin_is_ignored(self):
+        expired = f'{time.time() - 1:.3f}'
+
+        self.assertEqual(self.call(cookie=expired).content.decode(), REPLICA)
+        self.assertEqual(self.call(HTTP_X_DB_PIN=expired).content.decode(), REPLICA)
+        self.assertEqual(self.call(cookie='invalid').content.decode(), REPLICA)
+
+    def test_pin_is_released_after_request(self):
+        self.call('post')
+
+        self.assertEqual(PrimaryReplicaRouter().db_for_read(User), REPLICA)
+
+    def test_async_request(self):
+        async def async_view(request):
+            return read_database_view(request)
+
+        middleware = ReplicaPinMiddleware(async_view)
+        response = async_to_sync(middleware)(self.factory.post('/'))
+
+        self.assertEqual(response.content.decode(), PRIMARY)
+        self.assertIn(PIN_COOKIE_NAME, response.cookies)
+
+
+@skipUnless(REPLICA in settings.DATABASES, 'DB_REPLICA_NAME/DB_REPLICA_HOST로 replica를 설정하면 실행')
+class ReplicaDatabaseTests(TransactionTestCase):
+    """실제 replica 연결로 조회가 실행되는지 확인 (테스트에서는 replica가 default 테스트 DB를 가리킴)"""
+
+    # 건너뛰는 경우에도 테스트 러너가 별칭을 확인하므로 설정된 별칭만 지정
+    databases = {PRIMARY, REPLICA} & set(settings.DATABASES)
+
+    def test_query_runs_on_replica(self):
+        with CaptureQueriesContext(connections[REPLICA]) as replica, CaptureQueriesContext(connections[PRIMARY]) as primary:
+            list(User.objects.all())
+
+        self.assertEqual(len(replica.captured_queries), 1)
+        self.assertEqual(len(primary.captured_queries), 0)
+
+    def test_query_in_atomic_runs_on_primary(self):
+        with CaptureQueriesContext(connections[REPLICA]) as replica:
+            with transaction.atomic():
+                list(User.objects.all())
+
+        self.assertEqual(len(replica.captured_queries), 0)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework import permissions
@@ -7,7 +7,8 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from views.store_views import StoreViewSet, search_user_by_phone, register_player_to_tournament, grant_seat_ticket, get_user_ticket_status
 from views.tournament_views import TournamentViewSet
-from views.user_views import UserViewSet
+from views.user_views import UserViewSet, qr_code_image
+from views.stats_views import metrics, route_stats
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -34,6 +35,7 @@ urlpatterns = [
     # QR 코드 관련 API
     path('api/v1/user/my-qr-code/', UserViewSet.as_view({'get': 'get_my_qr_code'}), name='user_my_qr_code'),  # 내 QR 코드 조회
     path('api/v1/user/scan-qr-code/', UserViewSet.as_view({'post': 'scan_qr_code'}), name='user_scan_qr_code'),  # QR 코드 스캔
+    re_path(r'^api/v1/user/qr/(?P<user_id>\d+)/(?P<qr_code_uuid>[0-9a-f-]{36})\.(?P<fmt>png|svg)$', qr_code_image, name='user_qr_code_image'),  # QR 코드 이미지 렌더링
 
     path('api/v1/store/info/', StoreViewSet.as_view({'get': 'current_store', 'put': 'update_current_store'})),
     path('api/v1/store/debug/', StoreViewSet.as_view({'get': 'debug_user'})),
@@ -44,6 +46,8 @@ urlpatterns = [
     path('api/v1/store/user-tickets/', get_user_ticket_status, name='get_user_ticket_status'),  # 사용자 좌석권 현황
     path('api/v1/store/tournaments/', TournamentViewSet.as_view({'get': 'store_tournaments'})),
     path('api/v1/store/tournaments/<int:pk>/cancel/', TournamentViewSet.as_view({'post': 'cancel_tournament'})),
+    path('api/v1/stats/routes/', route_stats, name='route_stats'),  # 경로별 요청 통계 (관리자 전용)
+    path('metrics', metrics, name='metrics'),  # Prometheus 텍스트 형식 메트릭
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) 
\ No newline at end of file
@@ -1,3 +1,64 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from stores.models import Banner, Store
+
+User = get_user_model()
+
+
+class ActiveBannerConditionalGetTests(TestCase):
+    """활성 배너 목록이 변경되지 않았으면 304를 반환하고, 변경되면 새 ETag를 반환하는지 확인"""
+
+    url = '/api/v1/banners/active/'
+
+    def setUp(self):
+        owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        self.store = Store.objects.create(name='테스트 매장', owner=owner, address='서울', description='')
+
+        now = timezone.now()
+        self.banner = Banner.objects.create(
+            store=self.store, image='banner_images/a.png', title='내 배너',
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=7),
+        )
+        self.client = APIClient()
+
+    def revalidate(self):
+        etag = self.client.get(self.url)['ETag']
+        return etag, self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_returns_304(self):
+        etag, response = self.revalidate()
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_banner_update_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.banner.title = '수정된 배너'
+        self.banner.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_deactivated_banner_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        Banner.objects.filter(pk=self.banner.pk).update(is_active=False)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_store_rename_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.store.name = '새 매장명'
+        self.store.save()
 
-# Create your tests here.
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['store_name'], '새 매장명')
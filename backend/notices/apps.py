@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class NoticesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'notices'
+
+    def ready(self):
+        """앱이 로드될 때 캐시 버전 시그널을 임포트합니다."""
+        import notices.signals  # noqa F401
@@ -30,8 +30,9 @@ class NoticeListSerializer(serializers.ModelSerializer):
         """사용자가 이 공지사항을 읽었는지 확인"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            # 목록 API는 토큰 클레임 사용자(TokenUser)를 사용하므로 ID로 조회
             return NoticeReadStatus.objects.filter(
-                user=request.user, 
+                user_id=request.user.id, 
                 notice=obj
             ).exists()
         return False
@@ -1,3 +1,113 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from notices.models import Notice, NoticeReadStatus
+
+User = get_user_model()
+
+
+class NoticeListConditionalGetTests(TestCase):
+    """
+    공지사항 목록이 변경되지 않았으면 304를 반환하고,
+    공지 수정/조회수/사용자별 읽음 상태가 바뀌면 새 ETag를 반환하는지 확인
+    """
+
+    url = '/api/v1/notices/'
+
+    def setUp(self):
+        admin = User.objects.create_user(username='admin', phone='010-9999-0000', password='password', role='ADMIN')
+        self.user = User.objects.create_user(username='user', phone='010-1111-2222', password='password', role='USER')
+        self.other_user = User.objects.create_user(username='other', phone='010-3333-4444', password='password', role='USER')
+
+        self.notice = Notice.objects.create(title='전체 공지', content='내용', author=admin)
+        self.member_notice = Notice.objects.create(
+            title='회원 공지', content='내용', author=admin, notice_type='MEMBER_ONLY',
+        )
+
+        self.client = self.client_for(self.user)
+        self.anonymous_client = APIClient()
+
+    def client_for(self, user):
+        # 목록 API는 토큰 클레임 사용자를 사용하므로 실제 JWT로 인증
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def revalidate(self, client):
+        etag = client.get(self.url)['ETag']
+        return etag, client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def assert_changed(self, client, etag):
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return {item['id']: item for item in response.json()['results']}
+
+    def test_unchanged_returns_304(self):
+        for client in (self.client, self.anonymous_client):
+            etag, response = self.revalidate(client)
+
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(response.content, b'')
+
+    def test_etag_differs_per_user(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client_for(self.other_user).get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.anonymous_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_notice_update_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.notice.title = '수정된 공지'
+        self.notice.save()
+
+        notices = self.assert_changed(self.client, etag)
+        self.assertEqual(notices[self.notice.id]['title'], '수정된 공지')
+
+    def test_view_count_changes_etag(self):
+        etag = self.anonymous_client.get(self.url)['ETag']
+        self.anonymous_client.get(f'{self.url}{self.notice.id}/')
+
+        notices = self.assert_changed(self.anonymous_client, etag)
+        self.assertEqual(notices[self.notice.id]['view_count'], 1)
+
+    def test_mark_read_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.post(f'{self.url}{self.notice.id}/mark-read/').status_code, 201)
+
+        notices = self.assert_changed(self.client, etag)
+        self.assertTrue(notices[self.notice.id]['is_read'])
+        self.assertFalse(notices[self.member_notice.id]['is_read'])
+
+    def test_detail_view_marks_read_and_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.get(f'{self.url}{self.member_notice.id}/')
+
+        notices = self.assert_changed(self.client, etag)
+        self.assertTrue(notices[self.member_notice.id]['is_read'])
+        self.assertEqual(notices[self.member_notice.id]['view_count'], 1)
+
+    def test_other_user_read_keeps_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        # 조회수가 바뀌지 않도록 읽음 상태만 직접 생성
+        NoticeReadStatus.objects.create(user=self.other_user, notice=self.notice)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        other_client = self.client_for(self.other_user)
+        notices = {item['id']: item for item in other_client.get(self.url).json()['results']}
+        self.assertTrue(notices[self.notice.id]['is_read'])
+
+    def test_unread_after_read_status_deleted(self):
+        NoticeReadStatus.objects.create(user=self.user, notice=self.notice)
+        etag = self.client.get(self.url)['ETag']
+        NoticeReadStatus.objects.filter(user=self.user).delete()
+
+        notices = self.assert_changed(self.client, etag)
+        self.assertFalse(notices[self.notice.id]['is_read'])
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class SeatsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'seats'
-    verbose_name = '좌석권 관리' 
\ No newline at end of file
+    verbose_name = '좌석권 관리'
+
+    def ready(self):
+        """앱이 로드될 때 변경 이벤트 전송/캐시 버전/거래 메트릭 시그널을 임포트합니다."""
+        import seats.signals  # noqa F401
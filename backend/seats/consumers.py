@@ -0,0 +1,60 @@
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from seats.models import TournamentTicketDistribution
+from seats.realtime import store_group, tournament_group
+from stores.resolver import get_store_for_owner
+
+# 구독 권한이 없을 때 사용하는 종료 코드
+CLOSE_FORBIDDEN = 4403
+
+
+@database_sync_to_async
+def can_subscribe(user, store_id=None, tournament_id=None):
+    """
+    구독 권한 확인
+    - 본사 관리자: 모든 매장/토너먼트
+    - 매장 관리자: 자신의 매장, 자신의 매장에 좌석권이 분배된 토너먼트
+    (매장 관리자도 is_staff이므로 본사 관리자는 슈퍼유저/ADMIN 역할로 구분)
+    """
+    if not user.is_authenticated:
+        return False
+    if user.is_superuser or getattr(user, 'role', None) == 'ADMIN':
+        return True
+    if not getattr(user, 'is_store_owner', False):
+        return False
+    store = get_store_for_owner(user.pk)
+    if store is None:
+        return False
+    if store_id is not None:
+        return store.id == store_id
+    return TournamentTicketDistribution.objects.filter(store_id=store.id, tournament_id=tournament_id).exists()
+
+
+class ChangeEventConsumer(AsyncJsonWebsocketConsumer):
+    """
+    매장(ws/stores/<store_id>/) 또는 토너먼트(ws/tournaments/<tournament_id>/)의
+    좌석권/분배/참가자 변경 이벤트를 전달하는 컨슈머 (클라이언트 -> 서버 메시지는 사용하지 않음)
+    """
+
+    group_name = None
+
+    async def connect(self):
+        kwargs = self.scope['url_route']['kwargs']
+        store_id = kwargs.get('store_id')
+        tournament_id = kwargs.get('tournament_id')
+
+        if not await can_subscribe(self.scope.get('user'), store_id=store_id, tournament_id=tournament_id):
+            await self.close(code=CLOSE_FORBIDDEN)
+            return
+
+        self.group_name = store_group(store_id) if store_id is not None else tournament_group(tournament_id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if self.group_name:
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def change_event(self, message):
+        await self.send_json(message['payload'])
@@ -0,0 +1,83 @@
+"""
+좌석권/분배/토너먼트 참가자 변경 이벤트 실시간 전송
+
+변경이 커밋되면 매장 그룹(store.<id>)과 토너먼트 그룹(tournament.<id>)에
+작은 이벤트를 보내고, 화면은 이벤트를 받은 뒤 필요한 목록만 다시 불러옵니다.
+(seats.consumers.ChangeEventConsumer 참고)
+"""
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# 컨슈머에서 이벤트를 처리하는 메서드 이름 (change_event)
+MESSAGE_TYPE = 'change.event'
+
+
+def store_group(store_id):
+    return f'store.{store_id}'
+
+
+def tournament_group(tournament_id):
+    return f'tournament.{tournament_id}'
+
+
+def seat_ticket_event(ticket, action):
+    return {
+        'event': f'seat_ticket.{action}',
+        'id': ticket.pk,
+        'tournament': ticket.tournament_id,
+        'store': ticket.store_id,
+        'user': ticket.user_id,
+        'status': ticket.status,
+    }
+
+
+def distribution_event(distribution, action):
+    return {
+        'event': f'distribution.{action}',
+        'id': distribution.pk,
+        'tournament': distribution.tournament_id,
+        'store': distribution.store_id,
+        'allocated': distribution.allocated_quantity,
+        'remaining': distribution.remaining_quantity,
+        'distributed': distribution.distributed_quantity,
+    }
+
+
+def tournament_player_event(player, action):
+    return {
+        'event': f'tournament_player.{action}',
+        'id': player.pk,
+        'tournament': player.tournament_id,
+        'user': player.user_id,
+    }
+
+
+def send_event(payload):
+    """이벤트를 관련된 매장/토너먼트 그룹에 즉시 전송합니다."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    groups = []
+    if payload.get('store'):
+        groups.append(store_group(payload['store']))
+    if payload.get('tournament'):
+        groups.append(tournament_group(payload['tournament']))
+
+    message = {'type': MESSAGE_TYPE, 'payload': payload}
+    for group in groups:
+        try:
+            async_to_sync(channel_layer.group_send)(group, message)
+        except Exception as e:
+            # 실시간 전송 실패가 저장 요청을 실패시키지 않도록 기록만 함
+            logger.warning("변경 이벤트 전송 실패 (%s): %s", group, e)
+
+
+def publish(payload):
+    """현재 트랜잭션이 커밋된 뒤 이벤트를 전송합니다. (롤백되면 전송하지 않음)"""
+    transaction.on_commit(lambda: send_event(payload))
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from seats.consumers import ChangeEventConsumer
+
+websocket_urlpatterns = [
+    path('ws/stores/<int:store_id>/', ChangeEventConsumer.as_asgi()),
+    path('ws/tournaments/<int:tournament_id>/', ChangeEventConsumer.as_asgi()),
+]
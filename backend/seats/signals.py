@@ -0,0 +1,60 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from asl_holdem.cache import bump_model_version_on_commit
+from asl_holdem.metrics import Counter, WindowCounter
+from seats.models import SeatTicket, SeatTicketTransaction, TournamentTicketDistribution
+from seats.realtime import distribution_event, publish, seat_ticket_event, tournament_player_event
+from tournaments.models import TournamentPlayer
+
+
+SEAT_TICKET_TRANSACTIONS = Counter(
+    'asl_seat_ticket_transactions_total', '좌석권 거래 수 (지급/사용/만료/취소/환불)', ('type',),
+)
+SEAT_TICKET_TRANSACTIONS_LAST_MINUTE = WindowCounter(
+    'asl_seat_ticket_transactions_last_minute', '최근 1분간 좌석권 거래 수', ('type',), window=60,
+)
+
+
+def _action(kwargs):
+    if 'created' not in kwargs:
+        return 'deleted'
+    return 'created' if kwargs['created'] else 'updated'
+
+
+@receiver([post_save, post_delete], sender=SeatTicket)
+def publish_seat_ticket_change(sender, instance, **kwargs):
+    """좌석권 지급/사용/취소를 매장과 토너먼트 화면에 알립니다."""
+    publish(seat_ticket_event(instance, _action(kwargs)))
+
+
+@receiver([post_save, post_delete], sender=TournamentTicketDistribution)
+def publish_distribution_change(sender, instance, **kwargs):
+    """좌석권 분배량/보유수량 변경을 매장과 토너먼트 화면에 알립니다."""
+    publish(distribution_event(instance, _action(kwargs)))
+
+
+@receiver([post_save, post_delete], sender=TournamentPlayer)
+def publish_tournament_player_change(sender, instance, **kwargs):
+    """토너먼트 참가자 등록/취소를 토너먼트 화면에 알립니다."""
+    publish(tournament_player_event(instance, _action(kwargs)))
+
+
+@receiver([post_save, post_delete], sender=TournamentTicketDistribution)
+def bump_cache_version(sender, **kwargs):
+    """좌석권 분배가 저장/삭제되면 캐시 버전을 올립니다. (asl_holdem.cache)"""
+    bump_model_version_on_commit(sender)
+
+
+@receiver(post_save, sender=SeatTicketTransaction)
+def count_seat_ticket_transaction(sender, instance, created, **kwargs):
+    """좌석권 거래(지급/사용 등)를 커밋 후 메트릭에 기록합니다."""
+    if not created:
+        return
+
+    def record():
+        SEAT_TICKET_TRANSACTIONS.inc(type=instance.transaction_type)
+        SEAT_TICKET_TRANSACTIONS_LAST_MINUTE.inc(type=instance.transaction_type)
+
+    transaction.on_commit(record)
@@ -0,0 +1,136 @@
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.websocket import JWTAuthMiddleware
+from seats.consumers import CLOSE_FORBIDDEN
+from seats.models import TournamentTicketDistribution
+from seats.routing import websocket_urlpatterns
+from stores.models import Store
+from stores.resolver import owner_store_cache
+from tournaments.models import Tournament
+
+User = get_user_model()
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class ChangeEventConsumerTests(TransactionTestCase):
+    """
+    매장/토너먼트 변경 이벤트 구독 권한과 이벤트 전달 확인
+    (database_sync_to_async가 연결을 정리하므로 트랜잭션으로 감싸는 TestCase 대신 TransactionTestCase 사용)
+    """
+
+    def setUp(self):
+        owner_store_cache.clear()
+        self.application = JWTAuthMiddleware(URLRouter(websocket_urlpatterns))
+
+        self.admin = User.objects.create_user(username='admin', phone='010-9999-0000', password='password', role='ADMIN')
+        self.owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        other_owner = User.objects.create_user(username='other_owner', phone='010-3333-4444', password='password', role='STORE_OWNER')
+        self.no_store_owner = User.objects.create_user(username='no_store', phone='010-5555-6666', password='password', role='STORE_OWNER')
+        self.player = User.objects.create_user(username='player', phone='010-7777-8888', password='password', role='USER')
+
+        self.store = Store.objects.create(name='테스트 매장', owner=self.owner, address='서울', description='')
+        self.other_store = Store.objects.create(name='다른 매장', owner=other_owner, address='부산', description='')
+
+        now = timezone.now()
+        self.tournament = Tournament.objects.create(name='배분된 토너먼트', start_time=now)
+        self.other_tournament = Tournament.objects.create(name='다른 매장 토너먼트', start_time=now)
+        self.distribution = TournamentTicketDistribution.objects.create(
+            tournament=self.tournament, store=self.store, allocated_quantity=10, remaining_quantity=10,
+        )
+        TournamentTicketDistribution.objects.create(
+            tournament=self.other_tournament, store=self.other_store, allocated_quantity=10, remaining_quantity=10,
+        )
+
+    def communicator(self, path, user=None):
+        if user is not None:
+            path = f'{path}?token={AccessToken.for_user(user)}'
+        return WebsocketCommunicator(self.application, path)
+
+    def assert_connects(self, path, user):
+        async def run():
+            communicator = self.communicator(path, user)
+            connected, _ = await communicator.connect()
+            await communicator.disconnect()
+            return connected
+
+        self.assertTrue(async_to_sync(run)(), path)
+
+    def assert_rejected(self, path, user=None):
+        async def run():
+            communicator = self.communicator(path, user)
+            result = await communicator.connect()
+            await communicator.disconnect()
+            return result
+
+        self.assertEqual(async_to_sync(run)(), (False, CLOSE_FORBIDDEN), path)
+
+    def update_distribution(self):
+        self.distribution.remaining_quantity = 7
+        self.distribution.distributed_quantity = 3
+        self.distribution.save()
+
+    def receive_after_update(self, path, user):
+        async def run():
+            communicator = self.communicator(path, user)
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            await database_sync_to_async(self.update_distribution)()
+            event = await communicator.receive_json_from(timeout=5)
+            await communicator.disconnect()
+            return event
+
+        return async_to_sync(run)()
+
+    def test_store_event_delivery(self):
+        event = self.receive_after_update(f'/ws/stores/{self.store.id}/', self.owner)
+
+        self.assertEqual(event['event'], 'distribution.updated')
+        self.assertEqual(event['id'], self.distribution.id)
+        self.assertEqual(event['remaining'], 7)
+
+    def test_tournament_event_delivery(self):
+        event = self.receive_after_update(f'/ws/tournaments/{self.tournament.id}/', self.owner)
+
+        self.assertEqual(event['event'], 'distribution.updated')
+        self.assertEqual(event['tournament'], self.tournament.id)
+
+    def test_no_event_from_other_groups(self):
+        async def run():
+            communicator = self.communicator(f'/ws/stores/{self.other_store.id}/', self.admin)
+            await communicator.connect()
+            await database_sync_to_async(self.update_distribution)()
+            nothing = await communicator.receive_nothing(timeout=0.2)
+            await communicator.disconnect()
+            return nothing
+
+        self.assertTrue(async_to_sync(run)())
+
+    def test_admin_subscribes_to_any_group(self):
+        self.assert_connects(f'/ws/stores/{self.other_store.id}/', self.admin)
+        self.assert_connects(f'/ws/tournaments/{self.other_tournament.id}/', self.admin)
+
+    def test_store_owner_rejected_for_other_store(self):
+        self.assert_rejected(f'/ws/stores/{self.other_store.id}/', self.owner)
+
+    def test_store_owner_limited_to_distributed_tournaments(self):
+        self.assert_connects(f'/ws/tournaments/{self.tournament.id}/', self.owner)
+        self.assert_rejected(f'/ws/tournaments/{self.other_tournament.id}/', self.owner)
+
+    def test_store_owner_without_store_rejected(self):
+        self.assert_rejected(f'/ws/stores/{self.store.id}/', self.no_store_owner)
+        self.assert_rejected(f'/ws/tournaments/{self.tournament.id}/', self.no_store_owner)
+
+    def test_player_rejected(self):
+        self.assert_rejected(f'/ws/stores/{self.store.id}/', self.player)
+        self.assert_rejected(f'/ws/tournaments/{self.tournament.id}/', self.player)
+
+    def test_anonymous_rejected(self):
+        self.assert_rejected(f'/ws/stores/{self.store.id}/')
+        self.assert_rejected(f'/ws/stores/{self.store.id}/?token=invalid')
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class StoresConfig(AppConfig):
+    name = 'stores'
+
+    def ready(self):
+        """앱이 로드될 때 캐시 버전/매장 조회 캐시 시그널을 임포트합니다."""
+        import stores.signals  # noqa F401
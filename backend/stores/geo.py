@@ -0,0 +1,86 @@
+"""
+매장 위치 기반 검색 유틸리티
+
+인덱스가 있는 latitude/longitude 컬럼에 대해 바운딩 박스로 후보를 먼저 좁힌 뒤,
+하버사인(haversine) 공식으로 정확한 거리를 계산하여 가까운 순으로 정렬합니다.
+"""
+import math
+
+from django.db.models import F, FloatField
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+
+# 지구 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# 주변 매장 검색 반경 기본값/최대값 (km)
+DEFAULT_RADIUS_KM = 5
+MAX_RADIUS_KM = 50
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    중심 좌표에서 반경 radius_km를 포함하는 위경도 사각형을 반환합니다.
+
+    Returns:
+        tuple: (min_lat, max_lat, min_lng, max_lng)
+    """
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat = max(-90.0, latitude - lat_delta)
+    max_lat = min(90.0, latitude + lat_delta)
+
+    # 극지방에서는 경도 폭이 무한히 커지므로 전체 경도를 사용
+    cos_lat = math.cos(math.radians(latitude))
+    if max_lat >= 90.0 or min_lat <= -90.0 or cos_lat < 1e-6:
+        return min_lat, max_lat, -180.0, 180.0
+
+    lng_delta = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    min_lng = longitude - lng_delta
+    max_lng = longitude + lng_delta
+    if min_lng < -180.0 or max_lng > 180.0:
+        # 날짜변경선을 넘는 경우 경도 조건은 생략 (위도 조건만으로 후보 축소)
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, min_lng, max_lng
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 거리(km)를 계산합니다."""
+    d_lat = math.radians(lat2 - lat1)
+    d_lng = math.radians(lng2 - lng1)
+    a = (math.sin(d_lat / 2) ** 2 +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_expression(latitude, longitude, lat_field='latitude', lng_field='longitude'):
+    """중심 좌표로부터 각 행까지의 거리(km)를 계산하는 DB 표현식을 반환합니다."""
+    row_lat = Radians(Cast(F(lat_field), FloatField()))
+    row_lng = Radians(Cast(F(lng_field), FloatField()))
+    center_lat = math.radians(latitude)
+    center_lng = math.radians(longitude)
+
+    a = (
+        Power(Sin((row_lat - center_lat) / 2), 2) +
+        math.cos(center_lat) * Cos(row_lat) * Power(Sin((row_lng - center_lng) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def filter_nearby(queryset, latitude, longitude, radius_km):
+    """
+    반경 radius_km 이내의 매장만 남기고 distance_km를 주석으로 추가하여
+    가까운 순으로 정렬한 쿼리셋을 반환합니다.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+
+    queryset = queryset.filter(
+        latitude__isnull=False,
+        longitude__isnull=False,
+        latitude__gte=min_lat,
+        latitude__lte=max_lat,
+    )
+    if (min_lng, max_lng) != (-180.0, 180.0):
+        queryset = queryset.filter(longitude__gte=min_lng, longitude__lte=max_lng)
+
+    return queryset.annotate(
+        distance_km=haversine_expression(latitude, longitude)
+    ).filter(distance_km__lte=radius_km).order_by('distance_km', 'id')
@@ -0,0 +1,185 @@
+"""
+매장/배너 이미지 리사이즈본(rendition) 생성 유틸리티
+
+업로드된 원본 이미지 옆에 고정 너비의 WebP/JPEG 리사이즈본을 저장하고,
+모델의 image_renditions 필드에 경로 맵을 기록합니다.
+클라이언트는 시리얼라이저가 제공하는 srcset 맵을 사용하여
+화면 크기에 맞는 이미지만 내려받을 수 있습니다.
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from asl_holdem.cache import bump_model_version_on_commit
+
+logger = logging.getLogger(__name__)
+
+# 생성할 리사이즈본 너비 (모바일 / 태블릿 / 데스크톱)
+RENDITION_WIDTHS = (320, 640, 1024)
+
+# 포맷별 저장 옵션 (PIL 포맷명, 확장자, 저장 옵션)
+RENDITION_FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def rendition_name(name, width, fmt):
+    """원본 경로 옆에 위치할 리사이즈본 경로를 반환합니다. (예: banner_images/a_w640.webp)"""
+    base, _ = os.path.splitext(name)
+    extension = RENDITION_FORMATS[fmt][1]
+    return f'{base}_w{width}.{extension}'
+
+
+def _target_widths(original_width):
+    """원본보다 큰 너비로 확대하지 않도록 생성 대상 너비를 결정합니다."""
+    widths = [width for width in RENDITION_WIDTHS if width < original_width]
+    return widths or [original_width]
+
+
+def _encode(image, fmt):
+    """이미지를 지정한 포맷으로 인코딩하여 bytes로 반환합니다."""
+    pil_format, _, options = RENDITION_FORMATS[fmt]
+    if fmt == 'jpeg' or image.mode not in ('RGB', 'RGBA'):
+        # JPEG은 알파 채널을 지원하지 않으므로 RGB로 변환
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def render_renditions(name, storage=None):
+    """
+    원본 이미지로부터 리사이즈본을 생성하여 저장합니다.
+
+    Args:
+        name (str): 스토리지 기준 원본 이미지 경로
+        storage: 파일 스토리지 (기본값: default_storage)
+
+    Returns:
+        dict: {'source': 원본 경로, 'width': 원본 너비,
+               'webp': {'320': 경로, ...}, 'jpeg': {'320': 경로, ...}}
+    """
+    storage = storage or default_storage
+
+    with storage.open(name, 'rb') as source_file:
+        image = Image.open(source_file)
+        image.load()
+
+    # 휴대폰 사진의 EXIF 회전 정보를 반영
+    image = ImageOps.exif_transpose(image)
+    original_width, original_height = image.size
+
+    renditions = {'source': name, 'width': original_width}
+    for fmt in RENDITION_FORMATS:
+        renditions[fmt] = {}
+
+    for width in _target_widths(original_width):
+        height = max(1, round(original_height * width / original_width))
+        resized = image if width == original_width else image.resize((width, height), Image.LANCZOS)
+
+        for fmt in RENDITION_FORMATS:
+            path = rendition_name(name, width, fmt)
+            if storage.exists(path):
+                storage.delete(path)
+            saved_path = storage.save(path, ContentFile(_encode(resized, fmt)))
+            renditions[fmt][str(width)] = saved_path
+
+    return renditions
+
+
+def _rendition_paths(renditions):
+    """리사이즈본 맵에 기록된 파일 경로 집합"""
+    return {path for fmt in RENDITION_FORMATS for path in (renditions or {}).get(fmt, {}).values()}
+
+
+def delete_renditions(renditions, storage=None, keep=None):
+    """
+    기록된 리사이즈본 파일들을 삭제합니다. (원본은 삭제하지 않음)
+
+    keep에 새로 생성한 리사이즈본 맵을 넘기면 그 맵에 있는 경로는 남깁니다.
+    확장자만 다른 원본으로 교체하면(a.jpg -> a.png) 리사이즈본 경로가 같으므로 방금 만든 파일이 지워지지 않게 합니다.
+    """
+    storage = storage or default_storage
+    for path in sorted(_rendition_paths(renditions) - _rendition_paths(keep)):
+        try:
+            storage.delete(path)
+        except OSError as e:
+            logger.warning("리사이즈본 삭제 실패: %s (%s)", path, e)
+
+
+def needs_renditions(instance):
+    """현재 이미지에 대한 리사이즈본이 아직 생성되지 않았는지 확인합니다."""
+    if not instance.image:
+        return False
+    return (instance.image_renditions or {}).get('source') != instance.image.name
+
+
+def refresh_renditions(instance):
+    """
+    모델 인스턴스의 이미지가 바뀌었으면 리사이즈본을 다시 생성하고
+    image_renditions 필드만 업데이트합니다. (save() 재호출 방지)
+    """
+    old_renditions = instance.image_renditions or {}
+
+    if not instance.image:
+        if old_renditions:
+            delete_renditions(old_renditions)
+            _save_renditions(instance, {})
+        return instance.image_renditions
+
+    if not needs_renditions(instance):
+        return old_renditions
+
+    try:
+        renditions = render_renditions(instance.image.name, instance.image.storage)
+    except Exception as e:
+        # 리사이즈본 생성에 실패해도 원본 이미지 저장은 유지
+        logger.error("리사이즈본 생성 실패 (%s): %s", instance.image.name, e)
+        return old_renditions
+
+    if old_renditions:
+        delete_renditions(old_renditions, keep=renditions)
+
+    _save_renditions(instance, renditions)
+    return renditions
+
+
+def _save_renditions(instance, renditions):
+    """
+    image_renditions 필드만 업데이트하고 모델 캐시 버전을 올립니다.
+    save()의 post_save 시그널은 이 업데이트 전에 버전을 올리므로(autocommit이면 즉시),
+    그 사이에 캐시된 응답에 리사이즈본이 빠지지 않도록 업데이트 후에 한 번 더 올립니다.
+    """
+    model = type(instance)
+    instance.image_renditions = renditions
+    model.objects.filter(pk=instance.pk).update(image_renditions=renditions, updated_at=timezone.now())
+    bump_model_version_on_commit(model)
+
+
+def build_srcset(renditions, request=None):
+    """
+    리사이즈본 맵을 srcset 형식의 문자열 맵으로 변환합니다.
+
+    Returns:
+        dict | None: {'webp': 'url 320w, url 640w', 'jpeg': '...'}
+    """
+    if not renditions or not renditions.get('source'):
+        return None
+
+    srcset = {}
+    for fmt in RENDITION_FORMATS:
+        entries = []
+        for width, path in sorted(renditions.get(fmt, {}).items(), key=lambda item: int(item[0])):
+            url = default_storage.url(path)
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            entries.append(f'{url} {width}w')
+        if entries:
+            srcset[fmt] = ', '.join(entries)
+    return srcset or None
@@ -0,0 +1,94 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from stores.geo import filter_nearby, haversine_km
+from stores.models import Store
+
+User = get_user_model()
+
+# 합성 매장 좌표 범위 (대한민국 본토 대략 범위)
+LAT_RANGE = (34.0, 38.3)
+LNG_RANGE = (126.0, 129.5)
+
+
+class _Rollback(Exception):
+    """벤치마크 데이터 롤백용 예외"""
+
+
+class Command(BaseCommand):
+    help = '합성 매장 데이터로 주변 매장 검색 성능을 측정합니다. (데이터는 롤백됩니다)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10000, help='생성할 합성 매장 수 (기본값: 10000)')
+        parser.add_argument('--repeat', type=int, default=50, help='방식별 측정 반복 횟수 (기본값: 50)')
+        parser.add_argument('--radius', type=float, default=5, help='검색 반경 km (기본값: 5)')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        try:
+            with transaction.atomic():
+                self._create_stores(options['count'], rng)
+                self._run(options['repeat'], options['radius'], rng)
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write(self.style.SUCCESS('합성 데이터를 롤백했습니다.'))
+
+    def _create_stores(self, count, rng):
+        owner = User.objects.create_user(
+            username='benchmark_nearby_owner',
+            phone='000-0000-0000',
+            password=None,
+        )
+        stores = [
+            Store(
+                name=f'벤치마크 매장 {i}',
+                owner=owner,
+                address='벤치마크 주소',
+                description='',
+                latitude=round(rng.uniform(*LAT_RANGE), 6),
+                longitude=round(rng.uniform(*LNG_RANGE), 6),
+            )
+            for i in range(count)
+        ]
+        Store.objects.bulk_create(stores, batch_size=1000)
+        self.stdout.write(f'합성 매장 {count}개 생성 완료')
+
+    def _run(self, repeat, radius, rng):
+        centers = [(rng.uniform(*LAT_RANGE), rng.uniform(*LNG_RANGE)) for _ in range(repeat)]
+
+        def full_scan(lat, lng):
+            # 기존 방식: 전체 매장을 내려받아 애플리케이션에서 거리순 정렬
+            rows = Store.objects.exclude(latitude__isnull=True).values_list('id', 'latitude', 'longitude')
+            ranked = sorted(
+                (haversine_km(lat, lng, float(row_lat), float(row_lng)), store_id)
+                for store_id, row_lat, row_lng in rows
+            )
+            return [store_id for distance, store_id in ranked if distance <= radius][:20]
+
+        def indexed(lat, lng):
+            # 바운딩 박스 + 하버사인 정렬
+            return list(filter_nearby(Store.objects.all(), lat, lng, radius).values_list('id', flat=True)[:20])
+
+        for label, search in (('전체 스캔', full_scan), ('바운딩 박스', indexed)):
+            timings = []
+            for lat, lng in centers:
+                started = time.perf_counter()
+                search(lat, lng)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            self.stdout.write(
+                f'[{label}] 평균 {statistics.mean(timings):.2f}ms / 중앙값 {statistics.median(timings):.2f}ms / p95 {p95:.2f}ms'
+            )
+
+        # 두 방식의 결과가 일치하는지 확인
+        lat, lng = centers[0]
+        if full_scan(lat, lng) != indexed(lat, lng):
+            self.stdout.write(self.style.WARNING('두 방식의 검색 결과가 다릅니다.'))
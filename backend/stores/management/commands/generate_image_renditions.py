@@ -0,0 +1,101 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from asl_holdem.cache import bump_model_version
+from stores.images import delete_renditions, render_renditions
+from stores.models import Banner, Store
+
+
+def _render_job(name):
+    """프로세스 풀 작업자에서 실행되는 리사이즈본 생성 작업"""
+    return render_renditions(name, default_storage)
+
+
+class Command(BaseCommand):
+    help = '기존 매장/배너 이미지의 리사이즈본(WebP/JPEG)을 일괄 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=['all', 'banner', 'store'],
+            default='all',
+            help='처리할 대상 모델을 지정합니다. (기본값: all)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='이미지 변환에 사용할 프로세스 수 (기본값: 1)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 리사이즈본이 있어도 새로 생성합니다.',
+        )
+
+    def handle(self, *args, **options):
+        models = {'banner': [Banner], 'store': [Store], 'all': [Banner, Store]}[options['model']]
+        workers = max(1, options['workers'])
+        force = options['force']
+
+        self.stdout.write(self.style.SUCCESS(f'리사이즈본 생성 작업을 시작합니다... (workers={workers})'))
+
+        for model in models:
+            self._process_model(model, workers, force)
+
+    def _process_model(self, model, workers, force):
+        label = model._meta.verbose_name
+        instances = [
+            instance for instance in model.objects.exclude(image='').exclude(image__isnull=True).only('id', 'image', 'image_renditions')
+            if force or (instance.image_renditions or {}).get('source') != instance.image.name
+        ]
+
+        self.stdout.write(f'[{label}] 처리할 이미지 수: {len(instances)}')
+        if not instances:
+            return
+
+        success_count = 0
+        error_count = 0
+
+        if workers == 1:
+            results = ((instance, self._render_inline(instance)) for instance in instances)
+        else:
+            results = self._render_parallel(instances, workers)
+
+        for instance, result in results:
+            if isinstance(result, Exception):
+                self.stdout.write(self.style.ERROR(f'✗ {label} ID {instance.id} 처리 중 오류: {result}'))
+                error_count += 1
+                continue
+
+            old_renditions = instance.image_renditions or {}
+            if old_renditions and old_renditions.get('source') != result.get('source'):
+                delete_renditions(old_renditions, keep=result)
+            model.objects.filter(pk=instance.pk).update(image_renditions=result, updated_at=timezone.now())
+            success_count += 1
+
+        if success_count:
+            # queryset.update()는 시그널을 보내지 않으므로 직접 캐시 버전을 올림
+            bump_model_version(model)
+        self.stdout.write(self.style.SUCCESS(f'[{label}] 완료 - 성공: {success_count}개, 실패: {error_count}개'))
+
+    def _render_inline(self, instance):
+        try:
+            return _render_job(instance.image.name)
+        except Exception as e:
+            return e
+
+    def _render_parallel(self, instances, workers):
+        # 작업자 프로세스는 이미지 변환과 파일 쓰기만 수행하고, DB 갱신은 메인 프로세스에서 처리
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            futures = {executor.submit(_render_job, instance.image.name): instance for instance in instances}
+            for future in as_completed(futures):
+                instance = futures[future]
+                try:
+                    yield instance, future.result()
+                except Exception as e:
+                    yield instance, e
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0007_make_banner_store_optional'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banner',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='배너 이미지 리사이즈본'),
+        ),
+        migrations.AddField(
+            model_name='store',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='매장 이미지 리사이즈본'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
 
+from stores.images import refresh_renditions
+
 class Store(models.Model):
     """
     매장 정보를 저장하는 모델
@@ -29,6 +31,9 @@ class Store(models.Model):
     # 매장 이미지
     image = models.ImageField(upload_to='store_images/', verbose_name='매장 이미지', null=True, blank=True)
     
+    # 매장 이미지 리사이즈본 경로 맵 (stores.images 참고)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False, verbose_name='매장 이미지 리사이즈본')
+    
     # 매장 상태
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='ACTIVE')
     
@@ -66,10 +71,28 @@ class Store(models.Model):
         db_table = 'stores'                # 데이터베이스 테이블 이름
         verbose_name = '매장'              # 관리자 페이지에서 표시될 단수 이름
         verbose_name_plural = '매장들'      # 관리자 페이지에서 표시될 복수 이름
+        indexes = [
+            # 주변 매장 검색의 바운딩 박스 필터용
+            models.Index(fields=['latitude', 'longitude'], name='stores_lat_lng_idx'),
+        ]
         
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 불러올 때 소유자 ID를 기록해 두어 소유자 변경 시 이전 소유자의 캐시도 제거합니다."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get('owner_id')
+        return instance
+
     def __str__(self):
         """매장 객체를 문자열로 표현할 때 매장명 반환"""
         return self.name
+    
+    def save(self, *args, **kwargs):
+        """
+        매장 저장 시 이미지가 변경되었으면 리사이즈본을 생성합니다.
+        """
+        super().save(*args, **kwargs)
+        refresh_renditions(self)
 
 class Banner(models.Model):
     """
@@ -83,6 +106,9 @@ class Banner(models.Model):
     # 배너 이미지
     image = models.ImageField(upload_to='banner_images/', verbose_name='배너 이미지')
     
+    # 배너 이미지 리사이즈본 경로 맵 (stores.images 참고)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False, verbose_name='배너 이미지 리사이즈본')
+    
     # 배너 제목
     title = models.CharField(max_length=100, verbose_name='배너 제목')
     
@@ -110,6 +136,9 @@ class Banner(models.Model):
     # 생성 시간
     created_at = models.DateTimeField(auto_now_add=True)
     
+    # 수정 시간 (목록 API 조건부 GET 검증자에 사용)
+    updated_at = models.DateTimeField(auto_now=True)
+    
     class Meta:
         db_table = 'banners'               # 데이터베이스 테이블 이름
         verbose_name = '배너'              # 관리자 페이지에서 표시될 단수 이름
@@ -120,4 +149,11 @@ class Banner(models.Model):
         if self.store:
             return f"{self.store.name} - {self.title}"
         else:
-            return f"전체 - {self.title}" 
\ No newline at end of file
+            return f"전체 - {self.title}"
+    
+    def save(self, *args, **kwargs):
+        """
+        배너 저장 시 이미지가 변경되었으면 리사이즈본을 생성합니다.
+        """
+        super().save(*args, **kwargs)
+        refresh_renditions(self)
@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from stores.models import Store
+from stores.resolver import get_owner_store
 
 
 class IsAdminOrStoreOwner(permissions.BasePermission):
@@ -34,7 +35,7 @@ class IsAdminOrStoreOwner(permissions.BasePermission):
             return True
         
         # 매장 관리자는 자신의 매장에만 접근 가능
-        if request.user.is_store_owner and obj.owner == request.user:
+        if request.user.is_store_owner and obj.owner_id == request.user.id:
             return True
         
         return False
@@ -64,7 +65,7 @@ class IsStoreOwner(permissions.BasePermission):
         객체 수준 권한 확인
         """
         # 매장 관리자는 자신의 매장에만 접근 가능
-        if request.user.is_store_owner and obj.owner == request.user:
+        if request.user.is_store_owner and obj.owner_id == request.user.id:
             return True
         
         return False
@@ -87,4 +88,22 @@ class IsAdminOnly(permissions.BasePermission):
         if request.user.is_staff or request.user.is_superuser:
             return True
         
-        return False 
\ No newline at end of file
+        return False
+
+
+class HasOwnerStore(permissions.BasePermission):
+    """
+    매장이 연결된 매장 관리자만 접근 가능한 권한
+    (조회한 매장은 get_owner_store(request)로 다시 사용할 수 있습니다)
+    """
+    message = '연결된 매장 정보가 없습니다.'
+
+    def has_permission(self, request, view):
+        """
+        뷰 접근 권한 확인
+        """
+        # 인증된 사용자만 접근 가능
+        if not request.user.is_authenticated:
+            return False
+
+        return get_owner_store(request) is not None
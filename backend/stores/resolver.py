@@ -0,0 +1,58 @@
+"""
+요청 사용자의 매장 조회
+
+매장 관리자 API 대부분이 Store.objects.filter(owner=user).first()를 반복 호출하므로,
+get_owner_store(request)로 조회 결과를 요청 객체에 보관하고(요청 단위)
+사용자별로 짧은 TTL 캐시에 보관합니다(프로세스 단위, 매장 저장/삭제 시 무효화).
+"""
+import copy
+
+from django.conf import settings
+
+from accounts.cache import TTLCache
+from stores.models import Store
+
+# 사용자 ID -> Store (매장이 없으면 _NO_STORE)
+owner_store_cache = TTLCache(
+    maxsize=getattr(settings, 'OWNER_STORE_CACHE_SIZE', 4096),
+    ttl=getattr(settings, 'OWNER_STORE_CACHE_TTL', 30),
+    name='owner_store',
+)
+
+# 매장이 없는 사용자를 캐시하기 위한 표시값
+_NO_STORE = object()
+
+# 요청 객체에 조회 결과를 보관할 속성 이름
+_REQUEST_ATTR = '_owner_store'
+
+
+def get_store_for_owner(user_id):
+    """사용자 ID로 소유 매장을 반환합니다. (없으면 None, 요청 객체가 없는 WebSocket 등에서 사용)"""
+    cached = owner_store_cache.get(user_id)
+    if cached is None:
+        cached = Store.objects.filter(owner_id=user_id).first() or _NO_STORE
+        owner_store_cache.set(user_id, cached)
+    # 뷰에서 매장을 수정해도 캐시에 영향이 없도록 요청마다 별도 인스턴스 사용
+    return None if cached is _NO_STORE else copy.copy(cached)
+
+
+def get_owner_store(request):
+    """
+    요청 사용자가 소유한 매장을 반환합니다. (없으면 None)
+    같은 요청 안에서는 몇 번을 호출해도 최대 한 번만 조회합니다.
+    """
+    # DRF Request와 Django HttpRequest 모두 같은 객체에 보관
+    http_request = getattr(request, '_request', request)
+    if hasattr(http_request, _REQUEST_ATTR):
+        return getattr(http_request, _REQUEST_ATTR)
+
+    user = request.user
+    store = get_store_for_owner(user.pk) if user.is_authenticated else None
+    setattr(http_request, _REQUEST_ATTR, store)
+    return store
+
+
+def invalidate_owner_store(user_id):
+    """사용자의 매장 캐시를 제거합니다."""
+    if user_id is not None:
+        owner_store_cache.delete(user_id)
@@ -1,29 +1,36 @@
 from rest_framework import serializers
 from .models import Store, Banner
+from .images import build_srcset
 
 
 class StoreSerializer(serializers.ModelSerializer):
     """매장 정보 시리얼라이저"""
+    image_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Store
         fields = [
-            'id', 'name', 'owner', 'address', 'description', 'image',
+            'id', 'name', 'owner', 'address', 'description', 'image', 'image_srcset',
             'status', 'latitude', 'longitude', 'phone_number',
             'open_time', 'close_time', 'manager_name', 'manager_phone',
             'max_capacity', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def get_image_srcset(self, obj):
+        """매장 이미지 리사이즈본의 포맷별 srcset 반환"""
+        return build_srcset(obj.image_renditions, self.context.get('request'))
 
 
 class BannerSerializer(serializers.ModelSerializer):
     """배너 정보 시리얼라이저"""
     store_name = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Banner
         fields = [
-            'id', 'store', 'store_name', 'image', 'title', 'description',
+            'id', 'store', 'store_name', 'image', 'image_srcset', 'title', 'description',
             'start_date', 'end_date', 'is_active', 'is_main_tournament', 'is_store_gallery', 'is_main_selected', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
@@ -34,6 +41,10 @@ class BannerSerializer(serializers.ModelSerializer):
             return obj.store.name
         return "전체"
     
+    def get_image_srcset(self, obj):
+        """배너 이미지 리사이즈본의 포맷별 srcset 반환 (예: {'webp': 'url 320w, url 640w'})"""
+        return build_srcset(obj.image_renditions, self.context.get('request'))
+    
     def to_representation(self, instance):
         """시리얼라이저의 출력 표현을 커스터마이징"""
         representation = super().to_representation(instance)
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from asl_holdem.cache import bump_model_version_on_commit
+from stores.models import Banner, Store
+from stores.resolver import invalidate_owner_store
+
+
+@receiver([post_save, post_delete], sender=Store)
+@receiver([post_save, post_delete], sender=Banner)
+def bump_cache_version(sender, **kwargs):
+    """매장/배너가 저장/삭제되면 해당 모델의 캐시 버전을 올립니다. (asl_holdem.cache)"""
+    bump_model_version_on_commit(sender)
+
+
+@receiver([post_save, post_delete], sender=Store)
+def invalidate_owner_store_cache(sender, instance, **kwargs):
+    """
+    매장이 저장/삭제되면 소유자의 매장 조회 캐시를 제거합니다.
+    소유자가 바뀐 경우를 위해 이전 소유자의 캐시도 함께 제거합니다.
+    """
+    invalidate_owner_store(instance.owner_id)
+    invalidate_owner_store(getattr(instance, '_loaded_owner_id', None))
@@ -0,0 +1,356 @@
+import tempfile
+from datetime import timedelta
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from seats.models import SeatTicket, TournamentTicketDistribution
+from stores.models import Banner, Store
+from stores.permissions import HasOwnerStore
+from stores.resolver import get_owner_store, owner_store_cache
+from tournaments.models import Tournament
+
+User = get_user_model()
+
+
+def owner_store_queries(context):
+    """캡처된 쿼리 중 소유자 기준 매장 조회 쿼리만 반환"""
+    return [
+        query['sql'] for query in context.captured_queries
+        if 'FROM "stores"' in query['sql'] and '"stores"."owner_id" =' in query['sql']
+    ]
+
+
+class OwnerStoreResolverTests(TestCase):
+    """요청 사용자의 매장 조회가 요청당 최대 한 번만 실행되는지 확인"""
+
+    def setUp(self):
+        owner_store_cache.clear()
+
+        # 스태프가 아닌 매장 관리자 (배너 API의 매장 관리자 분기를 타도록 설정)
+        self.owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        User.objects.filter(pk=self.owner.pk).update(is_staff=False)
+        self.owner.refresh_from_db()
+
+        self.store = Store.objects.create(name='테스트 매장', owner=self.owner, address='서울', description='')
+        other_owner = User.objects.create_user(username='other_owner', phone='010-3333-4444', password='password', role='STORE_OWNER')
+        self.other_store = Store.objects.create(name='다른 매장', owner=other_owner, address='부산', description='')
+
+        now = timezone.now()
+        self.banner, self.other_banner = Banner.objects.bulk_create([
+            Banner(store=self.store, image='banner_images/a.png', title='내 배너',
+                   start_date=now, end_date=now + timedelta(days=7)),
+            Banner(store=self.other_store, image='banner_images/b.png', title='다른 배너',
+                   start_date=now, end_date=now + timedelta(days=7)),
+        ])
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def request(self, method, url):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url)
+        return response, owner_store_queries(context)
+
+    def test_list_resolves_store_once(self):
+        owner_store_cache.clear()
+        response, queries = self.request('get', '/api/v1/banners/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), 1)
+
+    def test_my_banners_resolves_store_once(self):
+        owner_store_cache.clear()
+        response, queries = self.request('get', '/api/v1/banners/my_banners/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['store_info']['id'], self.store.id)
+        self.assertEqual(response.data['total_count'], 1)
+        self.assertLessEqual(len(queries), 1)
+
+    def test_toggle_active_resolves_store_once(self):
+        # get_queryset과 권한 확인에서 각각 매장을 사용하지만 조회는 한 번
+        owner_store_cache.clear()
+        response, queries = self.request('post', f'/api/v1/banners/{self.banner.id}/toggle_active/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), 1)
+
+    def test_other_store_banner_is_not_toggled(self):
+        is_active = self.other_banner.is_active
+        response, queries = self.request('post', f'/api/v1/banners/{self.other_banner.id}/toggle_active/')
+
+        self.assertEqual(response.status_code, 404)
+        self.other_banner.refresh_from_db()
+        self.assertEqual(self.other_banner.is_active, is_active)
+        self.assertLessEqual(len(queries), 1)
+
+    def test_store_is_cached_across_requests(self):
+        owner_store_cache.clear()
+        self.request('get', '/api/v1/banners/my_banners/')
+        response, queries = self.request('get', '/api/v1/banners/my_banners/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, [])
+
+    def test_store_save_invalidates_cache(self):
+        self.request('get', '/api/v1/store/info/')
+
+        self.store.name = '변경된 매장'
+        self.store.save()
+
+        response, queries = self.request('get', '/api/v1/store/info/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], '변경된 매장')
+        self.assertEqual(len(queries), 1)
+
+    def test_owner_without_store(self):
+        self.store.delete()
+
+        response, queries = self.request('get', '/api/v1/banners/my_banners/')
+        self.assertEqual(response.status_code, 403)
+        self.assertLessEqual(len(queries), 1)
+
+        # 매장이 없다는 결과도 캐시되어 다시 조회하지 않음
+        response, queries = self.request('get', '/api/v1/store/info/')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(queries, [])
+
+
+class OwnerStoreCallerTests(TestCase):
+    """매장 조회를 사용하는 다른 API/권한도 요청 사용자의 매장을 한 번만 조회하여 사용하는지 확인"""
+
+    def setUp(self):
+        owner_store_cache.clear()
+
+        # 스태프가 아닌 매장 관리자 (관리자 분기 대신 매장 관리자 분기를 타도록 설정)
+        self.owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        User.objects.filter(pk=self.owner.pk).update(is_staff=False)
+        self.owner.refresh_from_db()
+        self.store = Store.objects.create(name='테스트 매장', owner=self.owner, address='서울', description='')
+
+        self.no_store_owner = User.objects.create_user(username='no_store', phone='010-5555-6666', password='password', role='STORE_OWNER')
+        self.player = User.objects.create_user(username='player', phone='010-7777-8888', password='password', role='USER')
+
+        now = timezone.now()
+        self.tournament = Tournament.objects.create(name='배분된 토너먼트', start_time=now)
+        Tournament.objects.create(name='다른 토너먼트', start_time=now - timedelta(days=1))
+        TournamentTicketDistribution.objects.create(
+            tournament=self.tournament, store=self.store, allocated_quantity=10, remaining_quantity=10,
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def request(self, method, url, data=None):
+        owner_store_cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data, format='json')
+        return response, owner_store_queries(context)
+
+    def test_store_tournaments(self):
+        response, queries = self.request('get', '/api/v1/store/tournaments/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data], [self.tournament.id])
+        self.assertEqual(len(queries), 1)
+
+    def test_current_store(self):
+        response, queries = self.request('get', '/api/v1/store/info/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], self.store.id)
+        self.assertEqual(len(queries), 1)
+
+    def test_current_store_without_store(self):
+        self.client.force_authenticate(user=self.no_store_owner)
+        response, queries = self.request('get', '/api/v1/store/info/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(queries), 1)
+
+    def test_grant_seat_ticket(self):
+        response, queries = self.request('post', '/api/v1/store/grant-ticket/', {
+            'user_id': self.player.id, 'tournament_id': self.tournament.id, 'quantity': 2,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SeatTicket.objects.filter(user=self.player, store=self.store).count(), 2)
+        self.assertEqual(len(queries), 1)
+
+    def test_grant_seat_ticket_without_store(self):
+        self.client.force_authenticate(user=self.no_store_owner)
+        response, _ = self.request('post', '/api/v1/store/grant-ticket/', {
+            'user_id': self.player.id, 'tournament_id': self.tournament.id,
+        })
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(SeatTicket.objects.exists())
+
+    def has_owner_store(self, user):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=user)
+        request = Request(request)
+        return request, HasOwnerStore().has_permission(request, None)
+
+    def test_has_owner_store_permission(self):
+        with CaptureQueriesContext(connection) as context:
+            request, allowed = self.has_owner_store(self.owner)
+            # 권한 확인에서 조회한 매장을 뷰에서 다시 조회하지 않음
+            store = get_owner_store(request)
+
+        self.assertTrue(allowed)
+        self.assertEqual(store.id, self.store.id)
+        self.assertEqual(len(owner_store_queries(context)), 1)
+
+    def test_has_owner_store_permission_denied(self):
+        self.assertFalse(self.has_owner_store(self.no_store_owner)[1])
+        self.assertFalse(self.has_owner_store(self.player)[1])
+
+
+class StoreListConditionalGetTests(TestCase):
+    """매장 목록이 변경되지 않았으면 304를 반환하고, 매장/대표 배너/분배 추가가 있으면 새 ETag를 반환하는지 확인"""
+
+    url = '/api/v1/stores/'
+
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        self.store = Store.objects.create(name='테스트 매장', owner=owner, address='서울', description='')
+        self.tournament = Tournament.objects.create(name='테스트 토너먼트', start_time=timezone.now())
+        self.client = APIClient()
+
+    def revalidate(self):
+        etag = self.client.get(self.url)['ETag']
+        return etag, self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def assert_changed(self, etag):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return response
+
+    def test_unchanged_returns_304(self):
+        etag, response = self.revalidate()
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_store_update_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.store.name = '새 매장명'
+            self.store.save()
+
+        response = self.assert_changed(etag)
+        self.assertEqual(response.json()[0]['name'], '새 매장명')
+
+    def test_store_create_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        other_owner = User.objects.create_user(username='other_owner', phone='010-3333-4444', password='password', role='STORE_OWNER')
+        with self.captureOnCommitCallbacks(execute=True):
+            Store.objects.create(name='다른 매장', owner=other_owner, address='부산', description='')
+
+        self.assertEqual(len(self.assert_changed(etag).json()), 2)
+
+    def test_active_banner_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            Banner.objects.create(
+                store=self.store, image='banner_images/a.png', title='배너',
+                start_date=now, end_date=now + timedelta(days=7),
+            )
+
+        self.assert_changed(etag)
+
+    def test_distribution_create_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            TournamentTicketDistribution.objects.create(
+                tournament=self.tournament, store=self.store, allocated_quantity=10, remaining_quantity=10,
+            )
+
+        self.assert_changed(etag)
+
+    def test_distribution_quantity_change_returns_304(self):
+        distribution = TournamentTicketDistribution.objects.create(
+            tournament=self.tournament, store=self.store, allocated_quantity=10, remaining_quantity=10,
+        )
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            distribution.remaining_quantity = 7
+            distribution.distributed_quantity = 3
+            distribution.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class RenditionReplaceTests(TestCase):
+    """원본 이미지를 교체해도 새 리사이즈본 파일이 남아 있는지 확인"""
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        owner = User.objects.create_user(username='owner', phone='010-1111-2222', password='password', role='STORE_OWNER')
+        self.store = Store.objects.create(name='테스트 매장', owner=owner, address='서울', description='')
+
+    def upload(self, name, fmt, color):
+        buffer = BytesIO()
+        Image.new('RGB', (800, 400), color).save(buffer, format=fmt)
+        return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    def rendition_paths(self, banner):
+        return [path for fmt in ('webp', 'jpeg') for path in banner.image_renditions[fmt].values()]
+
+    def test_replace_with_same_name_other_extension(self):
+        now = timezone.now()
+        banner = Banner.objects.create(
+            store=self.store, image=self.upload('banner_images/a.jpg', 'JPEG', 'red'), title='배너',
+            start_date=now, end_date=now + timedelta(days=7),
+        )
+        old_paths = self.rendition_paths(banner)
+
+        banner.image = self.upload('banner_images/a.png', 'PNG', 'blue')
+        banner.save()
+        banner.refresh_from_db()
+
+        self.assertEqual(banner.image_renditions['source'], 'banner_images/a.png')
+        new_paths = self.rendition_paths(banner)
+        self.assertTrue(new_paths)
+        for path in new_paths:
+            self.assertTrue(default_storage.exists(path), path)
+        for path in set(old_paths) - set(new_paths):
+            self.assertFalse(default_storage.exists(path), path)
+
+    def test_replace_removes_old_renditions(self):
+        now = timezone.now()
+        banner = Banner.objects.create(
+            store=self.store, image=self.upload('banner_images/a.jpg', 'JPEG', 'red'), title='배너',
+            start_date=now, end_date=now + timedelta(days=7),
+        )
+        old_paths = self.rendition_paths(banner)
+
+        banner.image = self.upload('banner_images/b.jpg', 'JPEG', 'blue')
+        banner.save()
+
+        for path in old_paths:
+            self.assertFalse(default_storage.exists(path), path)
+        for path in self.rendition_paths(banner):
+            self.assertTrue(default_storage.exists(path), path)
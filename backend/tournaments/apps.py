@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class TournamentsConfig(AppConfig):
+    name = 'tournaments'
+
+    def ready(self):
+        """앱이 로드될 때 캐시 버전 시그널을 임포트합니다."""
+        import tournaments.signals  # noqa F401
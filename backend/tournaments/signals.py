@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from asl_holdem.cache import bump_model_version_on_commit
+from tournaments.models import Tournament
+
+
+@receiver([post_save, post_delete], sender=Tournament)
+def bump_cache_version(sender, **kwargs):
+    """토너먼트가 저장/삭제되면 캐시 버전을 올립니다. (asl_holdem.cache)"""
+    bump_model_version_on_commit(sender)
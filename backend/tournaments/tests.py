@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tournaments.models import Tournament
+
+
+class TournamentConditionalGetTests(TestCase):
+    """토너먼트 목록/상세가 변경되지 않았으면 304를 반환하고, 변경되면 새 ETag를 반환하는지 확인"""
+
+    list_url = '/api/v1/tournaments/'
+
+    def setUp(self):
+        now = timezone.now()
+        self.tournament = Tournament.objects.create(name='테스트 토너먼트', start_time=now)
+        self.other_tournament = Tournament.objects.create(name='다른 토너먼트', start_time=now + timedelta(days=1))
+        self.detail_url = f'{self.list_url}{self.tournament.id}/'
+        self.client = APIClient()
+
+    def revalidate(self, url):
+        etag = self.client.get(url)['ETag']
+        return etag, self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_list_unchanged_returns_304(self):
+        etag, response = self.revalidate(self.list_url)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_list_update_changes_etag(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.tournament.name = '수정된 토너먼트'
+        self.tournament.save()
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('수정된 토너먼트', [item['name'] for item in response.json()['results']])
+
+    def test_list_create_and_delete_change_etag(self):
+        etag = self.client.get(self.list_url)['ETag']
+        created = Tournament.objects.create(name='새 토너먼트', start_time=timezone.now())
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        created.delete()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_filtered_list_status_change_changes_etag(self):
+        params = {'status': 'UPCOMING'}
+        etag = self.client.get(self.list_url, params)['ETag']
+        self.assertEqual(self.client.get(self.list_url, params, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.tournament.status = 'ONGOING'
+        self.tournament.save()
+
+        response = self.client.get(self.list_url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([item['id'] for item in response.json()['results']], [self.other_tournament.id])
+
+    def test_retrieve_unchanged_returns_304(self):
+        etag, response = self.revalidate(self.detail_url)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_retrieve_ignores_other_tournaments(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.other_tournament.name = '수정된 다른 토너먼트'
+        self.other_tournament.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_retrieve_update_changes_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.tournament.buy_in = 3
+        self.tournament.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['buy_in'], 3)
+
+    def test_retrieve_missing_returns_404(self):
+        response = self.client.get(f'{self.list_url}999999/', HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,69 @@
+"""
+ASGI 배포용 async 조회 뷰
+
+트래픽이 가장 많은 조회 API(활성 배너, 공지사항 목록, 토너먼트 상세 목록, 사용자 좌석권 현황)를
+async 뷰로 제공합니다. 응답 형식과 인증/권한은 기존 동기 뷰와 동일합니다.
+
+async ORM(aget/acount/async for)은 호출마다 sync_to_async(thread_sensitive=True)로 전환되며,
+ASGIHandler는 요청마다 ThreadSensitiveContext를 만들어 그 요청 전용 스레드에서 실행하고 요청이 끝나면 스레드를 종료합니다.
+따라서 요청마다 새 DB 연결을 열게 되어 CONN_MAX_AGE로 연결을 재사용할 수 없고, 동시 요청 수만큼 연결이 늘어납니다.
+(인증/권한/시리얼라이저도 동기 코드이므로 뷰 전체를 async ORM으로 바꿀 수 없음)
+
+조회 전용 뷰는 트랜잭션이나 스레드 고유 상태가 필요 없으므로 기존 동기 처리 전체를 한 번의 전환으로
+thread_sensitive=False로 전용 스레드 풀(ASYNC_READ_THREADS)에서 실행합니다.
+풀 스레드는 계속 유지되어 스레드마다 DB 연결을 하나씩 재사용하므로, 풀 크기가 ASGI 프로세스의 최대 DB 연결 수가 됩니다.
+(DB 최대 연결 수에 맞게 설정)
+"""
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from views.banner_views import BannerViewSet
+from views.notices_views import NoticeListView
+from views.store_views import get_user_ticket_status
+from views.tournament_views import TournamentViewSet
+
+
+# 조회 뷰 실행용 스레드 풀
+executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'ASYNC_READ_THREADS', 16),
+    thread_name_prefix='async-read',
+)
+
+
+def read_only_async(view):
+    """동기 조회 뷰를 스레드 풀에서 실행하는 async 뷰로 감쌉니다."""
+
+    def run(request, *args, **kwargs):
+        # 풀 스레드의 DB 연결은 요청 시그널로 정리되지 않으므로 직접 정리 (CONN_MAX_AGE/헬스 체크 적용)
+        close_old_connections()
+        try:
+            response = view(request, *args, **kwargs)
+            # DRF 응답 렌더링(JSON 직렬화)도 풀 스레드에서 수행
+            if hasattr(response, 'render') and callable(response.render):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        return await sync_to_async(run, thread_sensitive=False, executor=executor)(request, *args, **kwargs)
+
+    return async_view
+
+
+active_banners = read_only_async(
+    BannerViewSet.as_view({'get': 'active'}, basename='banner', detail=False, **BannerViewSet.active.kwargs)
+)
+
+notice_list = read_only_async(NoticeListView.as_view())
+
+tournament_all_info = read_only_async(
+    TournamentViewSet.as_view({'get': 'all_info'}, basename='tournament', detail=False, **TournamentViewSet.all_info.kwargs)
+)
+
+user_ticket_status = read_only_async(get_user_ticket_status)
@@ -5,11 +5,14 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import PermissionDenied, NotFound
 from django.db.models import Q
 from django.utils import timezone
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from datetime import datetime
 import logging
 
+from asl_holdem.conditional import aggregate_validators, conditional_get
 from stores.models import Banner, Store
+from stores.resolver import get_owner_store
 from stores.serializers import BannerSerializer
 from django.contrib.auth import get_user_model
 
@@ -41,7 +44,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             self.check_object_permissions(self.request, obj)
             return obj
         except Exception as e:
-            logger.error(f"배너 조회 실패 (ID: {self.kwargs.get('pk', 'N/A')}): {str(e)}")
+            logger.error("배너 조회 실패 (ID: %s): %s", self.kwargs.get('pk', 'N/A'), e)
             raise NotFound(f"배너를 찾을 수 없습니다 (ID: {self.kwargs.get('pk', 'N/A')})")
 
     def get_queryset(self):
@@ -86,9 +89,9 @@ class BannerViewSet(viewsets.ModelViewSet):
         if not user.is_staff and not user.is_superuser:
             # 매장 관리자인 경우 자신의 매장 배너만 조회
             if hasattr(user, 'is_store_owner') and user.is_store_owner:
-                store = Store.objects.filter(owner=user).first()
+                store = get_owner_store(self.request)
                 if store:
-                    queryset = queryset.filter(store=store)
+                    queryset = queryset.filter(store_id=store.id)
                 else:
                     # 매장이 없는 경우 빈 쿼리셋 반환
                     queryset = queryset.none()
@@ -128,7 +131,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             # 기본 유효성 검사
             serializer = self.get_serializer(data=request.data)
             if not serializer.is_valid():
-                logger.warning(f"배너 생성 유효성 검사 실패: {serializer.errors}")
+                logger.warning("배너 생성 유효성 검사 실패: %s", serializer.errors)
                 return Response(
                     {
                         "error": "입력 데이터가 유효하지 않습니다.",
@@ -141,13 +144,13 @@ class BannerViewSet(viewsets.ModelViewSet):
             try:
                 self.perform_create(serializer)
                 headers = self.get_success_headers(serializer.data)
-                logger.info(f"배너 생성 성공: {serializer.data.get('title', 'N/A')}")
+                logger.info("배너 생성 성공: %s", serializer.data.get('title', 'N/A'))
                 # 생성된 배너의 이미지 URL을 완전한 URL로 변환하여 반환
                 response_serializer = self.get_serializer(serializer.instance, context={'request': request})
                 return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
             
             except PermissionDenied as e:
-                logger.warning(f"배너 생성 권한 에러: {str(e)}")
+                logger.warning("배너 생성 권한 에러: %s", e)
                 return Response(
                     {
                         "error": str(e),
@@ -158,7 +161,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             
             except OSError as e:
                 if "Permission denied" in str(e) or "권한" in str(e):
-                    logger.error(f"파일 시스템 권한 에러: {str(e)}")
+                    logger.error("파일 시스템 권한 에러: %s", e)
                     return Response(
                         {
                             "error": "파일 업로드 권한이 없습니다. 서버 관리자에게 문의하세요.",
@@ -168,7 +171,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_500_INTERNAL_SERVER_ERROR
                     )
                 else:
-                    logger.error(f"파일 시스템 에러: {str(e)}")
+                    logger.error("파일 시스템 에러: %s", e)
                     return Response(
                         {
                             "error": "파일 업로드 중 오류가 발생했습니다.",
@@ -179,7 +182,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                     )
             
             except Exception as e:
-                logger.error(f"배너 생성 중 예기치 않은 에러: {str(e)}")
+                logger.error("배너 생성 중 예기치 않은 에러: %s", e)
                 return Response(
                     {
                         "error": "배너 생성 중 오류가 발생했습니다.",
@@ -190,7 +193,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                 )
         
         except Exception as e:
-            logger.error(f"배너 생성 API 전체 에러: {str(e)}")
+            logger.error("배너 생성 API 전체 에러: %s", e)
             return Response(
                 {
                     "error": "서버 오류가 발생했습니다.",
@@ -207,20 +210,20 @@ class BannerViewSet(viewsets.ModelViewSet):
         
         # 관리자 권한 확인
         if not (user.is_staff or user.is_superuser):
-            logger.warning(f"배너 생성 권한 없음 - 사용자: {user.username}")
+            logger.warning("배너 생성 권한 없음 - 사용자: %s", user.username)
             raise PermissionDenied("관리자 또는 매장 관리자만 배너를 생성할 수 있습니다.")
         
         try:
             # 배너 생성
             serializer.save()
-            logger.info(f"배너 생성 성공 - 사용자: {user.username}, 제목: {serializer.validated_data.get('title', 'N/A')}")
+            logger.info("배너 생성 성공 - 사용자: %s, 제목: %s", user.username, serializer.validated_data.get('title', 'N/A'))
             
         except OSError as e:
-            logger.error(f"파일 업로드 에러 - 사용자: {user.username}, 에러: {str(e)}")
+            logger.error("파일 업로드 에러 - 사용자: %s, 에러: %s", user.username, e)
             raise PermissionDenied(f"파일 업로드 중 오류가 발생했습니다: {str(e)}")
             
         except Exception as e:
-            logger.error(f"배너 생성 에러 - 사용자: {user.username}, 에러: {str(e)}")
+            logger.error("배너 생성 에러 - 사용자: %s, 에러: %s", user.username, e)
             raise Exception(f"배너 생성 중 오류가 발생했습니다: {str(e)}")
 
     def update(self, request, *args, **kwargs):
@@ -249,7 +252,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             response_serializer = self.get_serializer(instance, context={'request': request})
             return Response(response_serializer.data)
         except Exception as e:
-            logger.error(f"배너 수정 실패 (ID: {kwargs.get('pk', 'N/A')}): {str(e)}")
+            logger.error("배너 수정 실패 (ID: %s): %s", kwargs.get('pk', 'N/A'), e)
             return Response(
                 {"error": f"배너 수정 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -270,15 +273,15 @@ class BannerViewSet(viewsets.ModelViewSet):
             
             # 매장 관리자인 경우 자신의 매장 배너만 수정 가능
             if hasattr(user, 'is_store_owner') and user.is_store_owner:
-                store = Store.objects.filter(owner=user).first()
-                if store and banner.store != store:
+                store = get_owner_store(self.request)
+                if store and banner.store_id != store.id:
                     raise PermissionDenied("다른 매장의 배너는 수정할 수 없습니다.")
             else:
                 raise PermissionDenied("배너 수정 권한이 없습니다.")
             
             serializer.save()
         except Exception as e:
-            logger.error(f"배너 수정 권한 확인 실패: {str(e)}")
+            logger.error("배너 수정 권한 확인 실패: %s", e)
             raise
 
     def perform_destroy(self, instance):
@@ -295,40 +298,59 @@ class BannerViewSet(viewsets.ModelViewSet):
             
             # 매장 관리자인 경우 자신의 매장 배너만 삭제 가능
             if hasattr(user, 'is_store_owner') and user.is_store_owner:
-                store = Store.objects.filter(owner=user).first()
-                if store and instance.store != store:
+                store = get_owner_store(self.request)
+                if store and instance.store_id != store.id:
                     raise PermissionDenied("다른 매장의 배너는 삭제할 수 없습니다.")
             else:
                 raise PermissionDenied("배너 삭제 권한이 없습니다.")
             
             instance.delete()
         except Exception as e:
-            logger.error(f"배너 삭제 실패: {str(e)}")
+            logger.error("배너 삭제 실패: %s", e)
             raise
 
+    def get_active_banners(self):
+        """
+        현재 노출 기간 내의 활성 배너 쿼리셋 (store_id 파라미터로 매장별 필터링 선택)
+        """
+        now = timezone.now()
+        active_banners = Banner.objects.filter(
+            is_active=True,
+            start_date__lte=now,
+            end_date__gte=now
+        ).select_related('store').order_by('-created_at')
+        
+        # 매장별 필터링 (선택사항)
+        store_id = self.request.query_params.get('store_id')
+        if store_id:
+            active_banners = active_banners.filter(store_id=store_id)
+        return active_banners
+
+    def active_banner_validators(self, request):
+        """활성 배너 목록 조건부 GET 검증자 (매장명이 포함되므로 매장 변경도 감지)"""
+        try:
+            return [
+                aggregate_validators(self.get_active_banners()),
+                aggregate_validators(Store.objects.all()),
+            ]
+        except (TypeError, ValueError):
+            # 잘못된 store_id는 검증자 없이 원래 오류 응답 처리
+            return []
+
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    @conditional_get(active_banner_validators)
     def active(self, request):
         """
         현재 활성화된 배너 목록 조회 (로그인 불필요)
         이미지 URL을 완전한 URL로 변환하여 반환
         """
         try:
-            now = timezone.now()
-            active_banners = Banner.objects.filter(
-                is_active=True,
-                start_date__lte=now,
-                end_date__gte=now
-            ).select_related('store').order_by('-created_at')
-            
-            # 매장별 필터링 (선택사항)
-            store_id = request.query_params.get('store_id')
-            if store_id:
-                active_banners = active_banners.filter(store_id=store_id)
+            active_banners = self.get_active_banners()
             
             serializer = self.get_serializer(active_banners, many=True, context={'request': request})
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"활성 배너 조회 실패: {str(e)}")
+            logger.error("활성 배너 조회 실패: %s", e)
             return Response(
                 {"error": f"활성 배너 조회 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -360,7 +382,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             user = request.user
             if not user.is_staff and not user.is_superuser:
                 if hasattr(user, 'is_store_owner') and user.is_store_owner:
-                    user_store = Store.objects.filter(owner=user).first()
+                    user_store = get_owner_store(request)
                     if user_store and user_store.id != int(store_id):
                         raise PermissionDenied("다른 매장의 배너는 조회할 수 없습니다.")
                 else:
@@ -381,7 +403,7 @@ class BannerViewSet(viewsets.ModelViewSet):
         except PermissionDenied:
             raise
         except Exception as e:
-            logger.error(f"매장별 배너 조회 실패: {str(e)}")
+            logger.error("매장별 배너 조회 실패: %s", e)
             return Response(
                 {"error": f"매장별 배너 조회 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -412,11 +434,11 @@ class BannerViewSet(viewsets.ModelViewSet):
                 raise PermissionDenied("매장 관리자 권한이 필요합니다.")
             
             # 사용자의 매장 조회
-            store = Store.objects.filter(owner=user).first()
+            store = get_owner_store(request)
             if not store:
                 raise PermissionDenied("연결된 매장 정보가 없습니다.")
             
-            banners = Banner.objects.filter(store=store).order_by('-created_at')
+            banners = Banner.objects.filter(store_id=store.id).order_by('-created_at')
             serializer = self.get_serializer(banners, many=True, context={'request': request})
             
             return Response({
@@ -432,7 +454,7 @@ class BannerViewSet(viewsets.ModelViewSet):
         except PermissionDenied:
             raise
         except Exception as e:
-            logger.error(f"내 배너 조회 실패: {str(e)}")
+            logger.error("내 배너 조회 실패: %s", e)
             return Response(
                 {"error": f"내 배너 조회 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -452,8 +474,8 @@ class BannerViewSet(viewsets.ModelViewSet):
             if not user.is_staff and not user.is_superuser:
                 # 권한 확인
                 if hasattr(user, 'is_store_owner') and user.is_store_owner:
-                    store = Store.objects.filter(owner=user).first()
-                    if store and banner.store != store:
+                    store = get_owner_store(request)
+                    if store and banner.store_id != store.id:
                         raise PermissionDenied("다른 매장의 배너는 수정할 수 없습니다.")
                 else:
                     raise PermissionDenied("배너 상태 변경 권한이 없습니다.")
@@ -467,10 +489,10 @@ class BannerViewSet(viewsets.ModelViewSet):
                 'message': f"배너가 {'활성화' if banner.is_active else '비활성화'}되었습니다.",
                 'banner': serializer.data
             })
-        except PermissionDenied:
+        except (PermissionDenied, NotFound, Http404):
             raise
         except Exception as e:
-            logger.error(f"배너 상태 토글 실패 (ID: {pk}): {str(e)}")
+            logger.error("배너 상태 토글 실패 (ID: %s): %s", pk, e)
             return Response(
                 {"error": f"배너 상태 변경 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -492,7 +514,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                 banner.save()
             
             # 기존 메인 선택 배너들을 모두 False로 변경
-            Banner.objects.filter(is_main_selected=True).update(is_main_selected=False)
+            Banner.objects.filter(is_main_selected=True).update(is_main_selected=False, updated_at=timezone.now())
             
             # 선택된 배너를 메인 선택 배너로 설정
             banner.is_main_selected = True
@@ -504,7 +526,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                 'banner': serializer.data
             })
         except Exception as e:
-            logger.error(f"메인 토너먼트 배너 설정 실패 (ID: {pk}): {str(e)}")
+            logger.error("메인 토너먼트 배너 설정 실패 (ID: %s): %s", pk, e)
             return Response(
                 {"error": f"메인 토너먼트 배너 설정 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -538,7 +560,7 @@ class BannerViewSet(viewsets.ModelViewSet):
                 'banner': serializer.data
             })
         except Exception as e:
-            logger.error(f"메인 토너먼트 배너 조회 실패: {str(e)}")
+            logger.error("메인 토너먼트 배너 조회 실패: %s", e)
             return Response(
                 {"error": f"메인 토너먼트 배너 조회 중 오류가 발생했습니다: {str(e)}"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -583,7 +605,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             })
             
         except Exception as e:
-            logger.error(f"스토어 갤러리 배너 조회 실패: {str(e)}")
+            logger.error("스토어 갤러리 배너 조회 실패: %s", e)
             return Response({
                 'error': '스토어 갤러리 배너를 조회하는 중 오류가 발생했습니다.',
                 'banners': []
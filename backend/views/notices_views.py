@@ -3,8 +3,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Q
+from django.db.models import Q, Sum
 from django.utils import timezone
+from asl_holdem.conditional import ConditionalGetMixin, aggregate_validators
 from notices.models import Notice, NoticeReadStatus
 from notices.serializers import (
     NoticeListSerializer, 
@@ -16,7 +17,7 @@ from notices.serializers import (
 from notices.filters import NoticeFilter
 
 
-class NoticeListView(generics.ListAPIView):
+class NoticeListView(ConditionalGetMixin, generics.ListAPIView):
     """
     공지사항 목록 조회 API
     - 전체 공지사항: 모든 사용자가 조회 가능
@@ -29,6 +30,8 @@ class NoticeListView(generics.ListAPIView):
     ordering_fields = ['created_at', 'view_count', 'priority']
     ordering = ['-is_pinned', '-priority', '-created_at']
     permission_classes = [permissions.AllowAny]
+    # 로그인 여부만 확인하므로 사용자 조회 없이 토큰 클레임 사용
+    token_claims_user = True
     
     def get_queryset(self):
         """사용자 권한에 따른 공지사항 필터링"""
@@ -49,6 +52,21 @@ class NoticeListView(generics.ListAPIView):
             # 비로그인 사용자는 전체 공지사항만 조회 가능
             return queryset.filter(notice_type='GENERAL')
 
+    def get_validator_aggregates(self):
+        """조회수(update_fields 저장으로 updated_at 미변경)와 사용자의 읽음 여부도 검증자에 포함"""
+        aggregates = [
+            aggregate_validators(
+                self.filter_queryset(self.get_queryset()),
+                view_count_sum=Sum('view_count'),
+            )
+        ]
+        if self.request.user.is_authenticated:
+            aggregates.append(aggregate_validators(
+                NoticeReadStatus.objects.filter(user_id=self.request.user.id),
+                updated_field='read_at',
+            ))
+        return aggregates
+
 
 class NoticeAdminListView(generics.ListAPIView):
     """
@@ -0,0 +1,59 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from asl_holdem import metrics as metrics_registry
+from asl_holdem.instrumentation import reset_route_stats, route_stats as collect_route_stats
+from stores.permissions import IsAdminOnly
+
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1')
+
+# 프록시를 거친 요청에 붙는 헤더
+PROXY_HEADERS = ('X-Forwarded-For', 'X-Real-IP')
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminOnly])
+def route_stats(request):
+    """
+    경로별 요청 통계 조회/초기화 (관리자 전용)
+
+    RequestTimingMiddleware가 집계한 현재 워커 프로세스의 통계이며, 누적 시간이 큰 경로부터 반환합니다.
+    DELETE 요청 시 통계를 초기화합니다.
+    """
+    if request.method == 'DELETE':
+        reset_route_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response(collect_route_stats())
+
+
+@require_GET
+def metrics(request):
+    """
+    Prometheus 텍스트 형식 메트릭
+
+    METRICS_TOKEN이 설정되어 있으면 Authorization: Bearer <토큰> 요청만 허용합니다.
+    토큰이 없으면 DEBUG에서 로컬(127.0.0.1) 직접 요청만 허용합니다. nginx/daphne 뒤에서는 REMOTE_ADDR가
+    항상 127.0.0.1이므로 프록시 헤더(X-Forwarded-For, X-Real-IP)가 있는 요청은 거부하며, 운영 환경에서는 토큰이 필수입니다.
+    멀티 프로세스 모드(METRICS_MULTIPROCESS_DIR)에서는 모든 워커의 값을 합쳐서 응답합니다.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        # str끼리 비교하면 ASCII가 아닌 헤더에서 TypeError가 나므로 bytes로 비교
+        allowed = hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode())
+    else:
+        allowed = (
+            settings.DEBUG
+            and request.META.get('REMOTE_ADDR') in LOOPBACK_ADDRESSES
+            and not any(header in request.headers for header in PROXY_HEADERS)
+        )
+    if not allowed:
+        return HttpResponseForbidden()
+
+    body = metrics_registry.render(metrics_registry.collect())
+    return HttpResponse(body, content_type=metrics_registry.CONTENT_TYPE)
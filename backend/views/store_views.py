@@ -2,17 +2,29 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count, Q, Max, Sum
+from django.db.models import Count, Q, Max, Sum, OuterRef, Subquery, IntegerField
+from django.db.models.functions import Coalesce
+from django.core.files.storage import default_storage
 
+from asl_holdem.cache import cached_view
+from asl_holdem.conditional import aggregate_validators, conditional_get
 from tournaments.models import Tournament
-from stores.models import Store
+from stores.models import Store, Banner
+from seats.models import TournamentTicketDistribution
 from stores.serializers import StoreCreateSerializer, StoreUpdateSerializer
 from stores.permissions import IsAdminOrStoreOwner, IsAdminOnly
+from stores.resolver import get_owner_store
+from stores.images import build_srcset
+from stores.geo import filter_nearby, DEFAULT_RADIUS_KM, MAX_RADIUS_KM
+from accounts.phone import find_user_by_phone, format_phone, normalize_phone
+from rest_framework.pagination import PageNumberPagination
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 import datetime
+import logging
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 class StoreSerializer(serializers.ModelSerializer):
     """
@@ -20,11 +32,12 @@ class StoreSerializer(serializers.ModelSerializer):
     """
     tournament_count = serializers.SerializerMethodField(read_only=True)
     banner_image = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
     
     class Meta:
         model = Store
         fields = [
-            'id', 'name', 'owner', 'address', 'description', 'image', 'banner_image', 'status', 
+            'id', 'name', 'owner', 'address', 'description', 'image', 'image_srcset', 'banner_image', 'status', 
             'latitude', 'longitude',
             'phone_number', 'open_time', 'close_time', 
             'manager_name', 'manager_phone', 'max_capacity',
@@ -32,25 +45,79 @@ class StoreSerializer(serializers.ModelSerializer):
         ]
     
     def get_tournament_count(self, obj):
-        # Tournament 모델에서 해당 매장과 관련된 토너먼트 수를 계산
-        # 현재는 Tournament와 Store 간의 직접적인 관계가 없으므로 0을 반환
-        # 추후 Tournament 모델에 store 필드가 추가되면 수정 필요
-        try:
-            from tournaments.models import Tournament
-            # 임시로 0을 반환 (추후 관계 설정 후 수정)
-            return 0
-        except:
-            return 0
+        # SEAT권이 분배된 토너먼트 수 (annotate_store_summary 결과 우선 사용)
+        count = getattr(obj, 'distributed_tournament_count', None)
+        if count is None:
+            count = obj.ticket_distributions.values('tournament').distinct().count()
+        return count
+    
+    def get_image_srcset(self, obj):
+        # 매장 이미지 리사이즈본의 포맷별 srcset 반환
+        return build_srcset(obj.image_renditions, self.context.get('request'))
     
     def get_banner_image(self, obj):
-        # 매장의 대표 배너 이미지 URL 반환
-        try:
-            banner = obj.banners.filter(is_active=True).first()
-            if banner and banner.image:
-                return banner.image.url
-        except:
-            pass
-        return None
+        # 매장의 대표 배너 이미지 URL 반환 (활성 배너 중 가장 먼저 등록된 배너)
+        if hasattr(obj, 'representative_banner_image'):
+            image_name = obj.representative_banner_image
+        else:
+            banner = obj.banners.filter(is_active=True).order_by('id').first()
+            image_name = banner.image.name if banner else None
+        return default_storage.url(image_name) if image_name else None
+
+
+def annotate_store_summary(queryset):
+    """
+    StoreSerializer가 사용하는 대표 배너 이미지와 분배 토너먼트 수를
+    서브쿼리로 함께 조회하여 매장별 추가 쿼리(N+1)를 제거합니다.
+    """
+    representative_banner = Banner.objects.filter(
+        store=OuterRef('pk'),
+        is_active=True
+    ).order_by('id').values('image')[:1]
+    
+    distributed_tournament_count = TournamentTicketDistribution.objects.filter(
+        store=OuterRef('pk')
+    ).order_by().values('store').annotate(
+        count=Count('tournament', distinct=True)
+    ).values('count')
+    
+    return queryset.annotate(
+        representative_banner_image=Subquery(representative_banner),
+        distributed_tournament_count=Coalesce(
+            Subquery(distributed_tournament_count, output_field=IntegerField()), 0
+        )
+    )
+
+def store_list_validators(view, request):
+    """
+    매장 목록 조건부 GET 검증자 - 매장, 대표 배너(활성 배너), 분배 토너먼트 수(분배 추가/삭제)의 변경을 감지합니다.
+    """
+    return [
+        aggregate_validators(Store.objects.all()),
+        aggregate_validators(Banner.objects.filter(is_active=True)),
+        # 수량 변경(updated_at)은 매장 목록에 영향이 없으므로 추가/삭제만 감지
+        aggregate_validators(TournamentTicketDistribution.objects.all(), updated_field='created_at'),
+    ]
+
+class NearbyStoreSerializer(StoreSerializer):
+    """
+    주변 매장 검색 결과 시리얼라이저 (중심 좌표로부터의 거리 포함)
+    """
+    distance_km = serializers.SerializerMethodField(read_only=True)
+    
+    class Meta(StoreSerializer.Meta):
+        fields = StoreSerializer.Meta.fields + ['distance_km']
+    
+    def get_distance_km(self, obj):
+        return round(obj.distance_km, 3)
+
+class NearbyStorePagination(PageNumberPagination):
+    """
+    주변 매장 검색 페이지네이션
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
 class StoreUserSerializer(serializers.ModelSerializer):
     """
@@ -69,24 +136,64 @@ class StoreViewSet(viewsets.ViewSet):
     """
     permission_classes = [permissions.AllowAny]
     
+    @conditional_get(store_list_validators)
+    @cached_view(Store, Banner, TournamentTicketDistribution)
     def list(self, request):
         """
         모든 매장 목록을 반환합니다.
         """
         try:
             # 한글 정렬 문제 해결을 위해 ID 순으로 정렬
-            stores = Store.objects.all().order_by('id')
+            stores = annotate_store_summary(Store.objects.all()).order_by('id')
             serializer = StoreSerializer(stores, many=True)
             return Response(serializer.data)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['get'])
+    def nearby(self, request):
+        """
+        지정한 좌표 주변의 매장을 가까운 순으로 반환합니다.
+        파라미터:
+        - latitude, longitude: 중심 좌표 (필수)
+        - radius: 검색 반경 km (기본 5km, 최대 50km)
+        - page, page_size: 페이지 번호와 크기 (기본 20개, 최대 100개)
+        """
+        try:
+            latitude = float(request.query_params.get('latitude', ''))
+            longitude = float(request.query_params.get('longitude', ''))
+            radius = float(request.query_params.get('radius', DEFAULT_RADIUS_KM))
+        except ValueError:
+            return Response({"error": "latitude, longitude, radius는 숫자여야 합니다."}, 
+                          status=status.HTTP_400_BAD_REQUEST)
+        
+        if not (-90 <= latitude <= 90) or not (-180 <= longitude <= 180):
+            return Response({"error": "좌표 범위가 올바르지 않습니다."}, 
+                          status=status.HTTP_400_BAD_REQUEST)
+        
+        if radius <= 0 or radius > MAX_RADIUS_KM:
+            return Response({"error": f"검색 반경은 0km 초과 {MAX_RADIUS_KM}km 이하로 지정해주세요."}, 
+                          status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            stores = filter_nearby(
+                annotate_store_summary(Store.objects.exclude(status='CLOSED')),
+                latitude, longitude, radius
+            )
+            
+            paginator = NearbyStorePagination()
+            page = paginator.paginate_queryset(stores, request, view=self)
+            serializer = NearbyStoreSerializer(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
     def retrieve(self, request, pk=None):
         """
         특정 매장의 상세 정보를 반환합니다.
         """
         try:
-            store = Store.objects.get(pk=pk)
+            store = annotate_store_summary(Store.objects.all()).get(pk=pk)
             serializer = StoreSerializer(store)
             return Response(serializer.data)
         except Store.DoesNotExist:
@@ -208,20 +315,15 @@ class StoreViewSet(viewsets.ViewSet):
             # 토큰에서 사용자 정보 확인
             user = request.user
             
-            print(f"=== current_store API 호출 ===")
-            print(f"사용자: {user}")
-            print(f"인증 여부: {user.is_authenticated}")
-            
             if not user.is_authenticated:
                 return Response({"error": "로그인이 필요합니다."}, 
                                status=status.HTTP_401_UNAUTHORIZED)
             
             # 사용자의 매장 정보 가져오기 - owner 필드로 연결된 매장 조회
-            store = Store.objects.filter(owner=user).first()
-            print(f"사용자가 소유한 매장: {store}")
+            store = get_owner_store(request)
             
             if not store:
-                print("연결된 매장 정보가 없음")
+                logger.debug("연결된 매장 정보가 없음 user=%s", user.id)
                 return Response({"error": "연결된 매장 정보가 없습니다."}, 
                                status=status.HTTP_404_NOT_FOUND)
             
@@ -241,12 +343,9 @@ class StoreViewSet(viewsets.ViewSet):
             if not store_data.get('close_time'):
                 store_data['close_time'] = '22:00'
             
-            print(f"응답 데이터: {store_data}")
             return Response(store_data)
         except Exception as e:
-            print(f"current_store 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("current_store 오류: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     @action(detail=False, methods=['put'])
@@ -258,20 +357,15 @@ class StoreViewSet(viewsets.ViewSet):
             # 토큰에서 사용자 정보 확인
             user = request.user
             
-            print(f"=== update_current_store API 호출 ===")
-            print(f"사용자: {user}")
-            print(f"요청 데이터: {request.data}")
-            
             if not user.is_authenticated:
                 return Response({"error": "로그인이 필요합니다."}, 
                                status=status.HTTP_401_UNAUTHORIZED)
             
             # 사용자의 매장 정보 가져오기 - owner 필드로 연결된 매장 조회
-            store = Store.objects.filter(owner=user).first()
-            print(f"사용자가 소유한 매장: {store}")
+            store = get_owner_store(request)
             
             if not store:
-                print("연결된 매장 정보가 없음")
+                logger.debug("연결된 매장 정보가 없음 user=%s", user.id)
                 return Response({"error": "연결된 매장 정보가 없습니다."}, 
                                status=status.HTTP_404_NOT_FOUND)
             
@@ -286,16 +380,14 @@ class StoreViewSet(viewsets.ViewSet):
                 if field in request.data:
                     update_data[field] = request.data[field]
             
-            print(f"업데이트할 데이터: {update_data}")
-            
             # 매장 정보 업데이트
             if update_data:  # 업데이트할 데이터가 있는 경우에만 시리얼라이저 사용
                 serializer = StoreSerializer(store, data=update_data, partial=True)
                 if serializer.is_valid():
                     serializer.save()
-                    print("매장 정보 업데이트 성공")
+                    logger.info("매장 정보 업데이트 store=%s fields=%s", store.id, sorted(update_data))
                 else:
-                    print(f"시리얼라이저 유효성 검사 실패: {serializer.errors}")
+                    logger.info("매장 정보 유효성 검사 실패 store=%s: %s", store.id, serializer.errors)
                     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
             # 업데이트된 매장 정보 다시 조회하여 응답
@@ -303,12 +395,9 @@ class StoreViewSet(viewsets.ViewSet):
             serializer = StoreSerializer(store)
             response_data = serializer.data
             
-            print(f"응답 데이터: {response_data}")
             return Response(response_data)
         except Exception as e:
-            print(f"update_current_store 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("update_current_store 오류: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     @action(detail=False, methods=['post'])
@@ -326,7 +415,7 @@ class StoreViewSet(viewsets.ViewSet):
                                status=status.HTTP_403_FORBIDDEN)
             
             # 매장 관리자와 연결된 매장 조회
-            store = Store.objects.filter(owner=user).first()
+            store = get_owner_store(request)
             if not store:
                 return Response({"error": "연결된 매장 정보가 없습니다."}, 
                                status=status.HTTP_404_NOT_FOUND)
@@ -361,7 +450,7 @@ class StoreViewSet(viewsets.ViewSet):
                 return Response({"error": "owner_id 파라미터가 필요합니다."}, 
                               status=status.HTTP_400_BAD_REQUEST)
             
-            store = Store.objects.filter(owner_id=owner_id).first()
+            store = annotate_store_summary(Store.objects.filter(owner_id=owner_id)).first()
             if not store:
                 return Response({"error": "해당 소유자의 매장을 찾을 수 없습니다."}, 
                               status=status.HTTP_404_NOT_FOUND)
@@ -379,15 +468,6 @@ class StoreViewSet(viewsets.ViewSet):
         try:
             user = request.user
             
-            print(f"=== debug_user API 호출 ===")
-            print(f"사용자: {user}")
-            print(f"인증 여부: {user.is_authenticated}")
-            print(f"사용자 ID: {user.id if user.is_authenticated else 'N/A'}")
-            print(f"전화번호: {user.phone if user.is_authenticated else 'N/A'}")
-            print(f"닉네임: {user.nickname if user.is_authenticated else 'N/A'}")
-            print(f"is_store_owner: {user.is_store_owner if user.is_authenticated else 'N/A'}")
-            print(f"role: {user.role if user.is_authenticated else 'N/A'}")
-            
             if not user.is_authenticated:
                 return Response({"error": "로그인이 필요합니다."}, 
                                status=status.HTTP_401_UNAUTHORIZED)
@@ -412,21 +492,40 @@ class StoreViewSet(viewsets.ViewSet):
                 'store_count': len(store_info)
             }
             
-            print(f"응답 데이터: {user_data}")
             return Response(user_data)
         except Exception as e:
-            print(f"debug_user 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("debug_user 오류: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 from django.db import models 
 
+# 전화번호 앞자리 검색 최소 입력 길이 / 최대 결과 수
+PHONE_PREFIX_MIN_LENGTH = 4
+PHONE_PREFIX_LIMIT = 10
+
+
+def _phone_search_result(user):
+    """전화번호 검색 응답용 사용자 정보"""
+    return {
+        'id': user.id,
+        'username': user.nickname or user.phone,
+        'nickname': user.nickname,
+        'email': user.email,
+        'phone': user.phone,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'birth_date': user.birth_date.strftime('%y%m%d') if user.birth_date else None,
+        'gender_digit': '1' if user.gender == 'M' else '2' if user.gender == 'F' else None,
+    }
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def search_user_by_phone(request):
     """
     휴대폰 번호로 사용자 검색
+    prefix=true이면 입력한 앞자리(PHONE_PREFIX_MIN_LENGTH자리 이상)로 시작하는 사용자를
+    최대 PHONE_PREFIX_LIMIT명 반환합니다. (매장 관리자/관리자만)
     """
     try:
         phone = request.GET.get('phone')
@@ -435,38 +534,34 @@ def search_user_by_phone(request):
                 'error': '휴대폰 번호가 필요합니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # 휴대폰 번호 정규화 (하이픈 제거)
-        normalized_phone = phone.replace('-', '').replace(' ', '')
+        # 휴대폰 번호 정규화 (숫자만 추출)
+        normalized_phone = normalize_phone(phone)
         
-        # 사용자 검색 (여러 형태의 휴대폰 번호 형식 고려)
-        user = None
-        phone_variations = [
-            normalized_phone,
-            phone,
-            f"{normalized_phone[:3]}-{normalized_phone[3:7]}-{normalized_phone[7:]}",
-        ]
+        # 입력 중인 번호 앞자리로 후보 목록 검색 (검색창 자동완성용, 매장 관리자/관리자만)
+        if request.GET.get('prefix') in ('1', 'true', 'True'):
+            user = request.user
+            if not (user.is_staff or user.is_superuser or user.is_store_owner):
+                return Response({
+                    'error': '전화번호 앞자리 검색 권한이 없습니다.'
+                }, status=status.HTTP_403_FORBIDDEN)
+            if len(normalized_phone) < PHONE_PREFIX_MIN_LENGTH:
+                return Response({
+                    'error': f'휴대폰 번호를 {PHONE_PREFIX_MIN_LENGTH}자리 이상 입력해주세요.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            users = User.objects.filter(phone_digits__startswith=normalized_phone).order_by('phone_digits', 'id')[:PHONE_PREFIX_LIMIT]
+            users = [_phone_search_result(user) for user in users]
+            return Response({
+                'found': bool(users),
+                'users': users,
+            })
         
-        for phone_var in phone_variations:
-            try:
-                user = User.objects.get(phone=phone_var)
-                break
-            except User.DoesNotExist:
-                continue
+        # 사용자 검색 (정규화 전화번호 인덱스 단일 조회)
+        user = find_user_by_phone(normalized_phone)
         
         if user:
             return Response({
                 'found': True,
-                'user': {
-                    'id': user.id,
-                    'username': user.nickname or user.phone,
-                    'nickname': user.nickname,
-                    'email': user.email,
-                    'phone': user.phone,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                    'birth_date': user.birth_date.strftime('%y%m%d') if user.birth_date else None,
-                    'gender_digit': '1' if user.gender == 'M' else '2' if user.gender == 'F' else None,
-                }
+                'user': _phone_search_result(user)
             })
         else:
             return Response({
@@ -510,19 +605,8 @@ def register_player_to_tournament(request):
                 }, status=status.HTTP_404_NOT_FOUND)
         elif phone_number:
             # 휴대폰 번호로 사용자 검색
-            normalized_phone = phone_number.replace('-', '').replace(' ', '')
-            phone_variations = [
-                normalized_phone,
-                phone_number,
-                f"{normalized_phone[:3]}-{normalized_phone[3:7]}-{normalized_phone[7:]}",
-            ]
-            
-            for phone_var in phone_variations:
-                try:
-                    user = User.objects.get(phone=phone_var)
-                    break
-                except User.DoesNotExist:
-                    continue
+            normalized_phone = normalize_phone(phone_number)
+            user = find_user_by_phone(normalized_phone)
             
             # 사용자가 없으면 새로 생성
             if not user:
@@ -555,7 +639,7 @@ def register_player_to_tournament(request):
                 user = User.objects.create_user(
                     username=username,
                     email=email,
-                    phone=normalized_phone,  # phone_number -> phone으로 수정
+                    phone=format_phone(normalized_phone),  # 하이픈 포함 저장 형식으로 저장
                     first_name=data.get('firstname', ''),
                     last_name=data.get('lastname', ''),
                     birth_date=birth_date,
@@ -601,7 +685,7 @@ def register_player_to_tournament(request):
                             
                 except Exception as e:
                     # 거래 내역 업데이트 실패해도 메인 로직에는 영향 없음
-                    print(f"기존 SEAT권 거래 내역 업데이트 실패: {e}")
+                    logger.warning("기존 SEAT권 거래 내역 업데이트 실패: %s", e)
             
             # 기존 참가 정보를 로그에 기록
             existing_info = {
@@ -756,19 +840,7 @@ def grant_seat_ticket(request):
                 }, status=status.HTTP_404_NOT_FOUND)
         elif phone_number:
             # 휴대폰 번호로 사용자 검색
-            normalized_phone = phone_number.replace('-', '').replace(' ', '')
-            phone_variations = [
-                normalized_phone,
-                phone_number,
-                f"{normalized_phone[:3]}-{normalized_phone[3:7]}-{normalized_phone[7:]}",
-            ]
-            
-            for phone_var in phone_variations:
-                try:
-                    user = User.objects.get(phone=phone_var)
-                    break
-                except User.DoesNotExist:
-                    continue
+            user = find_user_by_phone(phone_number)
             
             if not user:
                 return Response({
@@ -787,11 +859,10 @@ def grant_seat_ticket(request):
         
         # 좌석권 지급
         from seats.models import SeatTicket, SeatTicketTransaction, UserSeatTicketSummary
-        from stores.models import Store
         from django.db import transaction as db_transaction
         
         # 현재 로그인한 사용자의 매장 정보 가져오기
-        store = Store.objects.filter(owner=request.user).first()
+        store = get_owner_store(request)
         if not store:
             return Response({
                 'error': '매장 정보를 찾을 수 없습니다.'
@@ -870,19 +941,7 @@ def get_user_ticket_status(request):
                 }, status=status.HTTP_404_NOT_FOUND)
         elif phone_number:
             # 휴대폰 번호로 사용자 검색
-            normalized_phone = phone_number.replace('-', '').replace(' ', '')
-            phone_variations = [
-                normalized_phone,
-                phone_number,
-                f"{normalized_phone[:3]}-{normalized_phone[3:7]}-{normalized_phone[7:]}",
-            ]
-            
-            for phone_var in phone_variations:
-                try:
-                    user = User.objects.get(phone=phone_var)
-                    break
-                except User.DoesNotExist:
-                    continue
+            user = find_user_by_phone(phone_number)
             
             if not user:
                 return Response({
@@ -4,16 +4,23 @@ from rest_framework.decorators import action, api_view, permission_classes
 from django.db.models import Count, Sum
 from django.db import connection
 import datetime
+import logging
 from rest_framework.permissions import IsAdminUser
 
+from asl_holdem.cache import cached_view
+from asl_holdem.conditional import ConditionalGetMixin
+from seats.models import TournamentTicketDistribution
 from tournaments.models import Tournament
 from stores.models import Store
+from stores.resolver import get_owner_store
 from tournaments.serializers import (
     TournamentSerializer,
     TournamentParticipantsCountSerializer, TournamentParticipantsResponseSerializer
 )
 
-class TournamentViewSet(viewsets.ModelViewSet):
+logger = logging.getLogger(__name__)
+
+class TournamentViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     토너먼트 관리를 위한 API 뷰셋
     """
@@ -33,27 +40,22 @@ class TournamentViewSet(viewsets.ModelViewSet):
         토너먼트를 생성합니다.
         """
         try:
-            # 요청 데이터 디버깅 출력
-            print("=== 토너먼트 생성 요청 ===")
-            print(f"Content-Type: {request.content_type}")
-            print(f"요청 데이터: {request.data}")
-            print(f"POST 데이터: {request.POST}")
-            print(f"FILES 데이터: {request.FILES}")
+            logger.debug("토너먼트 생성 요청 content_type=%s data=%s files=%s", request.content_type, request.data, request.FILES)
             
             # 데이터 검증
             serializer = self.get_serializer(data=request.data)
             if not serializer.is_valid():
-                print(f"유효성 검사 오류: {serializer.errors}")
+                logger.info("토너먼트 생성 유효성 검사 오류: %s", serializer.errors)
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
             # 토너먼트 생성
             self.perform_create(serializer)
             headers = self.get_success_headers(serializer.data)
-            print(f"생성된 토너먼트: {serializer.data}")
+            logger.info("토너먼트 생성 id=%s name=%s", serializer.data.get('id'), serializer.data.get('name'))
             
             return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
         except Exception as e:
-            print(f"토너먼트 생성 중 예외 발생: {str(e)}")
+            logger.exception("토너먼트 생성 중 예외 발생: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     def list(self, request, *args, **kwargs):
@@ -76,6 +78,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
 
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    @cached_view(Tournament, TournamentTicketDistribution)
     def all_info(self, request):
         """
         모든 토너먼트의 상세 정보를 반환합니다.
@@ -161,10 +164,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
             
             return Response(results)
         except Exception as e:
-            import traceback
             from rest_framework import status as rf_status
-            print(f"❌ 토너먼트 상세 정보 API 오류: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("토너먼트 상세 정보 API 오류: %s", e)
             return Response({"error": str(e)}, status=rf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny], url_path='dashboard/stats')
@@ -188,10 +189,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
             
             return Response(result)
         except Exception as e:
-            import traceback
             from rest_framework import status as rf_status
-            print(f"대시보드 통계 API 오류: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("대시보드 통계 API 오류: %s", e)
             return Response({"error": str(e)}, status=rf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny], url_path='dashboard/player_mapping')
@@ -223,10 +222,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
             
             return Response(result)
         except Exception as e:
-            import traceback
             from rest_framework import status as rf_status
-            print(f"대시보드 플레이어 매핑 API 오류: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("대시보드 플레이어 매핑 API 오류: %s", e)
             return Response({"error": str(e)}, status=rf_status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'])
@@ -239,31 +236,27 @@ class TournamentViewSet(viewsets.ModelViewSet):
         """
         try:
             from seats.models import TournamentTicketDistribution
-            from stores.models import Store
-            
-            print("=== store_tournaments API 호출됨 ===")
-            print(f"요청 사용자: {request.user}")
-            print(f"인증 여부: {request.user.is_authenticated}")
             
             # 현재 로그인한 사용자 확인
             user = request.user
             if not user.is_authenticated:
-                print("인증되지 않은 사용자")
                 return Response({"error": "로그인이 필요합니다."}, 
                               status=status.HTTP_401_UNAUTHORIZED)
             
-            print(f"사용자 정보: ID={user.id}, 스태프={user.is_staff}, 슈퍼유저={user.is_superuser}, 매장관리자={user.is_store_owner}, 역할={user.role}")
+            logger.debug(
+                "store_tournaments user=%s staff=%s superuser=%s store_owner=%s role=%s",
+                user.id, user.is_staff, user.is_superuser, user.is_store_owner, user.role,
+            )
             
             # 관리자 권한 확인 (더 유연한 조건으로 수정)
             # 1. 스태프 또는 슈퍼유저
             # 2. 역할이 ADMIN인 경우
             # 3. 매장 관리자 권한이 있는 경우
             is_admin = user.is_staff or user.is_superuser or user.role == 'ADMIN'
-            is_store_manager = user.is_store_owner or Store.objects.filter(owner=user).exists()
+            is_store_manager = user.is_store_owner or get_owner_store(request) is not None
             
             # 관리자 권한이 있는 경우 모든 토너먼트 조회
             if is_admin:
-                print("🔧 관리자 권한 - 모든 토너먼트 조회")
                 tournaments = Tournament.objects.all().order_by('-start_time')
                 
                 response_data = []
@@ -287,19 +280,16 @@ class TournamentViewSet(viewsets.ModelViewSet):
                     }
                     response_data.append(tournament_data)
                 
-                print(f"✅ 관리자 - 전체 토너먼트 수: {len(response_data)}")
+                logger.debug("store_tournaments 관리자 - 전체 토너먼트 %d개", len(response_data))
                 return Response(response_data)
             
             # 매장 관리자 권한이 있는 경우
             elif is_store_manager:
-                print("🏪 매장 관리자 권한 - 매장 배분 토너먼트 조회")
-                
                 # 사용자의 매장 정보 가져오기
-                store = Store.objects.filter(owner=user).first()
-                print(f"사용자가 소유한 매장: {store}")
+                store = get_owner_store(request)
                 
                 if not store:
-                    print("⚠️ 매장 정보 없음 - 모든 토너먼트 반환 (임시 조치)")
+                    logger.info("store_tournaments 매장 정보 없음 - 모든 토너먼트 반환 user=%s", user.id)
                     # 매장 정보가 없어도 일단 모든 토너먼트를 반환하여 사용자가 선택할 수 있도록 함
                     tournaments = Tournament.objects.all().order_by('-start_time')
                     
@@ -323,11 +313,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
                         }
                         response_data.append(tournament_data)
                     
-                    print(f"✅ 임시 조치 - 전체 토너먼트 수: {len(response_data)}")
                     return Response(response_data)
                 
-                print(f"매장 정보: {store}")
-                
                 # 본사에서 해당 매장에 SEAT권이 발급된 토너먼트들만 조회
                 tournaments = Tournament.objects.filter(
                     ticket_distributions__store=store
@@ -335,11 +322,9 @@ class TournamentViewSet(viewsets.ModelViewSet):
                     'ticket_distributions'
                 ).distinct().order_by('-start_time')
                 
-                print(f"🎯 해당 매장({store.name})에 배분된 토너먼트 수: {tournaments.count()}")
-                
                 # 배분된 토너먼트가 없는 경우 모든 토너먼트를 반환 (사용자 편의성 증대)
                 if tournaments.count() == 0:
-                    print("⚠️ 이 매장에 배분된 토너먼트가 없습니다. 모든 토너먼트를 반환합니다.")
+                    logger.debug("store_tournaments 매장 %s에 배분된 토너먼트 없음 - 모든 토너먼트 반환", store.id)
                     tournaments = Tournament.objects.all().order_by('-start_time')
                     
                     response_data = []
@@ -362,17 +347,13 @@ class TournamentViewSet(viewsets.ModelViewSet):
                         }
                         response_data.append(tournament_data)
                     
-                    print(f"✅ 전체 토너먼트 반환 - {len(response_data)}개")
                     return Response(response_data)
                 
                 # 응답 데이터 구성
                 response_data = []
                 for tournament in tournaments:
-                    print(f"처리 중인 토너먼트: {tournament.name}")
-                    
                     # 해당 매장의 배분 정보 조회
                     distribution = tournament.ticket_distributions.filter(store=store).first()
-                    print(f"배분 정보: {distribution}")
                     
                     tournament_data = {
                         'id': tournament.id,
@@ -404,14 +385,12 @@ class TournamentViewSet(viewsets.ModelViewSet):
                         })
                     
                     response_data.append(tournament_data)
-                    print(f"추가된 토너먼트 데이터: {tournament_data}")
                 
-                print(f"최종 응답 데이터 수: {len(response_data)}")
+                logger.debug("store_tournaments 매장 %s - 배분 토너먼트 %d개", store.id, len(response_data))
                 return Response(response_data)
             
             # 그 외의 경우 - 일반 사용자도 토너먼트 목록은 볼 수 있도록 허용
             else:
-                print("👤 일반 사용자 - 모든 토너먼트 조회 허용")
                 tournaments = Tournament.objects.all().order_by('-start_time')
                 
                 response_data = []
@@ -434,13 +413,11 @@ class TournamentViewSet(viewsets.ModelViewSet):
                     }
                     response_data.append(tournament_data)
                 
-                print(f"✅ 일반 사용자 - 전체 토너먼트 수: {len(response_data)}")
+                logger.debug("store_tournaments 일반 사용자 - 전체 토너먼트 %d개", len(response_data))
                 return Response(response_data)
             
         except Exception as e:
-            print(f"매장 토너먼트 목록 조회 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("매장 토너먼트 목록 조회 오류: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     @action(detail=True, methods=['post'])
@@ -456,10 +433,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
                                status=status.HTTP_401_UNAUTHORIZED)
             
             # 사용자의 매장 정보 가져오기
-            if hasattr(user, 'stores'):
-                store = user.stores.first()
-            else:
-                store = None
+            store = get_owner_store(request)
             
             if not store:
                 return Response({"error": "매장 관리자 권한이 없습니다."}, 
@@ -488,13 +462,11 @@ class TournamentViewSet(viewsets.ModelViewSet):
             tournament.status = 'CANCELLED'
             tournament.save()
             
-            print(f"토너먼트 '{tournament.name}' 취소됨 - 매장: {store.name}")
+            logger.info("토너먼트 취소 tournament=%s store=%s", tournament.id, store.id)
             
             return Response({"message": f"토너먼트 '{tournament.name}'이(가) 취소되었습니다."})
         except Exception as e:
-            print(f"토너먼트 취소 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("토너먼트 취소 오류: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -559,7 +531,5 @@ def get_dashboard_stats_simple(request):
         
         return Response(result)
     except Exception as e:
-        import traceback
-        print(f"대시보드 통계 API 오류: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("대시보드 통계 API 오류: %s", e)
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR) 
\ No newline at end of file
@@ -3,12 +3,23 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from django.db.models import Q, Count, Max
+from django.db.models import Count, Max
+from django.utils.dateparse import parse_date
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 import logging
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from tournaments.models import Tournament
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.urls import reverse
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET
+
+from accounts.guests import create_guest
+from accounts.stats import live_user_stats, rollup_user_stats
+from accounts.phone import find_user_by_phone, format_phone, is_mobile_phone, normalize_phone
+from accounts.qr import CONTENT_TYPES, get_scan_profile, parse_payload, qr_etag, qr_payload, render_qr, uuid_matches
 
 # API 로거 생성
 api_logger = logging.getLogger('api')
@@ -23,47 +34,38 @@ class StoreManagerTokenObtainPairSerializer(TokenObtainPairSerializer):
         phone = attrs.get('phone')
         password = attrs.get('password')
         
-        print(f"[STORE LOGIN] 매장관리자 로그인 시도 - 전화번호: {phone}")
+        api_logger.debug("[STORE LOGIN] 매장관리자 로그인 시도 - 전화번호: %s", phone)
         
         if not phone or not password:
-            print(f"[STORE LOGIN] 전화번호 또는 비밀번호 누락")
+            api_logger.info("[STORE LOGIN] 전화번호 또는 비밀번호 누락")
             raise serializers.ValidationError("전화번호와 비밀번호가 필요합니다.")
         
-        # 전화번호 형식 정규화
-        # 하이픈 제거하고 숫자만 추출
-        clean_phone = ''.join(filter(str.isdigit, phone))
-        print(f"[STORE LOGIN] 정규화된 전화번호: {clean_phone}")
+        # 전화번호 형식 정규화 (숫자만 추출)
+        clean_phone = normalize_phone(phone)
         
         # 11자리 숫자인지 확인
-        if len(clean_phone) != 11 or not clean_phone.startswith('010'):
-            print(f"[STORE LOGIN] 전화번호 형식 오류 - 길이: {len(clean_phone)}, 시작: {clean_phone[:3]}")
+        if not is_mobile_phone(clean_phone):
+            api_logger.info("[STORE LOGIN] 전화번호 형식 오류 - 길이: %d", len(clean_phone))
             raise serializers.ValidationError("올바른 전화번호 형식이 아닙니다.")
         
-        # 하이픈 포함 형식으로 변환 (데이터베이스 저장 형식)
-        formatted_phone = f"{clean_phone[:3]}-{clean_phone[3:7]}-{clean_phone[7:]}"
-        print(f"[STORE LOGIN] 포맷된 전화번호: {formatted_phone}")
-        
-        try:
-            user = User.objects.get(phone=formatted_phone)
-            print(f"[STORE LOGIN] 사용자 찾음 - ID: {user.id}, 닉네임: {user.nickname}")
-            print(f"[STORE LOGIN] 사용자 상태 - 활성: {user.is_active}, 매장관리자: {user.is_store_owner}")
-        except User.DoesNotExist:
-            print(f"[STORE LOGIN] 사용자 없음 - {formatted_phone}")
+        user = find_user_by_phone(clean_phone)
+        if user is None:
+            api_logger.info("[STORE LOGIN] 사용자 없음 - %s", clean_phone)
             raise serializers.ValidationError("전화번호 또는 비밀번호가 올바르지 않습니다.")
         
         if not user.check_password(password):
-            print(f"[STORE LOGIN] 비밀번호 불일치")
+            api_logger.info("[STORE LOGIN] 비밀번호 불일치 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("전화번호 또는 비밀번호가 올바르지 않습니다.")
         
         if not user.is_active:
-            print(f"[STORE LOGIN] 비활성화된 계정")
+            api_logger.info("[STORE LOGIN] 비활성화된 계정 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("비활성화된 계정입니다.")
         
         if not user.is_store_owner:
-            print(f"[STORE LOGIN] 매장관리자 권한 없음 - is_store_owner: {user.is_store_owner}")
+            api_logger.info("[STORE LOGIN] 매장관리자 권한 없음 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("매장 관리자 권한이 없습니다.")
         
-        print(f"[STORE LOGIN] 로그인 성공!")
+        api_logger.info("[STORE LOGIN] 로그인 성공 - 사용자 ID: %s", user.id)
         
         # 직접 토큰 생성 (super().validate() 호출 제거)
         refresh = self.get_token(user)
@@ -91,53 +93,44 @@ class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
         phone = attrs.get('phone')
         password = attrs.get('password')
         
-        print(f"[USER LOGIN] 일반사용자 로그인 시도 - 전화번호: {phone}")
+        api_logger.debug("[USER LOGIN] 일반사용자 로그인 시도 - 전화번호: %s", phone)
         
         if not phone or not password:
-            print(f"[USER LOGIN] 전화번호 또는 비밀번호 누락")
+            api_logger.info("[USER LOGIN] 전화번호 또는 비밀번호 누락")
             raise serializers.ValidationError("전화번호와 비밀번호가 필요합니다.")
         
-        # 전화번호 형식 정규화
-        # 하이픈 제거하고 숫자만 추출
-        clean_phone = ''.join(filter(str.isdigit, phone))
-        print(f"[USER LOGIN] 정규화된 전화번호: {clean_phone}")
+        # 전화번호 형식 정규화 (숫자만 추출)
+        clean_phone = normalize_phone(phone)
         
         # 11자리 숫자인지 확인
-        if len(clean_phone) != 11 or not clean_phone.startswith('010'):
-            print(f"[USER LOGIN] 전화번호 형식 오류 - 길이: {len(clean_phone)}, 시작: {clean_phone[:3] if clean_phone else 'None'}")
+        if not is_mobile_phone(clean_phone):
+            api_logger.info("[USER LOGIN] 전화번호 형식 오류 - 길이: %d", len(clean_phone or ''))
             raise serializers.ValidationError("올바른 전화번호 형식이 아닙니다.")
         
-        # 하이픈 포함 형식으로 변환 (데이터베이스 저장 형식)
-        formatted_phone = f"{clean_phone[:3]}-{clean_phone[3:7]}-{clean_phone[7:]}"
-        print(f"[USER LOGIN] 포맷된 전화번호: {formatted_phone}")
-        
-        try:
-            user = User.objects.get(phone=formatted_phone)
-            print(f"[USER LOGIN] 사용자 찾음 - ID: {user.id}, 닉네임: {user.nickname}")
-            print(f"[USER LOGIN] 사용자 상태 - 활성: {user.is_active}, 매장관리자: {user.is_store_owner}, 스태프: {user.is_staff}")
-        except User.DoesNotExist:
-            print(f"[USER LOGIN] 사용자 없음 - {formatted_phone}")
+        user = find_user_by_phone(clean_phone)
+        if user is None:
+            api_logger.info("[USER LOGIN] 사용자 없음 - %s", clean_phone)
             raise serializers.ValidationError("전화번호 또는 비밀번호가 올바르지 않습니다.")
         
         if not user.check_password(password):
-            print(f"[USER LOGIN] 비밀번호 불일치")
+            api_logger.info("[USER LOGIN] 비밀번호 불일치 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("전화번호 또는 비밀번호가 올바르지 않습니다.")
         
         if not user.is_active:
-            print(f"[USER LOGIN] 비활성화된 계정")
+            api_logger.info("[USER LOGIN] 비활성화된 계정 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("비활성화된 계정입니다.")
         
         # 매장관리자 계정은 일반사용자 API로 로그인 불가
         if user.is_store_owner:
-            print(f"[USER LOGIN] 매장관리자 계정으로 일반사용자 로그인 시도")
+            api_logger.info("[USER LOGIN] 매장관리자 계정으로 일반사용자 로그인 시도 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("매장관리자 계정입니다. 매장관리자 로그인을 이용해주세요.")
         
         # 관리자 계정은 일반사용자 API로 로그인 불가  
         if user.is_staff or user.is_superuser:
-            print(f"[USER LOGIN] 관리자 계정으로 일반사용자 로그인 시도")
+            api_logger.info("[USER LOGIN] 관리자 계정으로 일반사용자 로그인 시도 - 사용자 ID: %s", user.id)
             raise serializers.ValidationError("관리자 계정입니다. 관리자 로그인을 이용해주세요.")
         
-        print(f"[USER LOGIN] 로그인 성공!")
+        api_logger.info("[USER LOGIN] 로그인 성공 - 사용자 ID: %s", user.id)
         
         # 직접 토큰 생성
         refresh = self.get_token(user)
@@ -167,20 +160,15 @@ class AdminTokenObtainPairSerializer(TokenObtainPairSerializer):
         if not phone or not password:
             raise serializers.ValidationError("전화번호와 비밀번호가 필요합니다.")
         
-        # 전화번호 형식 정규화
-        # 하이픈 제거하고 숫자만 추출
-        clean_phone = ''.join(filter(str.isdigit, phone))
+        # 전화번호 형식 정규화 (숫자만 추출)
+        clean_phone = normalize_phone(phone)
         
         # 11자리 숫자인지 확인
-        if len(clean_phone) != 11 or not clean_phone.startswith('010'):
+        if not is_mobile_phone(clean_phone):
             raise serializers.ValidationError("올바른 전화번호 형식이 아닙니다.")
         
-        # 하이픈 포함 형식으로 변환 (데이터베이스 저장 형식)
-        formatted_phone = f"{clean_phone[:3]}-{clean_phone[3:7]}-{clean_phone[7:]}"
-        
-        try:
-            user = User.objects.get(phone=formatted_phone)
-        except User.DoesNotExist:
+        user = find_user_by_phone(clean_phone)
+        if user is None:
             raise serializers.ValidationError("전화번호 또는 비밀번호가 올바르지 않습니다.")
         
         if not user.check_password(password):
@@ -216,22 +204,25 @@ class StoreManagerTokenObtainPairView(TokenObtainPairView):
     serializer_class = StoreManagerTokenObtainPairSerializer
     
     def post(self, request, *args, **kwargs):
-        # 요청 데이터 로깅 (비밀번호는 제외)
-        log_data = request.data.copy()
-        if 'password' in log_data:
-            log_data['password'] = '******'
-        api_logger.info(f"매장관리자 로그인 요청: {log_data}")
+        # 요청 데이터 로깅 (비밀번호는 제외, DEBUG 레벨에서만 복사)
+        debug = api_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            log_data = request.data.copy()
+            if 'password' in log_data:
+                log_data['password'] = '******'
+            api_logger.debug("매장관리자 로그인 요청: %s", log_data)
         
         # 원래 메서드 호출
         response = super().post(request, *args, **kwargs)
         
         # 응답 로깅 (민감한 정보는 제외)
-        log_response = response.data.copy() if hasattr(response, 'data') else {}
-        if 'access' in log_response:
-            log_response['access'] = log_response['access'][:10] + '...'
-        if 'refresh' in log_response:
-            log_response['refresh'] = log_response['refresh'][:10] + '...'
-        api_logger.info(f"매장관리자 로그인 응답: {log_response}")
+        if debug:
+            log_response = response.data.copy() if hasattr(response, 'data') else {}
+            if 'access' in log_response:
+                log_response['access'] = log_response['access'][:10] + '...'
+            if 'refresh' in log_response:
+                log_response['refresh'] = log_response['refresh'][:10] + '...'
+            api_logger.debug("매장관리자 로그인 응답: %s", log_response)
         
         return response
 
@@ -240,22 +231,25 @@ class UserTokenObtainPairView(TokenObtainPairView):
     serializer_class = UserTokenObtainPairSerializer
     
     def post(self, request, *args, **kwargs):
-        # 요청 데이터 로깅 (비밀번호는 제외)
-        log_data = request.data.copy()
-        if 'password' in log_data:
-            log_data['password'] = '******'
-        api_logger.info(f"일반 사용자 로그인 요청: {log_data}")
+        # 요청 데이터 로깅 (비밀번호는 제외, DEBUG 레벨에서만 복사)
+        debug = api_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            log_data = request.data.copy()
+            if 'password' in log_data:
+                log_data['password'] = '******'
+            api_logger.debug("일반 사용자 로그인 요청: %s", log_data)
         
         # 원래 메서드 호출
         response = super().post(request, *args, **kwargs)
         
         # 응답 로깅 (민감한 정보는 제외)
-        log_response = response.data.copy() if hasattr(response, 'data') else {}
-        if 'access' in log_response:
-            log_response['access'] = log_response['access'][:10] + '...'
-        if 'refresh' in log_response:
-            log_response['refresh'] = log_response['refresh'][:10] + '...'
-        api_logger.info(f"일반 사용자 로그인 응답: {log_response}")
+        if debug:
+            log_response = response.data.copy() if hasattr(response, 'data') else {}
+            if 'access' in log_response:
+                log_response['access'] = log_response['access'][:10] + '...'
+            if 'refresh' in log_response:
+                log_response['refresh'] = log_response['refresh'][:10] + '...'
+            api_logger.debug("일반 사용자 로그인 응답: %s", log_response)
         
         return response
 
@@ -264,22 +258,25 @@ class AdminTokenObtainPairView(TokenObtainPairView):
     serializer_class = AdminTokenObtainPairSerializer
     
     def post(self, request, *args, **kwargs):
-        # 요청 데이터 로깅 (비밀번호는 제외)
-        log_data = request.data.copy()
-        if 'password' in log_data:
-            log_data['password'] = '******'
-        api_logger.info(f"관리자 로그인 요청: {log_data}")
+        # 요청 데이터 로깅 (비밀번호는 제외, DEBUG 레벨에서만 복사)
+        debug = api_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            log_data = request.data.copy()
+            if 'password' in log_data:
+                log_data['password'] = '******'
+            api_logger.debug("관리자 로그인 요청: %s", log_data)
         
         # 원래 메서드 호출
         response = super().post(request, *args, **kwargs)
         
         # 응답 로깅 (민감한 정보는 제외)
-        log_response = response.data.copy() if hasattr(response, 'data') else {}
-        if 'access' in log_response:
-            log_response['access'] = log_response['access'][:10] + '...'
-        if 'refresh' in log_response:
-            log_response['refresh'] = log_response['refresh'][:10] + '...'
-        api_logger.info(f"관리자 로그인 응답: {log_response}")
+        if debug:
+            log_response = response.data.copy() if hasattr(response, 'data') else {}
+            if 'access' in log_response:
+                log_response['access'] = log_response['access'][:10] + '...'
+            if 'refresh' in log_response:
+                log_response['refresh'] = log_response['refresh'][:10] + '...'
+            api_logger.debug("관리자 로그인 응답: %s", log_response)
         
         return response
 
@@ -309,6 +306,28 @@ class UserSerializer(serializers.ModelSerializer):
     birth_date = serializers.DateField(required=False, allow_null=True)
     gender = serializers.ChoiceField(choices=[('M', '남성'), ('F', '여성'), ('O', '기타')], required=False, allow_null=True)
     
+    # 추가 쿼리가 필요한 다대다 필드 (요청한 경우에만 prefetch)
+    RELATION_FIELDS = {
+        'groups': 'groups',
+        'groups_list': 'groups',
+        'user_permissions': 'user_permissions',
+        'user_permissions_list': 'user_permissions',
+    }
+    
+    def __init__(self, *args, **kwargs):
+        # fields: 응답에 포함할 필드 목록 (sparse fieldset)
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+    
+    @classmethod
+    def prefetch_fields(cls, fields=None):
+        """요청한 필드에 필요한 prefetch_related 대상 목록을 반환합니다."""
+        names = cls.RELATION_FIELDS if fields is None else [name for name in fields if name in cls.RELATION_FIELDS]
+        return sorted({cls.RELATION_FIELDS[name] for name in names})
+    
     class Meta:
         model = User
         fields = [
@@ -363,7 +382,7 @@ class UserSerializer(serializers.ModelSerializer):
             user.save()
             return user
         except Exception as e:
-            api_logger.error(f"사용자 생성 중 오류: {str(e)}", exc_info=True)
+            api_logger.error("사용자 생성 중 오류: %s", e, exc_info=True)
             raise e
     
     def update(self, instance, validated_data):
@@ -392,13 +411,35 @@ class UserStatsSerializer(serializers.Serializer):
     """
     사용자 통계 정보 시리얼라이저
     """
+    id = serializers.IntegerField()
     phone = serializers.CharField()
-    email = serializers.EmailField()
-    tournaments_count = serializers.IntegerField()
-    checked_in_count = serializers.IntegerField()
-    total_spent = serializers.DecimalField(max_digits=10, decimal_places=2)
-    last_tournament = serializers.DateTimeField()
+    nickname = serializers.CharField(allow_null=True)
+    email = serializers.EmailField(allow_blank=True)
     is_active = serializers.BooleanField()
+    tournaments_count = serializers.IntegerField()
+    last_participation = serializers.DateTimeField(allow_null=True)
+    tickets_held = serializers.IntegerField(required=False)
+    tickets_granted = serializers.IntegerField(required=False)
+    tickets_used = serializers.IntegerField()
+    tickets_total = serializers.IntegerField(required=False)
+    total_spent = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+class UserCursorPagination(CursorPagination):
+    """
+    사용자 목록 커서 페이지네이션 (최근 가입순)
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-id'
+
+class UserStatsPagination(PageNumberPagination):
+    """
+    사용자 통계 페이지네이션
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
 
 class UserViewSet(viewsets.ViewSet):
     """
@@ -412,22 +453,23 @@ class UserViewSet(viewsets.ViewSet):
         새로운 사용자를 생성합니다.
         """
         try:
-            # 요청 데이터 로깅 (비밀번호 제외)
-            request_data = request.data.copy()
-            if 'password' in request_data:
-                request_data['password'] = '[HIDDEN]'
-            api_logger.info(f"회원가입 요청 데이터: {request_data}")
+            # 요청 데이터 로깅 (비밀번호 제외, DEBUG 레벨에서만 복사)
+            if api_logger.isEnabledFor(logging.DEBUG):
+                request_data = request.data.copy()
+                if 'password' in request_data:
+                    request_data['password'] = '[HIDDEN]'
+                api_logger.debug("회원가입 요청 데이터: %s", request_data)
             
             serializer = UserSerializer(data=request.data)
             if serializer.is_valid():
                 user = serializer.save()
-                api_logger.info(f"회원가입 성공: {user.phone} (ID: {user.id})")
+                api_logger.info("회원가입 성공: %s (ID: %s)", user.phone, user.id)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             else:
-                api_logger.error(f"회원가입 유효성 검사 실패: {serializer.errors}")
+                api_logger.info("회원가입 유효성 검사 실패: %s", serializer.errors)
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            api_logger.error(f"회원가입 중 예외 발생: {str(e)}", exc_info=True)
+            api_logger.error("회원가입 중 예외 발생: %s", e, exc_info=True)
             return Response({
                 'error': '회원가입 처리 중 오류가 발생했습니다.',
                 'detail': str(e)
@@ -448,7 +490,9 @@ class UserViewSet(viewsets.ViewSet):
             if user_id:
                 user = User.objects.get(id=user_id)
             else:
-                user = User.objects.get(phone=phone)
+                user = find_user_by_phone(phone)
+                if user is None:
+                    raise User.DoesNotExist
             
             serializer = UserSerializer(user)
             return Response(serializer.data)
@@ -521,47 +565,82 @@ class UserViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def get_all_users(self, request):
         """
-        모든 사용자 목록을 조회합니다. role 파라미터(ADMIN, STORE_OWNER, USER)로 필터링 가능
-        ADMIN: is_superuser=True 또는 role='ADMIN'
-        STORE_OWNER(매장관리자)): is_store_owner=True 또는 role='STORE_OWNER'
-        USER: is_superuser=False, is_store_owner=False, role='USER'
+        사용자 목록을 커서 페이지 단위로 조회합니다. role 파라미터(ADMIN, STORE_OWNER, USER)로 필터링 가능
+        권한 필드(is_superuser, is_store_owner)는 저장 시 역할에 맞춰 설정되므로 역할만으로 필터링합니다.
+        (users_role_id_idx 인덱스로 역할별 ID 순 조회)
+        
+        - fields: 응답에 포함할 필드 (예: fields=id,phone,nickname,role)
+          groups/user_permissions 관련 필드를 요청한 경우에만 해당 관계를 조회합니다.
+        - cursor, page_size: 커서 페이지네이션 (기본 50명, 최대 200명)
         """
         role = request.query_params.get('role')
         users = User.objects.all()
-        if role == 'ADMIN':
-            users = users.filter(Q(is_superuser=True) | Q(role='ADMIN'))
-        elif role == 'STORE_OWNER':
-            users = users.filter(Q(is_store_owner=True) | Q(role='STORE_OWNER'))
-        elif role == 'USER':
-            users = users.filter(Q(is_superuser=False) & Q(is_store_owner=False) & Q(role='USER'))
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+        if role in ('ADMIN', 'STORE_OWNER', 'USER'):
+            users = users.filter(role=role)
+        
+        fields = request.query_params.get('fields')
+        fields = [name.strip() for name in fields.split(',') if name.strip()] if fields else None
+        if fields is not None:
+            unknown = set(fields) - set(UserSerializer().fields)
+            if unknown:
+                return Response({"error": f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"},
+                              status=status.HTTP_400_BAD_REQUEST)
+        
+        prefetch = UserSerializer.prefetch_fields(fields)
+        if prefetch:
+            users = users.prefetch_related(*prefetch)
+        
+        paginator = UserCursorPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        serializer = UserSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def get_user_stats(self, request):
         """
-        사용자 통계 정보를 조회합니다.
+        사용자 통계 정보를 조회합니다. (페이지 단위)
+        - 참가 토너먼트 수, 마지막 참가 시간, 보유/사용 좌석권 수, 좌석권 금액 합계
+        - date_from, date_to (YYYY-MM-DD): 참가/좌석권 생성일 기준 기간 필터
+        - source=rollup: 일일 집계 테이블(rollup_user_stats 명령)에서 합산
         """
-        users = User.objects.annotate(
-            tournaments_count=Count('tournament_registrations'),
-            checked_in_count=Count('tournament_registrations', filter=Q(tournament_registrations__checked_in=True)),
-            last_tournament=Max('tournament_registrations__registered_at')
-        )
-        
-        stats = []
-        for user in users:
-            total_spent = sum(reg.paid_amount for reg in user.tournament_registrations.all() if reg.paid_amount)
-            stats.append({
+        dates = {}
+        for param in ('date_from', 'date_to'):
+            value = request.query_params.get(param)
+            try:
+                dates[param] = parse_date(value) if value else None
+            except ValueError:
+                dates[param] = None
+            if value and dates[param] is None:
+                return Response({"error": "날짜는 YYYY-MM-DD 형식으로 입력해주세요."},
+                              status=status.HTTP_400_BAD_REQUEST)
+        
+        source = request.query_params.get('source', 'live')
+        if source not in ('live', 'rollup'):
+            return Response({"error": "source는 live 또는 rollup만 가능합니다."},
+                          status=status.HTTP_400_BAD_REQUEST)
+        
+        # 사용자 페이지를 먼저 정한 뒤 해당 사용자들만 집계
+        users = User.objects.only('id', 'phone', 'nickname', 'email', 'is_active').order_by('id')
+        paginator = UserStatsPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        
+        user_ids = [user.id for user in page]
+        aggregate = rollup_user_stats if source == 'rollup' else live_user_stats
+        stats_by_user = aggregate(user_ids, dates['date_from'], dates['date_to'])
+        
+        stats = [
+            {
+                'id': user.id,
                 'phone': user.phone,
+                'nickname': user.nickname,
                 'email': user.email,
-                'tournaments_count': user.tournaments_count,
-                'checked_in_count': user.checked_in_count,
-                'total_spent': float(total_spent) if total_spent else 0,
-                'last_tournament': user.last_tournament,
-                'is_active': user.is_active
-            })
-            
-        return Response(stats)
+                'is_active': user.is_active,
+                **stats_by_user[user.id],
+            }
+            for user in page
+        ]
+        
+        return paginator.get_paginated_response(UserStatsSerializer(stats, many=True).data)
     
     @action(detail=False, methods=['post'])
     def get_user_by_phone(self, request):
@@ -576,7 +655,9 @@ class UserViewSet(viewsets.ViewSet):
             )
             
         try:
-            user = User.objects.get(phone=phone)
+            user = find_user_by_phone(phone)
+            if user is None:
+                raise User.DoesNotExist
             serializer = UserSerializer(user)
             return Response(serializer.data)
         except User.DoesNotExist:
@@ -599,15 +680,15 @@ class UserViewSet(viewsets.ViewSet):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             # 전화번호 형식 검증 및 정규화
-            clean_phone = ''.join(filter(str.isdigit, phone))
-            if len(clean_phone) != 11 or not clean_phone.startswith('010'):
+            clean_phone = normalize_phone(phone)
+            if not is_mobile_phone(clean_phone):
                 return Response({
                     'error': '올바른 전화번호 형식이 아닙니다.'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            formatted_phone = f"{clean_phone[:3]}-{clean_phone[3:7]}-{clean_phone[7:]}"
-              # 사용자 존재 여부 확인
-            exists = User.objects.filter(phone=formatted_phone).exists()
+            formatted_phone = format_phone(clean_phone)
+            # 사용자 존재 여부 확인 (하이픈 유무와 관계없이 확인)
+            exists = User.objects.filter(phone_digits=clean_phone).exists()
             
             return Response({
                 'exists': exists,
@@ -616,7 +697,7 @@ class UserViewSet(viewsets.ViewSet):
             })
             
         except Exception as e:
-            api_logger.error(f"전화번호 확인 중 오류: {str(e)}")
+            api_logger.error("전화번호 확인 중 오류: %s", e)
             return Response({
                 'error': f'전화번호 확인 중 오류가 발생했습니다: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -655,7 +736,7 @@ class UserViewSet(viewsets.ViewSet):
             })
             
         except Exception as e:
-            api_logger.error(f"닉네임 확인 중 오류: {str(e)}")
+            api_logger.error("닉네임 확인 중 오류: %s", e)
             return Response({
                 'error': f'닉네임 확인 중 오류가 발생했습니다: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -673,59 +754,10 @@ class UserViewSet(viewsets.ViewSet):
             memo = request.data.get('memo', '').strip()
             expires_days = request.data.get('expires_days', 30)  # 기본 30일
             
-            # 게스트 닉네임 자동 생성 (닉네임이 없는 경우)
-            if not nickname:
-                import random
-                import string
-                # "게스트_랜덤5자리" 형태로 생성
-                random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-                nickname = f"게스트_{random_suffix}"
-            
-            # 닉네임 중복 확인 (게스트 사용자 간)
-            counter = 1
-            original_nickname = nickname
-            while User.objects.filter(nickname=nickname, role='GUEST').exists():
-                nickname = f"{original_nickname}_{counter}"
-                counter += 1
-            
-            # 게스트 전용 임시 전화번호 생성 (중복되지 않는 임시번호)
-            import time
-            timestamp = str(int(time.time()))[-8:]  # 타임스탬프 뒤 8자리
-            guest_phone = f"999-{timestamp[:4]}-{timestamp[4:]}"
-            
-            # 전화번호 중복 확인
-            counter = 1
-            original_phone = guest_phone
-            while User.objects.filter(phone=guest_phone).exists():
-                guest_phone = f"999-{timestamp[:4]}-{str(int(timestamp[4:]) + counter).zfill(4)}"
-                counter += 1
-            
-            # 게스트 전용 임시 이메일 생성
-            guest_email = f"guest_{timestamp}@guest.temp"
-            
-            # 만료일 계산
-            from datetime import datetime, timedelta
-            expires_at = datetime.now() + timedelta(days=int(expires_days))
-            
-            # 게스트 사용자 생성 (username 필드 설정으로 unique constraint 해결)
-            guest_user = User.objects.create(
-                username=guest_phone,  # phone 번호를 username으로 사용하여 unique constraint 해결
-                phone=guest_phone,
-                nickname=nickname,
-                email=guest_email,
-                role='GUEST',
-                is_active=True,
-                is_verified=True,  # 게스트는 즉시 사용 가능
-                first_name=memo if memo else '게스트',  # 메모를 first_name에 임시 저장
-                # 게스트는 비밀번호 없이 생성 (필요시 임시 비밀번호 설정)
-            )
-            
-            # 임시 비밀번호 설정 (시스템에서 자동 생성)
-            temp_password = f"guest{timestamp}"
-            guest_user.set_password(temp_password)
-            guest_user.save()
+            # 게스트 사용자 생성 (번호 발급 + INSERT 1회, 닉네임이 없으면 자동 생성)
+            guest_user, temp_password = create_guest(nickname=nickname, memo=memo)
             
-            api_logger.info(f"게스트 사용자 생성 완료: {guest_user.nickname} (ID: {guest_user.id})")
+            api_logger.info("게스트 사용자 생성 완료: %s (ID: %s)", guest_user.nickname, guest_user.id)
             
             # 생성된 게스트 사용자 정보 반환
             return Response({
@@ -745,7 +777,7 @@ class UserViewSet(viewsets.ViewSet):
             }, status=status.HTTP_201_CREATED)
             
         except Exception as e:
-            api_logger.error(f"게스트 사용자 생성 중 오류: {str(e)}")
+            api_logger.error("게스트 사용자 생성 중 오류: %s", e)
             return Response({
                 'success': False,
                 'error': f'게스트 사용자 생성 중 오류가 발생했습니다: {str(e)}'
@@ -764,29 +796,15 @@ class UserViewSet(viewsets.ViewSet):
                     'error': '로그인이 필요합니다.'
                 }, status=status.HTTP_401_UNAUTHORIZED)
             
-            api_logger.info(f"QR 코드 조회 요청: 사용자 ID={user.id}, 전화번호={user.phone}")
-            
-            # QR 코드가 없으면 생성
-            if not user.qr_code:
-                api_logger.info(f"QR 코드가 없어 생성 중: 사용자 ID={user.id}")
-                qr_code = user.generate_qr_code()
-                if not qr_code:
-                    api_logger.error(f"QR 코드 생성 실패: 사용자 ID={user.id}")
-                    return Response({
-                        'error': 'QR 코드 생성에 실패했습니다.'
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
-            # QR 코드 URL 생성
-            qr_code_url = None
-            if user.qr_code:
-                try:
-                    qr_code_url = request.build_absolute_uri(user.qr_code.url)
-                    api_logger.info(f"QR 코드 URL 생성 성공: {qr_code_url}")
-                except Exception as url_error:
-                    api_logger.error(f"QR 코드 URL 생성 실패: {str(url_error)}")
-                    return Response({
-                        'error': 'QR 코드 URL 생성에 실패했습니다.'
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            api_logger.debug("QR 코드 조회 요청: 사용자 ID=%s", user.id)
+            
+            # QR 코드 URL 생성 (저장된 파일 대신 요청 시 렌더링하는 엔드포인트 사용)
+            qr_code_url = request.build_absolute_uri(
+                reverse('user_qr_code_image', kwargs={'user_id': user.id, 'qr_code_uuid': user.qr_code_uuid, 'fmt': 'png'})
+            )
+            qr_code_svg_url = request.build_absolute_uri(
+                reverse('user_qr_code_image', kwargs={'user_id': user.id, 'qr_code_uuid': user.qr_code_uuid, 'fmt': 'svg'})
+            )
             
             response_data = {
                 'success': True,
@@ -796,15 +814,16 @@ class UserViewSet(viewsets.ViewSet):
                     'nickname': user.nickname,
                     'email': user.email,
                     'qr_code_uuid': str(user.qr_code_uuid),
-                    'qr_code_url': qr_code_url
+                    'qr_code_url': qr_code_url,
+                    'qr_code_svg_url': qr_code_svg_url
                 }
             }
             
-            api_logger.info(f"QR 코드 조회 성공: 사용자 ID={user.id}")
+            api_logger.debug("QR 코드 조회 성공: 사용자 ID=%s", user.id)
             return Response(response_data)
             
         except Exception as e:
-            api_logger.error(f"QR 코드 조회 중 오류: {str(e)}")
+            api_logger.error("QR 코드 조회 중 오류: %s", e)
             return Response({
                 'error': f'QR 코드 조회 중 오류가 발생했습니다: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -835,30 +854,17 @@ class UserViewSet(viewsets.ViewSet):
                     'error': 'QR 코드 데이터가 필요합니다.'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # QR 코드 데이터 파싱 (예: "user_id:13,uuid:abc123...")
+            # QR 코드 데이터 파싱 (형식 확인)
             try:
-                parts = qr_data.split(',')
-                user_id = None
-                uuid_str = None
-                
-                for part in parts:
-                    if part.startswith('user_id:'):
-                        user_id = int(part.split(':')[1])
-                    elif part.startswith('uuid:'):
-                        uuid_str = part.split(':')[1]
-                
-                if not user_id or not uuid_str:
-                    raise ValueError("Invalid QR code format")
-                    
+                user_id, uuid_value = parse_payload(qr_data)
             except (ValueError, IndexError) as e:
                 return Response({
                     'error': '올바르지 않은 QR 코드 형식입니다.'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # 사용자 조회
-            try:
-                user = User.objects.get(id=user_id, qr_code_uuid=uuid_str)
-            except User.DoesNotExist:
+            # 사용자 정보 조회 (캐시 우선) 후 UUID 전체 일치 확인
+            profile = get_scan_profile(user_id)
+            if profile is None or not uuid_matches(profile[0], uuid_value):
                 return Response({
                     'error': '유효하지 않은 QR 코드입니다.'
                 }, status=status.HTTP_404_NOT_FOUND)
@@ -866,19 +872,38 @@ class UserViewSet(viewsets.ViewSet):
             # 사용자 정보 반환
             return Response({
                 'success': True,
-                'user_info': {
-                    'id': user.id,
-                    'phone': user.phone,
-                    'nickname': user.nickname,
-                    'email': user.email,
-                    'role': user.role,
-                    'is_active': user.is_active,
-                    'created_at': user.created_at.isoformat()
-                }
+                'user_info': profile[1]
             })
             
         except Exception as e:
-            api_logger.error(f"QR 코드 스캔 중 오류: {str(e)}")
+            api_logger.error("QR 코드 스캔 중 오류: %s", e)
             return Response({
                 'error': f'QR 코드 스캔 중 오류가 발생했습니다: {str(e)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR) 
\ No newline at end of file
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR) 
+
+
+@require_GET
+def qr_code_image(request, user_id, qr_code_uuid, fmt):
+    """
+    사용자 QR 코드 이미지를 요청 시 렌더링하여 반환합니다.
+    URL(사용자 ID + UUID)만으로 결과가 결정되므로 내용이 바뀌지 않는 리소스로 취급하여 장기 캐시 헤더를 설정합니다.
+    임의의 (ID, UUID) 조합으로 렌더링/캐시 축출을 유발하지 못하도록
+    저장된 qr_code_uuid와 일치하는 경우에만 렌더링하고, 아니면 404를 반환합니다. (스캔 프로필 캐시 사용)
+    """
+    profile = get_scan_profile(int(user_id))
+    if profile is None or not uuid_matches(profile[0], qr_code_uuid):
+        raise Http404
+
+    payload = qr_payload(user_id, qr_code_uuid)
+    etag = qr_etag(payload, fmt)
+    cache_control = 'public, max-age=31536000, immutable'
+
+    # 클라이언트가 이미 같은 이미지를 가지고 있으면 렌더링 없이 304 응답
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(render_qr(payload, fmt), content_type=CONTENT_TYPES[fmt])
+
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    return response
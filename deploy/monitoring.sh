@@ -225,6 +225,31 @@ check_logs() {
     echo ""
 }
 
+# 애플리케이션 메트릭 확인 (/metrics, 모든 워커 합계)
+check_app_metrics() {
+    log_section "애플리케이션 메트릭"
+    
+    local metrics=$(curl -s --max-time 5 http://127.0.0.1:8000/metrics)
+    if [ -z "$metrics" ]; then
+        log_error "❌ /metrics 응답이 없습니다."
+        echo ""
+        return
+    fi
+    
+    echo "📈 HTTP 요청 (상태 코드별 누적):"
+    echo "$metrics" | grep '^asl_http_requests_total' | sed -E 's/.*status="([0-9])[0-9]*".* ([0-9.e+]+)$/\1xx \2/' \
+        | awk '{sum[$1]+=$2} END {for (k in sum) printf "   - %s: %d\n", k, sum[k]}' | sort
+    echo ""
+    
+    echo "🎫 최근 1분간 좌석권 거래:"
+    echo "$metrics" | grep '^asl_seat_ticket_transactions_last_minute' | sed -E 's/.*type="([A-Z]+)".* ([0-9.e+]+)$/   - \1: \2/'
+    echo ""
+    
+    echo "🗃️  캐시 적중률:"
+    echo "$metrics" | grep '^asl_cache_hit_ratio' | awk -F'[="} ]+' '{printf "   - %s: %.1f%%\n", $2, $3 * 100}'
+    echo ""
+}
+
 # SSL 인증서 확인
 check_ssl() {
     log_section "SSL 인증서 상태"
@@ -364,6 +389,7 @@ main() {
     check_services
     check_ports
     check_logs
+    check_app_metrics
     check_ssl
     check_security
     show_summary
@@ -381,6 +407,7 @@ usage() {
     echo "  -s, --summary    요약 정보만 출력"
     echo "  -q, --quick      빠른 상태 확인"
     echo "  -l, --logs       로그 정보만 출력"
+    echo "  -m, --metrics    애플리케이션 메트릭만 출력"
     echo ""
 }
 
@@ -400,6 +427,9 @@ case "${1:-}" in
     -l|--logs)
         check_logs
         ;;
+    -m|--metrics)
+        check_app_metrics
+        ;;
     "")
         main
         ;;
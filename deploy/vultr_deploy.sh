@@ -34,6 +34,8 @@ DB_NAME="asl_db"
 DB_USER="asl_user"
 DB_PASSWORD=$(openssl rand -base64 32)
 ADMIN_EMAIL="${2:-admin@$DOMAIN}"
+QR_CODE_STORE_FILES="${QR_CODE_STORE_FILES:-False}"  # True이면 QR 코드 파일 생성 작업자(qr_worker) 실행
+METRICS_TOKEN="${METRICS_TOKEN:-$(openssl rand -hex 32)}"  # /metrics 조회용 Bearer 토큰 (운영 환경에서 필수)
 
 log_info "배포 설정:"
 log_info "- 프로젝트 디렉토리: $PROJECT_DIR"
@@ -63,6 +65,7 @@ sudo apt install -y \
     libjpeg-dev \
     libssl-dev \
     zlib1g-dev \
+    redis-server \
     supervisor
 
 # 3. Node.js 및 npm 설치 (최신 LTS)
@@ -88,7 +91,7 @@ sudo chown $PROJECT_NAME:www-data $PROJECT_DIR
 
 # 6. 프로젝트 디렉토리로 이동 및 권한 설정
 log_info "프로젝트 파일 복사 준비..."
-sudo mkdir -p $PROJECT_DIR/{backend,frontend-v1,static,media,logs}
+sudo mkdir -p $PROJECT_DIR/{backend,frontend-v1,static,media,logs,metrics}
 sudo chown -R $PROJECT_NAME:www-data $PROJECT_DIR
 
 # 7. 환경 파일 생성
@@ -105,6 +108,22 @@ DB_USER=$DB_USER
 DB_PASSWORD=$DB_PASSWORD
 DB_HOST=localhost
 DB_PORT=5432
+DB_CONN_MAX_AGE=60
+DB_CONN_HEALTH_CHECKS=True
+
+# Channels (실시간 변경 이벤트)
+REDIS_URL=redis://127.0.0.1:6379/0
+
+# Cache (워커 간 모델 버전 공유를 위해 redis 사용)
+CACHE_BACKEND=redis
+CACHE_LOCATION=redis://127.0.0.1:6379/1
+
+# QR 코드 파일 저장 (False이면 요청 시 렌더링만 하므로 qr_worker가 필요 없음)
+QR_CODE_STORE_FILES=$QR_CODE_STORE_FILES
+
+# Metrics (/metrics에서 gunicorn/daphne 워커 값을 합치기 위한 공유 디렉터리, 조회 시 Authorization: Bearer <토큰> 필요)
+METRICS_MULTIPROCESS_DIR=$PROJECT_DIR/metrics
+METRICS_TOKEN=$METRICS_TOKEN
 
 # CORS
 CORS_ALLOWED_ORIGINS=https://$DOMAIN,http://$DOMAIN,http://localhost:3000
@@ -132,6 +151,12 @@ errorlog = "$PROJECT_DIR/logs/gunicorn_error.log"
 accesslog = "$PROJECT_DIR/logs/gunicorn_access.log"
 capture_output = True
 enable_stdio_inheritance = True
+
+def on_starting(server):
+    # 이전 실행의 gunicorn 워커 메트릭 파일만 정리 (/metrics 누적값 초기화, 실행 중인 daphne 파일은 유지)
+    import glob, os
+    for path in glob.glob("$PROJECT_DIR/metrics/gunicorn-*.json") + glob.glob("$PROJECT_DIR/metrics/archive-gunicorn.json"):
+        os.remove(path)
 EOF
 
 # 9. Nginx 설정
@@ -141,6 +166,10 @@ upstream $PROJECT_NAME {
     server 127.0.0.1:8000;
 }
 
+upstream ${PROJECT_NAME}_asgi {
+    server 127.0.0.1:8001;
+}
+
 server {
     listen 80;
     server_name $DOMAIN www.$DOMAIN;
@@ -165,6 +194,27 @@ server {
         proxy_redirect off;
     }
     
+    # 주요 조회 API (ASGI async 뷰)
+    location ~ ^/api/v1/(banners/active|notices|tournaments/all_info|store/user-tickets)/$ {
+        proxy_pass http://${PROJECT_NAME}_asgi;
+        proxy_set_header Host \$host;
+        proxy_set_header X-Real-IP \$remote_addr;
+        proxy_set_header X-Forwarded-For \$proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto \$scheme;
+        proxy_redirect off;
+    }
+    
+    # WebSocket (실시간 변경 이벤트)
+    location /ws/ {
+        proxy_pass http://${PROJECT_NAME}_asgi;
+        proxy_http_version 1.1;
+        proxy_set_header Upgrade \$http_upgrade;
+        proxy_set_header Connection "upgrade";
+        proxy_set_header Host \$host;
+        proxy_set_header X-Forwarded-For \$proxy_add_x_forwarded_for;
+        proxy_read_timeout 3600s;
+    }
+    
     # Admin
     location /admin/ {
         proxy_pass http://$PROJECT_NAME;
@@ -221,8 +271,34 @@ autostart=true
 autorestart=true
 redirect_stderr=true
 stdout_logfile=$PROJECT_DIR/logs/supervisor.log
-environment=PATH="$PROJECT_DIR/backend/.venv/bin"
+environment=PATH="$PROJECT_DIR/backend/.venv/bin",METRICS_PROCESS_GROUP="gunicorn"
+
+[program:${PROJECT_NAME}_asgi]
+command=$PROJECT_DIR/backend/.venv/bin/daphne -b 127.0.0.1 -p 8001 asl_holdem.asgi:application
+directory=$PROJECT_DIR/backend
+user=$PROJECT_NAME
+autostart=true
+autorestart=true
+redirect_stderr=true
+stdout_logfile=$PROJECT_DIR/logs/asgi.log
+environment=PATH="$PROJECT_DIR/backend/.venv/bin",ASYNC_READ_VIEWS="True",METRICS_PROCESS_GROUP="daphne"
+EOF
+
+# QR 코드 파일 생성 작업자 (QR_CODE_STORE_FILES=True일 때만 작업이 등록됨)
+if [ "$QR_CODE_STORE_FILES" = "True" ]; then
+sudo tee -a /etc/supervisor/conf.d/$PROJECT_NAME.conf > /dev/null <<EOF
+
+[program:${PROJECT_NAME}_qr_worker]
+command=$PROJECT_DIR/backend/.venv/bin/python manage.py process_qr_code_jobs --loop
+directory=$PROJECT_DIR/backend
+user=$PROJECT_NAME
+autostart=true
+autorestart=true
+redirect_stderr=true
+stdout_logfile=$PROJECT_DIR/logs/qr_worker.log
+environment=PATH="$PROJECT_DIR/backend/.venv/bin",METRICS_PROCESS_GROUP="qr_worker"
 EOF
+fi
 
 # 11. 로그 디렉토리 권한 설정
 sudo chown -R $PROJECT_NAME:www-data $PROJECT_DIR/logs
@@ -230,8 +306,8 @@ sudo chmod -R 755 $PROJECT_DIR/logs
 
 # 12. 서비스 설정 및 시작
 log_info "서비스 설정 중..."
-sudo systemctl enable postgresql nginx supervisor
-sudo systemctl start postgresql nginx
+sudo systemctl enable postgresql nginx redis-server supervisor
+sudo systemctl start postgresql nginx redis-server
 
 log_info "🎉 서버 설정 완료!"
 log_info ""
@@ -242,6 +318,7 @@ log_info ""
 log_info "📊 생성된 정보:"
 log_info "- 데이터베이스 사용자: $DB_USER"
 log_info "- 데이터베이스 비밀번호: $DB_PASSWORD"
+log_info "- /metrics 토큰: $METRICS_TOKEN"
 log_info "- 프로젝트 디렉토리: $PROJECT_DIR"
 log_info ""
 log_info "💾 데이터베이스 정보를 안전한 곳에 저장하세요!"
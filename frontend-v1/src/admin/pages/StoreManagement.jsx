@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { Row, Col, Card, Form, Button, Spinner, Alert, Table, Nav, Tab, Modal } from 'react-bootstrap';
 import { storeAPI, seatTicketAPI, userAPI, distributionAPI } from '../../utils/api';
+import useChangeEvents from '../../hooks/useChangeEvents';
 
 // third party
 import DataTable from 'react-data-table-component';
@@ -62,10 +63,10 @@ const StoreManagement = () => {
       console.log('매장 관리자 목록 조회 시작...');
       
       // 매장 관리자 권한을 가진 사용자들 조회
-      const response = await userAPI.getAllUsers('STORE_OWNER');
-      console.log('매장 관리자 목록 응답:', response.data);
+      const owners = await userAPI.getAllUsersByRole('STORE_OWNER');
+      console.log('매장 관리자 목록 응답:', owners);
       
-      setStoreOwners(response.data || []);
+      setStoreOwners(owners);
       setLoadingOwners(false);
     } catch (error) {
       console.error('매장 관리자 목록 로드 오류:', error);
@@ -384,9 +385,9 @@ const StoreManagement = () => {
   }, [success]);
 
   // 매장 선수 목록 조회 - 수정된 버전
-  const fetchStoreUsers = async (storeId) => {
-    // 이미 로딩 중이거나 데이터가 있는 경우(빈 배열 포함) 중복 요청 방지
-    if (loadingUsers[storeId] || storeId in storeUsers) {
+  const fetchStoreUsers = async (storeId, force = false) => {
+    // 이미 로딩 중이거나 데이터가 있는 경우(빈 배열 포함) 중복 요청 방지 (force: 변경 이벤트를 받아 다시 조회)
+    if (loadingUsers[storeId] || (!force && storeId in storeUsers)) {
       console.log(`매장 ${storeId} 사용자 목록: 캐시된 데이터 사용 또는 로딩 중.`);
       return;
     }
@@ -430,9 +431,9 @@ const StoreManagement = () => {
   };
 
   // 매장별 토너먼트 목록 조회 - 수정된 버전
-  const fetchStoreTournaments = async (storeId) => {
-    // 이미 로딩 중이거나 데이터가 있는 경우(빈 배열 포함) 중복 요청 방지
-    if (loadingTournaments[storeId] || storeId in storeTournaments) {
+  const fetchStoreTournaments = async (storeId, force = false) => {
+    // 이미 로딩 중이거나 데이터가 있는 경우(빈 배열 포함) 중복 요청 방지 (force: 변경 이벤트를 받아 다시 조회)
+    if (loadingTournaments[storeId] || (!force && storeId in storeTournaments)) {
       console.log(`매장 ${storeId} 토너먼트 목록: 캐시된 데이터 사용 또는 로딩 중.`);
       return;
     }
@@ -467,6 +468,16 @@ const StoreManagement = () => {
     }
   }, []);
 
+  // 펼친 매장의 좌석권/분배 변경을 WebSocket 이벤트로 받아 바뀐 목록만 다시 조회
+  useChangeEvents(expandedRowId ? `stores/${expandedRowId}` : null, (events) => {
+    if (events.some(event => event.event.startsWith('seat_ticket.'))) {
+      fetchStoreUsers(expandedRowId, true);
+    }
+    if (events.some(event => event.event.startsWith('distribution.'))) {
+      fetchStoreTournaments(expandedRowId, true);
+    }
+  });
+
   // 행 확장/축소 핸들러
   const handleRowExpandToggled = (expanded, row) => {
     const newExpandedRowId = expanded ? row.id : null;
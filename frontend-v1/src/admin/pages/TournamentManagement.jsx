@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { Row, Col, Card, Form, Button, Modal, Spinner, Alert, Table } from 'react-bootstrap';
 import { tournamentAPI, dashboardAPI, distributionAPI, seatTicketAPI, storeAPI } from '../../utils/api';
+import useChangeEvents from '../../hooks/useChangeEvents';
 
 // third party
 import DataTable from 'react-data-table-component';
@@ -247,9 +248,9 @@ const TournamentManagement = () => {
   // 🚀 기존 fetchTournaments 함수 제거 (fetchTournamentsOnly로 대체)
 
   // 🚀 토너먼트 상세 정보 가져오기 (성능 최적화)
-  const fetchTournamentDetails = async (tournamentId, isPreload = false) => {
-    // 이미 로딩 중이거나 캐시에 있으면 스킵
-    if (loadingDetails.has(tournamentId) || tournamentDetailsCache.has(tournamentId)) {
+  const fetchTournamentDetails = async (tournamentId, isPreload = false, force = false) => {
+    // 이미 로딩 중이거나 캐시에 있으면 스킵 (force: 변경 이벤트를 받아 캐시를 무시하고 다시 조회)
+    if (loadingDetails.has(tournamentId) || (!force && tournamentDetailsCache.has(tournamentId))) {
       return;
     }
 
@@ -598,15 +599,15 @@ const TournamentManagement = () => {
   };
 
   // 매장별 사용자 조회 함수 수정 (성능 최적화)
-  const fetchStoreUsers = async (tournamentId, storeId, storeName) => {
+  const fetchStoreUsers = async (tournamentId, storeId, storeName, force = false) => {
     // 캐시 키 생성
     const cacheKey = `${tournamentId}-${storeId}`;
     
     // 1. 즉시 피드백: 선택된 매장 상태를 먼저 업데이트 (UI 반응성 개선)
     setSelectedStoreByTournament(prev => new Map([...prev, [tournamentId, { storeId, storeName }]]));
     
-    // 2. 캐시 확인: 이미 불러온 데이터가 있으면 즉시 반환
-    if (storeUsersCache.has(cacheKey)) {
+    // 2. 캐시 확인: 이미 불러온 데이터가 있으면 즉시 반환 (force: 캐시를 무시하고 다시 조회)
+    if (!force && storeUsersCache.has(cacheKey)) {
       console.log(`🎯 캐시에서 사용자 데이터 즉시 반환: ${storeName} (캐시키: ${cacheKey})`);
       const cachedUsers = storeUsersCache.get(cacheKey);
       
@@ -759,9 +760,28 @@ const TournamentManagement = () => {
     if (forceRefresh) {
       clearStoreUsersCacheByStore(tournamentId, storeId);
     }
-    fetchStoreUsers(tournamentId, storeId, storeName);
+    fetchStoreUsers(tournamentId, storeId, storeName, forceRefresh);
   };
 
+  // 🆕 펼친 토너먼트의 좌석권/분배/참가자 변경을 WebSocket 이벤트로 받아 해당 토너먼트만 다시 조회
+  useChangeEvents(expandedRowId ? `tournaments/${expandedRowId}` : null, (events) => {
+    const tournamentId = expandedRowId;
+    const changedStores = new Set(events.map(event => event.store).filter(Boolean));
+
+    // 변경된 매장의 사용자 캐시 제거 (다음 매장 클릭 시 다시 조회)
+    setStoreUsersCache(prev => new Map([...prev].filter(([key]) => {
+      const [cachedTournamentId, cachedStoreId] = key.split('-').map(Number);
+      return cachedTournamentId !== tournamentId || !changedStores.has(cachedStoreId);
+    })));
+
+    fetchTournamentDetails(tournamentId, true, true);
+
+    const selectedStore = selectedStoreByTournament.get(tournamentId);
+    if (selectedStore && changedStores.has(selectedStore.storeId)) {
+      fetchStoreUsers(tournamentId, selectedStore.storeId, selectedStore.storeName, true);
+    }
+  });
+
   // SEAT권 수정 모달 열기
   const handleOpenSeatEditModal = (tournamentId, storeData) => {
     setSelectedStoreForSeatEdit({
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useRef, useMemo, useCallback } from 'react';
 import { Row, Col, Card, Form, Button, Spinner, Alert, Modal } from 'react-bootstrap';
-import API from '../../utils/api';
+import API, { getNextCursor } from '../../utils/api';
 import { getToken } from '../../utils/auth';
 import ErrorBoundary from '../components/ErrorBoundary';
 
@@ -11,6 +11,9 @@ const UserInfoPage = () => {
   const [originalUsers, setOriginalUsers] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  // 사용자 목록 다음 페이지 커서 (null이면 마지막 페이지)
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [filters, setFilters] = useState({
     roleFilters: {
       USER: false,
@@ -58,10 +61,14 @@ const UserInfoPage = () => {
   // API 호출 중복 방지를 위한 ref
   const hasFetchedData = useRef(false);
 
-  // 사용자 목록 조회
-  const fetchUsers = async () => {
+  // 사용자 목록 조회 (cursor가 있으면 다음 페이지를 이어서 조회)
+  const fetchUsers = async (cursor = null) => {
     try {
-      setLoading(true);
+      if (cursor) {
+        setLoadingMore(true);
+      } else {
+        setLoading(true);
+      }
       setError(null);
       console.log('사용자 목록 조회 시작...');
       
@@ -75,16 +82,18 @@ const UserInfoPage = () => {
       const response = await API.get('/accounts/users/', {
         headers: {
           'Authorization': `Bearer ${token}`
-        }
+        },
+        params: cursor ? { cursor } : {}
       });
 
       console.log('사용자 목록 응답:', response.data);
 
-      if (response.data) {
+      const pageUsers = response.data && response.data.results;
+      if (pageUsers) {
         // 첫 번째 사용자 데이터의 구조를 확인하여 전화번호 필드명 파악
-        if (response.data.length > 0) {
-          console.log('첫 번째 사용자 데이터 구조:', response.data[0]);
-          const firstUser = response.data[0];
+        if (pageUsers.length > 0) {
+          console.log('첫 번째 사용자 데이터 구조:', pageUsers[0]);
+          const firstUser = pageUsers[0];
           console.log('전화번호 필드 확인:', {
             phone_number: firstUser.phone_number,
             phone: firstUser.phone,
@@ -94,18 +103,18 @@ const UserInfoPage = () => {
 
         // 역할 통계 디버깅
         const roleStats = {};
-        response.data.forEach(user => {
+        pageUsers.forEach(user => {
           const role = user.role || 'undefined';
           roleStats[role] = (roleStats[role] || 0) + 1;
         });
         console.log('👥 사용자 역할 통계:', roleStats);
         
         // 매장 관리자 찾기
-        const storeManagers = response.data.filter(user => user.role === 'STORE_MANAGER');
+        const storeManagers = pageUsers.filter(user => user.role === 'STORE_MANAGER');
         console.log('🏪 매장 관리자 목록:', storeManagers);
         
         // 다양한 매장 관리자 role 값 확인
-        const possibleStoreManagerRoles = response.data.filter(user => 
+        const possibleStoreManagerRoles = pageUsers.filter(user => 
           user.role && (
             user.role.includes('STORE') || 
             user.role.includes('MANAGER') || 
@@ -115,10 +124,15 @@ const UserInfoPage = () => {
         );
         console.log('🔍 매장 관리자 가능성 있는 사용자:', possibleStoreManagerRoles);
         
-        setOriginalUsers(response.data);
-        setUsers(response.data);
+        if (cursor) {
+          setOriginalUsers(prev => [...prev, ...pageUsers]);
+        } else {
+          setOriginalUsers(pageUsers);
+          setUsers(pageUsers);
+        }
+        setNextCursor(getNextCursor(response.data));
         setError(null);
-        console.log(`✅ 사용자 ${response.data.length}명 로드 완료`);
+        console.log(`✅ 사용자 ${pageUsers.length}명 로드 완료`);
       } else {
         setError('사용자 데이터가 없습니다.');
       }
@@ -137,6 +151,7 @@ const UserInfoPage = () => {
       }
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -1028,6 +1043,24 @@ const UserInfoPage = () => {
                 responsive
               />
             )}
+            {!loading && nextCursor && (
+              <div className="text-center mt-3">
+                <Button
+                  variant="outline-primary"
+                  onClick={() => fetchUsers(nextCursor)}
+                  disabled={loadingMore}
+                >
+                  {loadingMore ? (
+                    <>
+                      <Spinner animation="border" size="sm" className="me-2" />
+                      불러오는 중...
+                    </>
+                  ) : (
+                    '사용자 더 보기'
+                  )}
+                </Button>
+              </div>
+            )}
           </Card.Body>
         </Card>
 
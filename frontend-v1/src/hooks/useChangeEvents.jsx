@@ -0,0 +1,76 @@
+import { useEffect, useRef } from 'react';
+
+// ==============================|| CHANGE EVENTS HOOK ||============================== //
+// 매장(stores/<id>) 또는 토너먼트(tournaments/<id>)의 좌석권/분배/참가자 변경 이벤트를 WebSocket으로 받습니다.
+// (백엔드 seats.consumers.ChangeEventConsumer)
+// 짧은 시간에 몰린 이벤트는 묶어서 onChange(events)를 한 번만 호출하므로 화면은 필요한 목록만 다시 불러오면 됩니다.
+
+// 구독 권한이 없을 때 서버가 사용하는 종료 코드 (다시 연결하지 않음)
+const CLOSE_FORBIDDEN = 4403;
+const RECONNECT_DELAY = 3000;
+const BATCH_DELAY = 300;
+
+const changeEventsUrl = (path) => {
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+  const token = localStorage.getItem('asl_holdem_access_token') || '';
+  return `${protocol}//${window.location.host}/ws/${path}/?token=${encodeURIComponent(token)}`;
+};
+
+const useChangeEvents = (path, onChange) => {
+  // 연결을 다시 맺지 않고 항상 최신 핸들러를 호출
+  const onChangeRef = useRef(onChange);
+  onChangeRef.current = onChange;
+
+  useEffect(() => {
+    if (!path || typeof WebSocket === 'undefined') {
+      return undefined;
+    }
+
+    let socket = null;
+    let reconnectTimer = null;
+    let batchTimer = null;
+    let pending = [];
+    let stopped = false;
+
+    const flush = () => {
+      batchTimer = null;
+      const events = pending;
+      pending = [];
+      onChangeRef.current?.(events);
+    };
+
+    const connect = () => {
+      socket = new WebSocket(changeEventsUrl(path));
+
+      socket.onmessage = (message) => {
+        try {
+          pending.push(JSON.parse(message.data));
+        } catch (error) {
+          console.warn('변경 이벤트 해석 실패:', error);
+          return;
+        }
+        if (!batchTimer) {
+          batchTimer = setTimeout(flush, BATCH_DELAY);
+        }
+      };
+
+      socket.onclose = (event) => {
+        if (stopped || event.code === CLOSE_FORBIDDEN) {
+          return;
+        }
+        reconnectTimer = setTimeout(connect, RECONNECT_DELAY);
+      };
+    };
+
+    connect();
+
+    return () => {
+      stopped = true;
+      clearTimeout(reconnectTimer);
+      clearTimeout(batchTimer);
+      socket?.close();
+    };
+  }, [path]);
+};
+
+export default useChangeEvents;
@@ -4,6 +4,7 @@ import { Card, Button, Form, Spinner, Alert, Table, Container, Row, Col, Badge }
 import axios from 'axios';
 import MobileHeader from '../../components/MobileHeader';
 import QRScanner from '../../components/QRScanner';
+import useChangeEvents from '../../../hooks/useChangeEvents';
 
 /**
  * 로컬 axios 인스턴스 생성 및 인터셉터 설정
@@ -308,6 +309,16 @@ const PlayerRegistration = () => {
     }
   };
 
+  /**
+   * 조회한 회원의 SEAT권/참가 정보 실시간 갱신
+   * 선택한 토너먼트의 변경 이벤트 중 해당 회원의 이벤트를 받으면 SEAT권 정보를 다시 조회합니다.
+   */
+  useChangeEvents(foundUser && selectedTournament ? `tournaments/${selectedTournament}` : null, (events) => {
+    if (foundUser?.id && events.some(event => event.user === foundUser.id)) {
+      checkTournamentParticipation(foundUser.phone, selectedTournament);
+    }
+  });
+
   /**
    * 휴대폰 번호로 사용자 검색
    * @param {string} phone - 검색할 휴대폰 번호
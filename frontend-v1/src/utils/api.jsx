@@ -392,17 +392,37 @@ export const seatTicketAPI = {
   }
 };
 
+// 커서 페이지네이션 응답의 next URL에서 다음 cursor 값을 꺼냄 (마지막 페이지면 null)
+export const getNextCursor = (data) => {
+  if (!data || !data.next) return null;
+  return new URL(data.next, window.location.origin).searchParams.get('cursor');
+};
+
 // 사용자 정보 관련 API
 export const userAPI = {
   // 현재 사용자 정보 조회
   getCurrentUser: () => API.get('/accounts/me/'),
   
-  // 모든 사용자 목록 조회 (role 필터링 가능)
-  getAllUsers: (role = null) => {
-    const params = role ? { role } : {};
+  // 사용자 목록 조회 (role 필터링 가능, 커서 페이지 단위: { next, previous, results })
+  getAllUsers: (role = null, cursor = null) => {
+    const params = {};
+    if (role) params.role = role;
+    if (cursor) params.cursor = cursor;
     return API.get('/accounts/users/', { params });
   },
   
+  // 역할별 사용자 전체 조회 (매장 관리자처럼 적은 목록용, 다음 페이지가 없을 때까지 조회)
+  getAllUsersByRole: async (role) => {
+    const users = [];
+    let cursor = null;
+    do {
+      const response = await userAPI.getAllUsers(role, cursor);
+      users.push(...response.data.results);
+      cursor = getNextCursor(response.data);
+    } while (cursor);
+    return users;
+  },
+  
   // 전화번호 또는 사용자 ID로 사용자 조회 (JSON 방식)
   getUserByPhoneOrId: (data) => {
     return API.post('/accounts/users/get_user/', data);
@@ -30,6 +30,12 @@ export default defineConfig(({ mode }) => {
           ws: true,
           // 필요한 경우 경로 재작성
           // rewrite: (path) => path.replace(/^\/api/, '')
+        },
+        // 좌석권/분배 변경 이벤트 WebSocket (hooks/useChangeEvents)
+        '/ws': {
+          target: process.env.VITE_API_URL || 'http://127.0.0.1:8000',
+          changeOrigin: true,
+          ws: true
         }
       }
     },